@@ -6,10 +6,13 @@ Settings are stored in PocketBase and cached in memory for performance.
 """
 
 import os
-from typing import Any, Dict, Optional
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
 from pocketbase import PocketBase
 from pocketbase.client import ClientResponseError
 from app.models.settings import Settings
+from app.pocketbase_client import key_filter, list_change_marker, parse_setting_value
 
 
 class SettingsManager:
@@ -17,26 +20,61 @@ class SettingsManager:
     Manages application settings stored in PocketBase.
 
     Provides a high-level interface for reading and updating settings with:
-    - Automatic caching for performance
+    - Automatic caching for performance (TTL-bounded, single-flight reload)
     - Type conversion (string → number/boolean)
     - Integration with Pydantic Settings model
     - Cache invalidation on updates
     """
 
-    def __init__(self, pb_client: PocketBase):
+    # Seconds a loaded Settings object is served before being refetched
+    DEFAULT_CACHE_TTL_SECONDS = 60.0
+
+    def __init__(self, pb_client: PocketBase, cache_ttl: float = DEFAULT_CACHE_TTL_SECONDS):
         """
         Initialize SettingsManager.
 
         Args:
             pb_client: Authenticated PocketBase client instance
+            cache_ttl: Seconds to serve cached settings before reloading
         """
         self.pb = pb_client
         self._cache: Optional[Settings] = None
+        self._cache_ttl = cache_ttl
+        self._cache_expiry = 0.0
+        # Ensures only one caller rebuilds settings when the cache is stale
+        self._reload_lock = threading.Lock()
+        # Maps setting key -> (record id, type); filled by get_all() / _prefetch_records()
+        self._records: Optional[Dict[str, Tuple[str, str]]] = None
+        # (record count, latest raw "updated" string) of the collection the
+        # cache was built from
+        self._cache_marker: Optional[Tuple[int, Optional[str]]] = None
+
+        # Resolve wrapper-vs-raw client dispatch once instead of per call
+        if hasattr(pb_client, 'get_full_list'):
+            # It's a PocketBaseClient wrapper
+            self._get_full_list = lambda: pb_client.get_full_list("settings")
+            self._get_first = lambda filter: pb_client.get_first_list_item("settings", filter)
+            self._update = lambda record_id, data: pb_client.update("settings", record_id, data)
+            self._get_marker = lambda: pb_client.count_and_last_updated("settings")
+        else:
+            # It's a raw PocketBase SDK client
+            collection = pb_client.collection("settings")
+            self._get_full_list = collection.get_full_list
+            self._get_first = collection.get_first_list_item
+            self._update = collection.update
+            self._get_marker = lambda: list_change_marker(pb_client, "settings")
 
     def get_all(self, force_reload: bool = False) -> Settings:
         """
         Fetch all settings from PocketBase and return as Settings object.
 
+        Cached settings are reused until the TTL expires or an update
+        invalidates them. Once the TTL expires, a one-item request for the
+        collection's record count and latest "updated" timestamp decides whether
+        anything changed; if not, the cached object is kept for another TTL.
+        Concurrent callers hitting a stale cache wait for a single reload
+        instead of each refetching.
+
         Args:
             force_reload: If True, bypass cache and reload from database
 
@@ -48,50 +86,61 @@ class SettingsManager:
             ValueError: If settings cannot be parsed/validated
         """
         # Return cached settings if available
-        if self._cache and not force_reload:
+        if self._cache is not None and not force_reload and time.monotonic() < self._cache_expiry:
             return self._cache
 
-        # Fetch all settings from PocketBase
-        try:
-            # Check if pb is a wrapper with get_full_list method or raw client
-            if hasattr(self.pb, 'get_full_list'):
-                # It's a PocketBaseClient wrapper
-                records = self.pb.get_full_list("settings")
-            else:
-                # It's a raw PocketBase SDK client
-                records = self.pb.collection("settings").get_full_list()
-        except ClientResponseError as e:
-            if e.status == 404:
-                raise ValueError(
-                    "Settings collection not found. Please run migrations and seed data first."
-                )
-            raise
-
-        # Convert records to flat dictionary
-        settings_dict = {}
-        for record in records:
-            # Access record fields using getattr for compatibility
-            key = getattr(record, 'key', None)
-            value = getattr(record, 'value', None)
-            record_type = getattr(record, 'type', 'string')
-
-            if key is None or value is None:
-                continue  # Skip invalid records
-
-            parsed_value = self._parse_value(value, record_type)
-            settings_dict[key] = parsed_value
-
-        # Validate we have all required settings (31 total: 10+1+2+3+5+1+7+2)
-        expected_count = 31
-        if len(settings_dict) != expected_count:
-            raise ValueError(
-                f"Expected {expected_count} settings, but found {len(settings_dict)}. "
-                f"Please run seed_settings.py to populate default values."
-            )
-
-        # Convert to nested Settings model
-        self._cache = Settings.from_flat_dict(settings_dict)
-        return self._cache
+        with self._reload_lock:
+            # Another caller may have reloaded while we waited for the lock
+            if (
+                self._cache is not None
+                and not force_reload
+                and time.monotonic() < self._cache_expiry
+            ):
+                return self._cache
+
+            # TTL expired: skip the full reload if the collection is unchanged
+            if self._cache is not None and not force_reload and self._cache_marker is not None:
+                if self._get_marker() == self._cache_marker:
+                    self._cache_expiry = time.monotonic() + self._cache_ttl
+                    return self._cache
+
+            # Fetch all settings from PocketBase. The change marker is read
+            # first, so an edit landing between the two requests makes the
+            # next marker check reload again instead of going unnoticed.
+            try:
+                marker = self._get_marker()
+                records = self._get_full_list()
+            except ClientResponseError as e:
+                if e.status == 404:
+                    raise ValueError(
+                        "Settings collection not found. Please run migrations and seed data first."
+                    )
+                raise
+
+            # Convert records to flat dictionary
+            settings_dict = {}
+            record_index = {}
+            for record in records:
+                # Read fields straight from the instance dict (SDK records and mocks alike)
+                fields = record.__dict__
+                key = fields.get('key')
+                value = fields.get('value')
+                record_type = fields.get('type', 'string')
+
+                if key is None or value is None:
+                    continue  # Skip invalid records
+
+                parsed_value = self._parse_value(value, record_type)
+                settings_dict[key] = parsed_value
+                record_index[key] = (fields.get('id'), record_type)
+
+            self._records = record_index
+
+            # Convert to nested Settings model, requiring all 31 settings
+            self._cache = Settings.from_flat_dict(settings_dict, require_all=True)
+            self._cache_expiry = time.monotonic() + self._cache_ttl
+            self._cache_marker = marker if marker[1] else None
+            return self._cache
 
     def get(self, key: str) -> Any:
         """
@@ -107,12 +156,7 @@ class SettingsManager:
             ClientResponseError: If setting not found or request fails
         """
         try:
-            if hasattr(self.pb, 'get_first_list_item'):
-                # It's a PocketBaseClient wrapper
-                record = self.pb.get_first_list_item("settings", f'key="{key}"')
-            else:
-                # It's a raw PocketBase SDK client
-                record = self.pb.collection("settings").get_first_list_item(f'key="{key}"')
+            record = self._get_first(key_filter(key))
 
             value = getattr(record, 'value', None)
             record_type = getattr(record, 'type', 'string')
@@ -135,23 +179,13 @@ class SettingsManager:
         """
         try:
             # Get existing record
-            if hasattr(self.pb, 'get_first_list_item'):
-                # It's a PocketBaseClient wrapper
-                record = self.pb.get_first_list_item("settings", f'key="{key}"')
-            else:
-                # It's a raw PocketBase SDK client
-                record = self.pb.collection("settings").get_first_list_item(f'key="{key}"')
+            record = self._get_first(key_filter(key))
 
             # Convert value to string for storage
             str_value = self._value_to_string(value)
 
             # Update in PocketBase
-            if hasattr(self.pb, 'update'):
-                # It's a PocketBaseClient wrapper
-                self.pb.update("settings", record.id, {"value": str_value})
-            else:
-                # It's a raw PocketBase SDK client
-                self.pb.collection("settings").update(record.id, {"value": str_value})
+            self._update(record.id, {"value": str_value})
 
             # Invalidate cache
             self._cache = None
@@ -165,14 +199,50 @@ class SettingsManager:
         """
         Update multiple settings at once.
 
+        Record IDs are resolved from a single full-list fetch instead of one
+        lookup per key, and the cache is invalidated once after all updates.
+
         Args:
             updates: Dictionary of key-value pairs to update
 
         Raises:
+            KeyError: If any key does not exist
             ClientResponseError: If any update fails
         """
-        for key, value in updates.items():
-            self.update(key, value)
+        if not updates:
+            return
+
+        records = self._prefetch_records()
+
+        missing = [key for key in updates if key not in records]
+        if missing:
+            raise KeyError(f"Setting(s) not found: {', '.join(missing)}")
+
+        try:
+            for key, value in updates.items():
+                record_id, _ = records[key]
+                self._update(record_id, {"value": self._value_to_string(value)})
+        finally:
+            # Invalidate cache once, even if an update failed part-way
+            self._cache = None
+
+    def _prefetch_records(self) -> Dict[str, Tuple[str, str]]:
+        """
+        Get the setting key -> (record id, type) index, fetching it if needed.
+
+        Returns:
+            Dictionary mapping setting keys to (record id, type) tuples
+        """
+        if self._records is not None:
+            return self._records
+
+        records = self._get_full_list()
+        self._records = {
+            record.key: (record.id, getattr(record, 'type', 'string'))
+            for record in records
+            if getattr(record, 'key', None) is not None
+        }
+        return self._records
 
     def reload(self) -> Settings:
         """
@@ -186,6 +256,9 @@ class SettingsManager:
     def clear_cache(self) -> None:
         """Clear the settings cache"""
         self._cache = None
+        self._cache_expiry = 0.0
+        self._cache_marker = None
+        self._records = None
 
     @staticmethod
     def _parse_value(value: str, type_str: str) -> Any:
@@ -199,16 +272,7 @@ class SettingsManager:
         Returns:
             Parsed value in appropriate Python type
         """
-        if type_str == "number":
-            # Try int first, fall back to float
-            try:
-                return int(value)
-            except ValueError:
-                return float(value)
-        elif type_str == "boolean":
-            return value.lower() in ("true", "1", "yes", "on")
-        else:  # string
-            return value
+        return parse_setting_value(value, type_str)
 
     @staticmethod
     def _value_to_string(value: Any) -> str:
@@ -222,7 +286,7 @@ class SettingsManager:
             String representation
         """
         if isinstance(value, bool):
-            return "true" if value else "false"
+            return ("false", "true")[value]
         return str(value)
 
 
@@ -264,6 +328,9 @@ class Config:
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
         self.log_file = os.getenv("LOG_FILE", "logs/app.log")
 
+        # Exports
+        self.export_cache_dir = os.getenv("EXPORT_CACHE_DIR", "cache/exports")
+
         # Initialize PocketBase client (will be set up by application)
         self._pb_client: Optional[PocketBase] = None
         self._settings_manager: Optional[SettingsManager] = None
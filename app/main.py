@@ -7,28 +7,158 @@ Main FastAPI application providing REST API endpoints for:
 - Timesheet data access
 - Monthly export (HTML, CSV, Excel)
 - OAuth authentication flows
+
+Handlers that call the synchronous PocketBase SDK are plain ``def`` functions so
+FastAPI runs them in its threadpool instead of blocking the event loop.
 """
 
 import asyncio
+import hashlib
 import logging
-from datetime import datetime
-from typing import Optional
-
-from fastapi import FastAPI, HTTPException, Query, Depends, Response, Cookie
-from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, RedirectResponse
+import re
+import threading
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+import orjson
+
+from fastapi import FastAPI, HTTPException, Query, Depends, Request, Response, Cookie
+from fastapi.responses import (
+    HTMLResponse,
+    FileResponse,
+    ORJSONResponse,
+    RedirectResponse,
+    StreamingResponse,
+)
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from pocketbase.client import ClientResponseError
 
 from app.pocketbase_client import PocketBaseClient
 from app.config import Config
+from app.services.fetchers.calendar_fetcher import clear_credentials_cache
 from app.services.scheduler import SchedulerService
-from app.services.exporters import MonthlyExporter
+from app.utils.auth import auth_service, get_current_user
+from app.utils.html_templates import render_collection_html
 from app.utils.logging_config import configure_logging_from_env
+from app.utils.oauth import build_google_auth_url
+from app.utils.timesheet_template import render_monthly_timesheet
+
+if TYPE_CHECKING:
+    # Imported on first export request; see get_exporter()
+    from app.services.exporters import MonthlyExporter
 
 # Configure logging from environment
 configure_logging_from_env()
 logger = logging.getLogger(__name__)
 
+# Record fields returned by the timesheet endpoints (system fields + collection schema)
+TIME_BLOCK_FIELDS = (
+    "id", "created", "updated",
+    "week_start", "block_start", "block_end",
+    "source", "description", "duration_hours", "metadata",
+)
+RAW_EVENT_FIELDS = (
+    "id", "created", "updated",
+    "source", "source_id", "timestamp",
+    "duration_minutes", "description", "metadata",
+)
+WEEK_SUMMARY_FIELDS = (
+    "id", "created", "updated",
+    "week_start", "total_hours", "metadata",
+)
+
+# Response media types for /export/month formats
+EXPORT_MEDIA_TYPES = {
+    "html": "text/html; charset=utf-8",
+    "csv": "text/csv; charset=utf-8",
+    "excel": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+# /dashboard/{year}/{month} responses keyed by (year, month) -> (change marker, payload),
+# least recently used first; at most MONTH_DASHBOARD_CACHE_MONTHS months are kept
+_month_dashboard_cache: Dict[Tuple[int, int], Tuple[Tuple[int, Optional[str]], Dict[str, Any]]] = {}
+_month_dashboard_cache_lock = threading.Lock()
+MONTH_DASHBOARD_CACHE_MONTHS = 24
+
+# Seconds unauthenticated read-only responses are served from the in-process cache
+DASHBOARD_CACHE_SECONDS = 30
+COLLECTION_CACHE_SECONDS = 60
+
+# Cached responses keyed by (route name, *variant) -> (expiry, payload)
+_response_cache: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+
+# Static HTML pages in the project root, read once: file name -> (content, ETag)
+_static_pages: Dict[str, Tuple[bytes, str]] = {}
+STATIC_PAGE_CACHE_CONTROL = "public, max-age=3600"
+
+# Plain YYYY-MM-DD date path parameter
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Page size used when streaming month timesheets as JSON
+MONTH_STREAM_PAGE_SIZE = 200
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize services on startup and clean them up on shutdown."""
+    logger.info("Starting Mission42 Timesheet API...")
+
+    # Initialize PocketBase client
+    pb_client = PocketBaseClient()
+
+    # Initialize configuration (no I/O)
+    config = Config()
+    config.setup_pocketbase(pb_client)
+
+    # Health check and initial settings load are independent round trips
+    pocketbase_healthy, settings_result = await asyncio.gather(
+        asyncio.to_thread(pb_client.health_check),
+        asyncio.to_thread(lambda: config.settings),
+        return_exceptions=True,
+    )
+
+    # Check PocketBase connection
+    if pocketbase_healthy is not True:
+        logger.error("PocketBase is not accessible!")
+        raise RuntimeError("PocketBase connection failed")
+
+    logger.info("✓ Connected to PocketBase")
+
+    if isinstance(settings_result, Exception):
+        logger.warning(f"Failed to load settings: {settings_result}. Using defaults.")
+    else:
+        logger.info("✓ Configuration loaded")
+
+    # Initialize scheduler (reads the settings loaded above); scheduled jobs
+    # write time blocks, so cached reads are dropped after each run
+    scheduler = SchedulerService(
+        pb_client, config, on_job_complete=_invalidate_cached_reads
+    )
+    scheduler.start()
+    logger.info("✓ Background scheduler started")
+
+    # Expose services to route handlers via dependencies
+    app.state.pb_client = pb_client
+    app.state.config = config
+    app.state.scheduler = scheduler
+
+    logger.info("🚀 Mission42 Timesheet API ready!")
+
+    yield
+
+    logger.info("Shutting down Mission42 Timesheet API...")
+
+    scheduler.stop()
+    logger.info("✓ Scheduler stopped")
+
+    logger.info("👋 Goodbye!")
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Mission42 Timesheet API",
@@ -36,6 +166,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -47,60 +179,74 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global instances
-pb_client: Optional[PocketBaseClient] = None
-config: Optional[Config] = None
-scheduler: Optional[SchedulerService] = None
-exporter: Optional[MonthlyExporter] = None
 
+# ============================================================================
+# Service Dependencies
+# ============================================================================
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize services on application startup."""
-    global pb_client, config, scheduler, exporter
 
-    logger.info("Starting Mission42 Timesheet API...")
+def _require_state(request: Request, name: str, detail: str) -> Any:
+    """Return a service from app.state, or 503 if startup has not set it."""
+    service = getattr(request.app.state, name, None)
+    if service is None:
+        raise HTTPException(status_code=503, detail=detail)
+    return service
 
-    # Initialize PocketBase client
-    pb_client = PocketBaseClient()
 
-    # Check PocketBase connection
-    if not pb_client.health_check():
-        logger.error("PocketBase is not accessible!")
-        raise RuntimeError("PocketBase connection failed")
+def get_pb_client(request: Request) -> PocketBaseClient:
+    """Dependency: PocketBase client created at startup."""
+    return _require_state(request, "pb_client", "PocketBase client not initialized")
 
-    logger.info("✓ Connected to PocketBase")
 
-    # Initialize configuration
-    config = Config()
-    try:
-        config.setup_pocketbase(pb_client)
-        logger.info("✓ Configuration loaded")
-    except Exception as e:
-        logger.warning(f"Failed to load settings: {e}. Using defaults.")
+def get_scheduler(request: Request) -> SchedulerService:
+    """Dependency: background scheduler created at startup."""
+    return _require_state(request, "scheduler", "Scheduler not initialized")
 
-    # Initialize scheduler
-    scheduler = SchedulerService(pb_client, config)
-    scheduler.start()
-    logger.info("✓ Background scheduler started")
 
-    # Initialize exporter
-    exporter = MonthlyExporter(pb_client, config)
-    logger.info("✓ Monthly exporter initialized")
+def get_exporter(request: Request) -> "MonthlyExporter":
+    """Dependency: monthly exporter, created on the first export request."""
+    exporter = getattr(request.app.state, "exporter", None)
+    if exporter is None:
+        # Deferred so workers that never serve /export/* skip loading the exporter
+        from app.services.exporters import MonthlyExporter
 
-    logger.info("🚀 Mission42 Timesheet API ready!")
+        pb_client = get_pb_client(request)
+        config = _require_state(request, "config", "Configuration not initialized")
+        exporter = request.app.state.exporter = MonthlyExporter(pb_client, config)
+    return exporter
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on application shutdown."""
-    logger.info("Shutting down Mission42 Timesheet API...")
+def get_optional_config(request: Request) -> Optional[Config]:
+    """Dependency: application config, or None if not initialized."""
+    return getattr(request.app.state, "config", None)
 
-    if scheduler:
-        scheduler.stop()
-        logger.info("✓ Scheduler stopped")
 
-    logger.info("👋 Goodbye!")
+def get_optional_scheduler(request: Request) -> Optional[SchedulerService]:
+    """Dependency: background scheduler, or None if not initialized."""
+    return getattr(request.app.state, "scheduler", None)
+
+
+# ============================================================================
+# Response Cache
+# ============================================================================
+
+
+def _cache_get(key: Tuple[str, ...]) -> Any:
+    """Return a cached payload, or None if missing or expired."""
+    entry = _response_cache.get(key)
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[1]
+    return None
+
+
+def _cache_put(key: Tuple[str, ...], payload: Any, ttl: float) -> None:
+    """Cache a payload for ttl seconds."""
+    _response_cache[key] = (time.monotonic() + ttl, payload)
+
+
+def _invalidate_cached_reads() -> None:
+    """Drop cached dashboard and collection responses after data was written."""
+    _response_cache.clear()
 
 
 # ============================================================================
@@ -140,7 +286,10 @@ async def root():
 
 
 @app.get("/health", tags=["Health"])
-async def health_check():
+def health_check(
+    pb_client: PocketBaseClient = Depends(get_pb_client),
+    scheduler: Optional[SchedulerService] = Depends(get_optional_scheduler),
+):
     """
     Health check endpoint.
 
@@ -148,9 +297,6 @@ async def health_check():
     - PocketBase connection
     - Scheduler status
     """
-    if not pb_client:
-        raise HTTPException(status_code=503, detail="PocketBase client not initialized")
-
     pocketbase_healthy = pb_client.health_check()
     scheduler_running = scheduler._running if scheduler else False
 
@@ -167,11 +313,8 @@ async def health_check():
 
 
 @app.get("/status/scheduler", tags=["Status"])
-async def scheduler_status():
+async def scheduler_status(scheduler: SchedulerService = Depends(get_scheduler)):
     """Get background scheduler status and job information."""
-    if not scheduler:
-        raise HTTPException(status_code=503, detail="Scheduler not initialized")
-
     return scheduler.get_job_status()
 
 
@@ -181,7 +324,7 @@ async def scheduler_status():
 
 
 @app.post("/process/manual", tags=["Processing"])
-async def manual_process():
+async def manual_process(scheduler: SchedulerService = Depends(get_scheduler)):
     """
     Manually trigger data fetching and processing for current week.
 
@@ -193,13 +336,11 @@ async def manual_process():
     Returns:
         Processing results with statistics
     """
-    if not scheduler:
-        raise HTTPException(status_code=503, detail="Scheduler not initialized")
-
     logger.info("Manual processing triggered via API")
 
     try:
         result = await scheduler.manual_fetch_and_process()
+        _invalidate_cached_reads()
         return result
     except Exception as e:
         logger.error(f"Manual processing failed: {str(e)}", exc_info=True)
@@ -207,7 +348,9 @@ async def manual_process():
 
 
 @app.post("/process/week/{date}", tags=["Processing"])
-async def process_specific_week(date: str):
+async def process_specific_week(
+    date: str, scheduler: SchedulerService = Depends(get_scheduler)
+):
     """
     Process a specific week.
 
@@ -217,9 +360,6 @@ async def process_specific_week(date: str):
     Returns:
         Processing results
     """
-    if not scheduler:
-        raise HTTPException(status_code=503, detail="Scheduler not initialized")
-
     try:
         # Parse date
         reference_date = datetime.fromisoformat(date)
@@ -233,6 +373,7 @@ async def process_specific_week(date: str):
 
     try:
         result = await scheduler.manual_process_week(reference_date)
+        _invalidate_cached_reads()
         return result
     except Exception as e:
         logger.error(f"Week processing failed: {str(e)}", exc_info=True)
@@ -245,10 +386,11 @@ async def process_specific_week(date: str):
 
 
 @app.get("/timesheet/current", tags=["Timesheet"])
-async def get_current_timesheet(auth_token: Optional[str] = Cookie(None)):
+def get_current_timesheet(
+    auth_token: Optional[str] = Cookie(None),
+    pb_client: PocketBaseClient = Depends(get_pb_client),
+):
     """Get timesheet for current month. Requires authentication."""
-    from app.utils.auth import get_current_user
-
     # Check authentication
     try:
         user = get_current_user(auth_token)
@@ -257,15 +399,24 @@ async def get_current_timesheet(auth_token: Optional[str] = Cookie(None)):
         return RedirectResponse(url="/login", status_code=303)
 
     now = datetime.now()
-    return await get_timesheet_month(now.year, now.month, auth_token=auth_token)
+    return get_timesheet_month(
+        now.year,
+        now.month,
+        format="html",
+        totals_only=False,
+        auth_token=auth_token,
+        pb_client=pb_client,
+    )
 
 
 @app.get("/timesheet/month/{year}/{month}", tags=["Timesheet"])
-async def get_timesheet_month(
+def get_timesheet_month(
     year: int,
     month: int,
     format: str = Query("html", regex="^(html|json)$"),
-    auth_token: Optional[str] = Cookie(None)
+    totals_only: bool = Query(False),
+    auth_token: Optional[str] = Cookie(None),
+    pb_client: PocketBaseClient = Depends(get_pb_client),
 ):
     """
     Get timesheet data for a specific month. Requires authentication.
@@ -274,13 +425,13 @@ async def get_timesheet_month(
         year: Year (e.g., 2026)
         month: Month (1-12)
         format: Output format (html or json). Default: html
+        totals_only: Only return total hours and block count as JSON
         auth_token: Authentication token from cookie
+        pb_client: PocketBase client (injected)
 
     Returns:
         Time blocks for the specified month as HTML table or JSON
     """
-    from app.utils.auth import get_current_user
-
     # Check authentication
     try:
         user = get_current_user(auth_token)
@@ -288,29 +439,38 @@ async def get_timesheet_month(
         # Redirect to login
         return RedirectResponse(url="/login", status_code=303)
 
-    if not pb_client:
-        raise HTTPException(status_code=503, detail="PocketBase client not initialized")
-
     # Validate month
     if month < 1 or month > 12:
         raise HTTPException(status_code=400, detail="Month must be between 1 and 12")
 
     try:
-        # Get start and end of month
-        from datetime import timedelta
-        start_date = datetime(year, month, 1)
-
-        # Get end of month
-        if month == 12:
-            end_date = datetime(year + 1, 1, 1) - timedelta(days=1)
-        else:
-            end_date = datetime(year, month + 1, 1) - timedelta(days=1)
-
-        # Fetch time blocks
-        filter_str = (
-            f'block_start >= "{start_date.isoformat()}" && '
-            f'block_start <= "{end_date.replace(hour=23, minute=59, second=59).isoformat()}"'
-        )
+        filter_str = pb_client.month_filter("block_start", year, month)
+
+        # Totals only: skip fetching and converting full block records
+        if totals_only:
+            total_hours, count = pb_client.sum_field(
+                pb_client.COLLECTION_TIME_BLOCKS, "duration_hours", filter=filter_str
+            )
+            return {
+                "year": year,
+                "month": month,
+                "total_hours": total_hours,
+                "count": count,
+            }
+
+        # Stream JSON page by page instead of materializing the whole month
+        if format == "json":
+            first_page = pb_client.get_list(
+                pb_client.COLLECTION_TIME_BLOCKS,
+                page=1,
+                per_page=MONTH_STREAM_PAGE_SIZE,
+                filter=filter_str,
+                sort="+block_start",
+            )
+            return StreamingResponse(
+                _stream_month_json(pb_client, year, month, filter_str, first_page),
+                media_type="application/json",
+            )
 
         time_blocks = pb_client.get_full_list(
             pb_client.COLLECTION_TIME_BLOCKS,
@@ -318,36 +478,14 @@ async def get_timesheet_month(
             sort="+block_start"
         )
 
-        # Convert to dict list
-        blocks_list = []
-        for block in time_blocks:
-            if hasattr(block, "__dict__"):
-                block_dict = {
-                    k: v for k, v in block.__dict__.items()
-                    if not k.startswith("_")
-                }
-            else:
-                block_dict = dict(block)
-            blocks_list.append(block_dict)
-
-        # Calculate total hours
-        total_hours = sum(
-            float(block.get("duration_hours", 0))
-            for block in blocks_list
-        )
+        # Convert to dict list, then total the hours
+        blocks_list = _records_to_dicts(time_blocks, TIME_BLOCK_FIELDS)
+        total_hours = 0.0
+        for block_dict in blocks_list:
+            hours = block_dict.get("duration_hours")
+            total_hours += hours if type(hours) is float else float(hours or 0)
 
-        # Return JSON if requested
-        if format == "json":
-            return {
-                "year": year,
-                "month": month,
-                "time_blocks": blocks_list,
-                "total_hours": total_hours,
-                "count": len(blocks_list),
-            }
-
-        # Otherwise return simple HTML timesheet
-        from app.utils.timesheet_template import render_monthly_timesheet
+        # Render simple HTML timesheet
         html_content = render_monthly_timesheet(year, month, blocks_list, total_hours)
         return HTMLResponse(content=html_content)
 
@@ -356,8 +494,119 @@ async def get_timesheet_month(
         raise HTTPException(status_code=500, detail=f"Failed to fetch timesheet: {str(e)}")
 
 
+def _record_to_dict(record: Any, fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+    """
+    Convert a PocketBase record to a plain dict.
+
+    Args:
+        record: SDK record (or mapping)
+        fields: Field names to pick; if omitted, all non-underscore attributes
+
+    Returns:
+        Dictionary of record fields
+    """
+    if not hasattr(record, "__dict__"):
+        return dict(record)
+    d = record.__dict__
+    if fields is None:
+        return {k: v for k, v in d.items() if k[0] != "_"}
+    return {f: d.get(f) for f in fields}
+
+
+def _records_to_dicts(
+    records: List[Any], fields: Optional[Tuple[str, ...]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Convert a list of PocketBase records to plain dicts.
+
+    All records from one query share a shape, so the record-vs-mapping check
+    is made once for the list instead of per record.
+
+    Args:
+        records: SDK records (or mappings)
+        fields: Field names to pick; if omitted, all non-underscore attributes
+
+    Returns:
+        List of record dictionaries
+    """
+    if not records:
+        return []
+    if not hasattr(records[0], "__dict__"):
+        return [dict(record) for record in records]
+    if fields is None:
+        # Records from one query share their attribute set, so derive the keys
+        # once and extract values with a C-level itemgetter
+        first = records[0].__dict__
+        keys = tuple(k for k in first if k[0] != "_")
+        if len(keys) > 1 and all(len(record.__dict__) == len(first) for record in records):
+            get = itemgetter(*keys)
+            try:
+                return [dict(zip(keys, get(record.__dict__))) for record in records]
+            except KeyError:
+                pass  # Attribute sets differ after all; fall back below
+        return [
+            {k: v for k, v in record.__dict__.items() if k[0] != "_"}
+            for record in records
+        ]
+    return [{f: d.get(f) for f in fields} for d in (record.__dict__ for record in records)]
+
+
+def _stream_month_json(
+    pb_client: PocketBaseClient,
+    year: int,
+    month: int,
+    filter_str: str,
+    first_page: List[Any],
+) -> Iterator[bytes]:
+    """
+    Yield the month timesheet JSON document in chunks.
+
+    Blocks are fetched page by page and encoded one at a time, so peak memory
+    stays at one page regardless of month size. Totals are emitted last.
+
+    Args:
+        pb_client: PocketBase client used to fetch further pages
+        year: Year
+        month: Month (1-12)
+        filter_str: PocketBase filter selecting the month's time blocks
+        first_page: Already-fetched first page of time blocks
+
+    Yields:
+        JSON-encoded chunks of {"year", "month", "time_blocks", "total_hours", "count"}
+    """
+    yield b'{"year":%d,"month":%d,"time_blocks":[' % (year, month)
+
+    total_hours = 0.0
+    count = 0
+    page = 1
+    items = first_page
+
+    while True:
+        for block_dict in _records_to_dicts(items, TIME_BLOCK_FIELDS):
+            hours = block_dict.get("duration_hours")
+            total_hours += hours if type(hours) is float else float(hours or 0)
+            yield (b"," if count else b"") + orjson.dumps(block_dict)
+            count += 1
+
+        if len(items) < MONTH_STREAM_PAGE_SIZE:
+            break
+
+        page += 1
+        items = pb_client.get_list(
+            pb_client.COLLECTION_TIME_BLOCKS,
+            page=page,
+            per_page=MONTH_STREAM_PAGE_SIZE,
+            filter=filter_str,
+            sort="+block_start",
+        )
+
+    yield b'],"total_hours":%s,"count":%d}' % (orjson.dumps(total_hours), count)
+
+
 @app.get("/summary/week/{week_start}", tags=["Summary"])
-async def get_week_summary(week_start: str):
+def get_week_summary(
+    week_start: str, pb_client: PocketBaseClient = Depends(get_pb_client)
+):
     """
     Get summary for a specific week.
 
@@ -367,12 +616,10 @@ async def get_week_summary(week_start: str):
     Returns:
         Week summary with total hours and metadata
     """
-    if not pb_client:
-        raise HTTPException(status_code=503, detail="PocketBase client not initialized")
-
     try:
-        # Parse date
-        week_date = datetime.fromisoformat(week_start)
+        if not _DATE_RE.match(week_start):
+            raise ValueError(week_start)
+        next_day = (datetime.fromisoformat(week_start) + timedelta(days=1)).date().isoformat()
     except ValueError:
         raise HTTPException(
             status_code=400,
@@ -380,8 +627,11 @@ async def get_week_summary(week_start: str):
         )
 
     try:
-        # Fetch week summary
-        filter_str = f'week_start = "{week_date.isoformat()}"'
+        # Fetch week summary (week_start is stored with the work week start time)
+        filter_str = pb_client.filter(
+            "week_start >= {:start} && week_start < {:end}",
+            {"start": f"{week_start} 00:00:00.000Z", "end": f"{next_day} 00:00:00.000Z"},
+        )
         summaries = pb_client.get_full_list(
             pb_client.COLLECTION_WEEK_SUMMARIES,
             filter=filter_str
@@ -396,13 +646,7 @@ async def get_week_summary(week_start: str):
         summary = summaries[0]
 
         # Convert to dict
-        if hasattr(summary, "__dict__"):
-            summary_dict = {
-                k: v for k, v in summary.__dict__.items()
-                if not k.startswith("_")
-            }
-        else:
-            summary_dict = dict(summary)
+        summary_dict = _record_to_dict(summary, WEEK_SUMMARY_FIELDS)
 
         return summary_dict
 
@@ -419,10 +663,12 @@ async def get_week_summary(week_start: str):
 
 
 @app.get("/export/month/{year}/{month}", tags=["Export"])
-async def export_month(
+def export_month(
     year: int,
     month: int,
+    request: Request,
     format: str = Query("html", regex="^(html|csv|excel)$"),
+    exporter: "MonthlyExporter" = Depends(get_exporter),
 ):
     """
     Export monthly timesheet in specified format.
@@ -433,47 +679,31 @@ async def export_month(
         format: Export format (html, csv, or excel)
 
     Returns:
-        Timesheet in requested format
+        Timesheet in requested format (304 if the client's ETag still matches)
     """
-    if not exporter:
-        raise HTTPException(status_code=503, detail="Exporter not initialized")
-
     # Validate month
     if month < 1 or month > 12:
         raise HTTPException(status_code=400, detail="Month must be between 1 and 12")
 
     try:
-        if format == "html":
-            html_content = exporter.export_html(year, month)
-            return HTMLResponse(content=html_content)
-
-        elif format == "csv":
-            csv_content = exporter.export_csv(year, month)
-            from io import StringIO
-            import csv as csv_module
-            from fastapi.responses import StreamingResponse
-
-            # Create CSV response
-            output = StringIO()
-            output.write(csv_content)
-            output.seek(0)
-
-            filename = f"timesheet_{year}_{month:02d}.csv"
-            return StreamingResponse(
-                iter([output.getvalue()]),
-                media_type="text/csv",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-
-        elif format == "excel":
-            excel_file = exporter.export_excel(year, month)
-            filename = f"timesheet_{year}_{month:02d}.xlsx"
-
-            return FileResponse(
-                excel_file,
-                media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                filename=filename,
-            )
+        # Rendered exports are cached on disk and rebuilt only when the month changes
+        export_path, fingerprint = exporter.get_or_build(year, month, format)
+        etag = f'"{fingerprint}"'
+
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        media_type, filename = EXPORT_MEDIA_TYPES[format], None
+        if format != "html":
+            extension = exporter.FORMAT_EXTENSIONS[format]
+            filename = f"timesheet_{year}_{month:02d}.{extension}"
+
+        return FileResponse(
+            export_path,
+            media_type=media_type,
+            filename=filename,
+            headers={"ETag": etag, "Cache-Control": "private, max-age=300"},
+        )
 
     except Exception as e:
         logger.error(f"Export failed: {str(e)}", exc_info=True)
@@ -486,32 +716,52 @@ async def export_month(
 
 
 @app.get("/viewer", response_class=HTMLResponse, tags=["Data Viewer"])
-async def data_viewer():
+async def data_viewer(request: Request):
     """
     Interactive data viewer with copy-to-clipboard functionality.
 
     Provides a beautiful web interface to view and copy all collection data.
     """
-    from pathlib import Path
+    return _static_page_response(
+        request,
+        "data_viewer.html",
+        "Data viewer not found. Make sure data_viewer.html exists in the project root.",
+    )
 
-    viewer_path = Path(__file__).parent.parent / "data_viewer.html"
 
-    if not viewer_path.exists():
-        raise HTTPException(
-            status_code=404,
-            detail="Data viewer not found. Make sure data_viewer.html exists in the project root."
-        )
+def _static_page_response(request: Request, filename: str, not_found_detail: str) -> Response:
+    """
+    Serve a static HTML page from the project root, read from disk only once.
 
-    with open(viewer_path, "r", encoding="utf-8") as f:
-        html_content = f.read()
+    Args:
+        request: Incoming request (for If-None-Match)
+        filename: HTML file name in the project root
+        not_found_detail: 404 detail if the file does not exist
 
-    return HTMLResponse(content=html_content)
+    Returns:
+        HTML response, or 304 if the client's ETag still matches
+    """
+    page = _static_pages.get(filename)
+    if page is None:
+        path = Path(__file__).parent.parent / filename
+        if not path.exists():
+            raise HTTPException(status_code=404, detail=not_found_detail)
+        content = path.read_bytes()
+        etag = f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+        page = _static_pages[filename] = (content, etag)
+
+    content, etag = page
+    headers = {"ETag": etag, "Cache-Control": STATIC_PAGE_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=content, headers=headers)
 
 
 @app.get("/data/{collection}", tags=["Data Access"])
-async def get_collection_data(
+def get_collection_data(
     collection: str,
-    format: str = Query("html", regex="^(html|json)$")
+    format: str = Query("html", regex="^(html|json)$"),
+    pb_client: PocketBaseClient = Depends(get_pb_client),
 ):
     """
     Get all records from a collection in a user-friendly format.
@@ -523,11 +773,8 @@ async def get_collection_data(
         format: Output format (html or json). Default: html
 
     Returns:
-        Collection data as HTML table or JSON
+        Collection data as HTML table or JSON (cached for COLLECTION_CACHE_SECONDS)
     """
-    if not pb_client:
-        raise HTTPException(status_code=503, detail="PocketBase client not initialized")
-
     # Valid collections
     valid_collections = [
         "settings",
@@ -546,34 +793,33 @@ async def get_collection_data(
             detail=f"Invalid collection. Valid options: {', '.join(valid_collections)}"
         )
 
+    # HTML and JSON variants are cached separately
+    cache_key = ("data", collection, format)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return HTMLResponse(content=cached) if format == "html" else ORJSONResponse(cached)
+
     try:
         # Fetch all records (no sort for better compatibility)
         records = pb_client.get_full_list(collection)
 
         # Convert to dicts
-        records_list = []
-        for record in records:
-            if hasattr(record, "__dict__"):
-                record_dict = {
-                    k: v for k, v in record.__dict__.items()
-                    if not k.startswith("_")
-                }
-            else:
-                record_dict = dict(record)
-            records_list.append(record_dict)
+        records_list = _records_to_dicts(records)
 
         # Return JSON if requested
         if format == "json":
-            return {
+            result = {
                 "collection": collection,
                 "count": len(records_list),
                 "records": records_list,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(),
             }
+            _cache_put(cache_key, result, COLLECTION_CACHE_SECONDS)
+            return ORJSONResponse(result)
 
         # Otherwise return HTML
-        from app.utils.html_templates import render_collection_html
         html_content = render_collection_html(collection, records_list)
+        _cache_put(cache_key, html_content, COLLECTION_CACHE_SECONDS)
         return HTMLResponse(content=html_content)
 
     except Exception as e:
@@ -585,19 +831,25 @@ async def get_collection_data(
 
 
 @app.get("/dashboard", tags=["Dashboard"])
-async def dashboard():
+async def dashboard(
+    pb_client: PocketBaseClient = Depends(get_pb_client),
+    config: Optional[Config] = Depends(get_optional_config),
+    scheduler: Optional[SchedulerService] = Depends(get_optional_scheduler),
+):
     """
     Get dashboard overview with system statistics and recent activity.
 
     Returns:
         System overview including record counts, recent data, and configuration
+        (cached for DASHBOARD_CACHE_SECONDS). If some PocketBase queries fail,
+        their counts are null, "partial_failures" lists them and the status is 206.
     """
-    if not pb_client:
-        raise HTTPException(status_code=503, detail="PocketBase client not initialized")
+    cached = _cache_get(("dashboard",))
+    if cached is not None:
+        return ORJSONResponse(cached)
 
     try:
         # Get counts for all collections
-        counts = {}
         collections = [
             "settings",
             "work_packages",
@@ -609,82 +861,84 @@ async def dashboard():
             "email_accounts",
         ]
 
-        for collection in collections:
-            try:
-                counts[collection] = pb_client.count(collection)
-            except:
-                counts[collection] = 0
-
-        # Get recent raw events (last 10)
-        recent_events = []
-        try:
-            events = pb_client.get_list(
-                "raw_events",
-                page=1,
-                per_page=10,
-                sort="-created"
-            )
-            for event in events:
-                if hasattr(event, "__dict__"):
-                    event_dict = {
-                        k: v for k, v in event.__dict__.items()
-                        if not k.startswith("_")
-                    }
-                else:
-                    event_dict = dict(event)
-                recent_events.append(event_dict)
-        except:
-            pass
-
-        # Get recent time blocks (last 10)
-        recent_blocks = []
-        try:
-            blocks = pb_client.get_list(
-                "time_blocks",
-                page=1,
-                per_page=10,
-                sort="-created"
-            )
-            for block in blocks:
-                if hasattr(block, "__dict__"):
-                    block_dict = {
-                        k: v for k, v in block.__dict__.items()
-                        if not k.startswith("_")
-                    }
-                else:
-                    block_dict = dict(block)
-                recent_blocks.append(block_dict)
-        except:
-            pass
+        # Counts and recent lists are independent round trips; run them concurrently.
+        # (PocketBase's /api/batch only accepts create/update/upsert/delete, so
+        # list reads can't be coalesced into one request.)
+        # The sort=-created lists rely on idx_raw_events_created_desc and
+        # idx_time_blocks_created_desc (pb_migrations/1704673209_add_created_indexes.js).
+        # Settings are read in a thread too: once their TTL expires, config.settings
+        # makes blocking PocketBase requests.
+        results = await asyncio.gather(
+            *(asyncio.to_thread(pb_client.count, collection) for collection in collections),
+            asyncio.to_thread(
+                pb_client.get_list, "raw_events", page=1, per_page=10, sort="-created"
+            ),
+            asyncio.to_thread(
+                pb_client.get_list, "time_blocks", page=1, per_page=10, sort="-created"
+            ),
+            asyncio.to_thread(lambda: config.settings if config else None),
+            return_exceptions=True,
+        )
+        *count_results, events, blocks, settings = results
+
+        # PocketBase failures (the SDK reports transport errors as ClientResponseError
+        # too) are collected per component; anything else is a bug and propagates
+        failures: List[Dict[str, str]] = []
+
+        def collect(component: str, result: Any) -> bool:
+            if isinstance(result, ClientResponseError):
+                failures.append({"component": component, "error": str(result)})
+                return False
+            if isinstance(result, BaseException):
+                raise result
+            return True
+
+        counts = {
+            collection: result if collect(collection, result) else None
+            for collection, result in zip(collections, count_results)
+        }
+
+        # Recent raw events and time blocks (last 10 each)
+        recent_events = (
+            _records_to_dicts(events, RAW_EVENT_FIELDS)
+            if collect("recent_events", events)
+            else []
+        )
+        recent_blocks = (
+            _records_to_dicts(blocks, TIME_BLOCK_FIELDS)
+            if collect("recent_time_blocks", blocks)
+            else []
+        )
 
         # Get configuration summary
         config_summary = {}
-        if config and config.settings:
-            try:
-                settings = config.settings
-                config_summary = {
-                    "work_week": f"{settings.core.work_week_start_day.value} to {settings.core.work_week_end_day.value}",
-                    "target_hours": settings.core.target_hours_per_week,
-                    "auto_fill_enabled": settings.core.auto_fill_enabled,
-                    "wakatime_enabled": settings.wakatime.wakatime_enabled,
-                    "github_enabled": settings.github.github_enabled,
-                    "calendar_enabled": settings.calendar.calendar_enabled,
-                    "gmail_enabled": settings.gmail.gmail_enabled,
-                }
-            except:
-                pass
+        if isinstance(settings, (ClientResponseError, RuntimeError, ValueError)):
+            failures.append({"component": "configuration", "error": str(settings)})
+        elif isinstance(settings, BaseException):
+            raise settings
+        elif settings is not None:
+            config_summary = {
+                "work_week": f"{settings.core.work_week_start_day.value} to {settings.core.work_week_end_day.value}",
+                "target_hours": settings.core.target_hours_per_week,
+                "auto_fill_enabled": settings.core.auto_fill_enabled,
+                "wakatime_enabled": settings.wakatime.wakatime_enabled,
+                "github_enabled": settings.github.github_enabled,
+                "calendar_enabled": settings.calendar.calendar_enabled,
+                "gmail_enabled": settings.gmail.gmail_enabled,
+            }
 
         # Get scheduler status
         scheduler_info = {}
         if scheduler:
             try:
                 scheduler_info = scheduler.get_job_status()
-            except:
-                pass
+            except Exception as e:
+                logger.warning(f"Dashboard: scheduler status unavailable: {str(e)}")
+                failures.append({"component": "scheduler", "error": str(e)})
 
-        return {
-            "timestamp": datetime.now().isoformat(),
-            "system_status": "operational",
+        result = {
+            "timestamp": datetime.now(),
+            "system_status": "degraded" if failures else "operational",
             "collection_counts": counts,
             "recent_events": recent_events,
             "recent_time_blocks": recent_blocks,
@@ -696,9 +950,17 @@ async def dashboard():
                 "settings": "/data/settings",
                 "work_packages": "/data/work_packages",
                 "current_timesheet": "/timesheet/current",
-            }
+            },
+            "partial_failures": failures,
         }
 
+        # Partial results are not cached, so a retry fetches fresh data
+        if failures:
+            return ORJSONResponse(result, status_code=206)
+
+        _cache_put(("dashboard",), result, DASHBOARD_CACHE_SECONDS)
+        return ORJSONResponse(result)
+
     except Exception as e:
         logger.error(f"Dashboard failed: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -707,6 +969,102 @@ async def dashboard():
         )
 
 
+@app.get("/dashboard/{year}/{month}", tags=["Dashboard"])
+def dashboard_month(
+    year: int,
+    month: int,
+    pb_client: PocketBaseClient = Depends(get_pb_client),
+):
+    """
+    Get month totals and per-week summaries in a single response.
+
+    Time blocks are fetched once and grouped by week_start server-side, so
+    clients don't need separate month and week-summary requests. Responses
+    are cached per month until the month's time blocks change.
+
+    Args:
+        year: Year (e.g., 2026)
+        month: Month (1-12)
+
+    Returns:
+        Month totals, hours per source and a summary for each work week
+    """
+    # Validate month
+    if month < 1 or month > 12:
+        raise HTTPException(status_code=400, detail="Month must be between 1 and 12")
+
+    try:
+        filter_str = pb_client.month_filter("block_start", year, month)
+
+        # Cheap change marker decides whether the cached summary is still valid
+        marker = pb_client.count_and_last_updated(
+            pb_client.COLLECTION_TIME_BLOCKS, filter=filter_str
+        )
+        key = (year, month)
+        with _month_dashboard_cache_lock:
+            cached = _month_dashboard_cache.pop(key, None)
+            if cached is not None:
+                # Re-insert so recently viewed months are evicted last
+                _month_dashboard_cache[key] = cached
+        if cached and cached[0] == marker:
+            return ORJSONResponse(cached[1])
+
+        time_blocks = pb_client.get_full_list(
+            pb_client.COLLECTION_TIME_BLOCKS,
+            filter=filter_str,
+            sort="+block_start"
+        )
+
+        # Group blocks by work week in a single pass
+        weeks: Dict[str, Dict[str, Any]] = {}
+        source_hours: Dict[str, float] = {}
+        total_hours = 0.0
+        for block_dict in _records_to_dicts(time_blocks, TIME_BLOCK_FIELDS):
+            hours = block_dict.get("duration_hours")
+            if type(hours) is not float:
+                hours = float(hours or 0)
+            source = block_dict.get("source") or "unknown"
+            week_start = block_dict.get("week_start") or ""
+
+            week = weeks.get(week_start)
+            if week is None:
+                week = weeks[week_start] = {
+                    "week_start": week_start,
+                    "total_hours": 0.0,
+                    "count": 0,
+                    "sources": {},
+                }
+            week["total_hours"] += hours
+            week["count"] += 1
+            week["sources"][source] = week["sources"].get(source, 0.0) + hours
+
+            source_hours[source] = source_hours.get(source, 0.0) + hours
+            total_hours += hours
+
+        result = {
+            "year": year,
+            "month": month,
+            "total_hours": total_hours,
+            "count": len(time_blocks),
+            "sources": source_hours,
+            "weeks": sorted(weeks.values(), key=lambda w: w["week_start"]),
+        }
+
+        with _month_dashboard_cache_lock:
+            _month_dashboard_cache.pop(key, None)
+            _month_dashboard_cache[key] = (marker, result)
+            while len(_month_dashboard_cache) > MONTH_DASHBOARD_CACHE_MONTHS:
+                del _month_dashboard_cache[next(iter(_month_dashboard_cache))]
+        return ORJSONResponse(result)
+
+    except Exception as e:
+        logger.error(f"Month dashboard failed: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Month dashboard failed: {str(e)}"
+        )
+
+
 # ============================================================================
 # Authentication Endpoints
 # ============================================================================
@@ -719,26 +1077,13 @@ class LoginRequest(BaseModel):
 
 
 @app.get("/login", response_class=HTMLResponse, tags=["Authentication"])
-async def login_page():
+async def login_page(request: Request):
     """Show login page."""
-    from pathlib import Path
-
-    login_path = Path(__file__).parent.parent / "login.html"
-
-    if not login_path.exists():
-        raise HTTPException(
-            status_code=404,
-            detail="Login page not found"
-        )
-
-    with open(login_path, "r", encoding="utf-8") as f:
-        html_content = f.read()
-
-    return HTMLResponse(content=html_content)
+    return _static_page_response(request, "login.html", "Login page not found")
 
 
 @app.post("/auth/login", tags=["Authentication"])
-async def login(request: LoginRequest, response: Response):
+def login(request: LoginRequest, response: Response):
     """
     Authenticate user and set auth cookie.
 
@@ -749,8 +1094,6 @@ async def login(request: LoginRequest, response: Response):
     Returns:
         Success message and user data
     """
-    from app.utils.auth import auth_service
-
     try:
         token, user_data = auth_service.authenticate(request.email, request.password)
 
@@ -784,11 +1127,8 @@ async def logout(response: Response):
 
 
 @app.get("/auth/me", tags=["Authentication"])
-async def get_current_user_info(user: dict = Depends(lambda: None)):
+def get_current_user_info(user: dict = Depends(lambda: None)):
     """Get current authenticated user info."""
-    from app.utils.auth import get_current_user
-    from fastapi import Cookie
-
     auth_token = Cookie(None)
 
     try:
@@ -814,9 +1154,6 @@ async def google_oauth_authorize(service: str = Query("calendar", regex="^(calen
     Returns:
         Redirect to Google consent screen
     """
-    from fastapi.responses import RedirectResponse
-    from app.utils.oauth import build_google_auth_url
-
     try:
         auth_url = build_google_auth_url(service)
         return RedirectResponse(url=auth_url)
@@ -839,6 +1176,11 @@ async def google_oauth_callback(code: str, state: str):
     """
     # TODO: Implement OAuth token exchange and storage
     # This requires implementing the full OAuth flow with token exchange
+
+    # A re-authorized Calendar token must not be shadowed by cached credentials
+    if state == "calendar":
+        clear_credentials_cache()
+
     return {
         "status": "success",
         "message": "OAuth callback received",
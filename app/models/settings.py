@@ -6,11 +6,57 @@ Settings are stored in PocketBase and loaded at runtime.
 """
 
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field, field_validator, model_validator
 import re
 
 
+def _csv_pattern(item: str) -> "re.Pattern[str]":
+    """
+    Compile a pattern that fullmatches a whole comma-separated list of items.
+
+    Entries may be padded with whitespace or empty, mirroring _split_csv, so a
+    valid list is checked in one regex call instead of one call per entry.
+    """
+    entry = rf"\s*(?:{item}\s*)?"
+    return re.compile(rf"{entry}(?:,{entry})*")
+
+
+# Validation patterns for 24-hour HH:MM times and comma-separated email/owner-repo lists
+_EMAIL = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+_REPO = r"[a-zA-Z0-9._-]+/[a-zA-Z0-9._-]+"
+_HHMM_RE = re.compile(r"^([01]\d|2[0-3]):([0-5]\d)$")
+_EMAIL_RE = re.compile(rf"^{_EMAIL}$")
+_REPO_RE = re.compile(rf"^{_REPO}$")
+_EMAIL_CSV_RE = _csv_pattern(_EMAIL)
+_REPO_CSV_RE = _csv_pattern(_REPO)
+
+
+@lru_cache(maxsize=128)
+def _split_csv(v: str) -> Tuple[str, ...]:
+    """
+    Split a comma-separated setting into stripped, non-empty items.
+
+    Cached by the raw string, so validation and the get_*_list accessors share
+    one parse per distinct value; callers get a tuple and copy it if needed.
+    """
+    if not v:
+        return ()
+    return tuple(item for item in (part.strip() for part in v.split(",")) if item)
+
+
+def _validate_email_csv(v: str) -> str:
+    """Validate a comma-separated list of email addresses"""
+    if _EMAIL_CSV_RE.fullmatch(v):
+        return v
+    # Invalid list: walk the entries to report the offending address
+    for email in _split_csv(v):
+        if not _EMAIL_RE.match(email):
+            raise ValueError(f"Invalid email address: {email}")
+    return v
+
+
 class DayOfWeek(str, Enum):
     """Valid days of the week"""
     MONDAY = "monday"
@@ -22,6 +68,10 @@ class DayOfWeek(str, Enum):
     SUNDAY = "sunday"
 
 
+# Position of each day within the week, for ordering comparisons
+_DAY_INDEX: Dict[DayOfWeek, int] = {day: i for i, day in enumerate(DayOfWeek)}
+
+
 class RoundingMode(str, Enum):
     """Time rounding modes for 0.5h blocks"""
     UP = "up"  # Always round up to next 0.5h
@@ -60,8 +110,7 @@ class CoreSettings(BaseModel):
 
     work_week_start_time: str = Field(
         default="18:00",
-        description="Time when work week starts (24-hour format HH:MM)",
-        pattern=r"^([01]\d|2[0-3]):([0-5]\d)$"
+        description="Time when work week starts (24-hour format HH:MM)"
     )
 
     work_week_end_day: DayOfWeek = Field(
@@ -71,8 +120,7 @@ class CoreSettings(BaseModel):
 
     work_week_end_time: str = Field(
         default="18:00",
-        description="Time when work week ends (24-hour format HH:MM)",
-        pattern=r"^([01]\d|2[0-3]):([0-5]\d)$"
+        description="Time when work week ends (24-hour format HH:MM)"
     )
 
     target_hours_per_week: int = Field(
@@ -110,6 +158,14 @@ class CoreSettings(BaseModel):
         description="Default location for time entries"
     )
 
+    @field_validator("work_week_start_time", "work_week_end_time")
+    @classmethod
+    def validate_time_of_day(cls, v: str) -> str:
+        """Times must be 24-hour HH:MM"""
+        if not _HHMM_RE.match(v):
+            raise ValueError(f"Invalid time '{v}' (expected 24-hour format HH:MM)")
+        return v
+
     @field_validator("time_block_size_minutes")
     @classmethod
     def validate_block_size(cls, v: int) -> int:
@@ -121,11 +177,7 @@ class CoreSettings(BaseModel):
     @model_validator(mode="after")
     def validate_week_logic(self) -> "CoreSettings":
         """Validate that week start comes before week end"""
-        days_order = list(DayOfWeek)
-        start_idx = days_order.index(self.work_week_start_day)
-        end_idx = days_order.index(self.work_week_end_day)
-
-        if start_idx >= end_idx:
+        if _DAY_INDEX[self.work_week_start_day] >= _DAY_INDEX[self.work_week_end_day]:
             raise ValueError(
                 f"work_week_end_day ({self.work_week_end_day}) must come after "
                 f"work_week_start_day ({self.work_week_start_day})"
@@ -161,23 +213,11 @@ class CalendarSettings(BaseModel):
     @classmethod
     def validate_email_list(cls, v: str) -> str:
         """Validate comma-separated email addresses"""
-        if not v:
-            return v
-
-        emails = [e.strip() for e in v.split(",")]
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-
-        for email in emails:
-            if email and not re.match(email_pattern, email):
-                raise ValueError(f"Invalid email address: {email}")
-
-        return v
+        return _validate_email_csv(v)
 
     def get_monitored_emails_list(self) -> List[str]:
         """Parse monitored emails into a list"""
-        if not self.calendar_monitored_emails:
-            return []
-        return [e.strip() for e in self.calendar_monitored_emails.split(",") if e.strip()]
+        return list(_split_csv(self.calendar_monitored_emails))
 
 
 # Gmail Settings (3 settings)
@@ -205,23 +245,11 @@ class GmailSettings(BaseModel):
     @classmethod
     def validate_email_list(cls, v: str) -> str:
         """Validate comma-separated email addresses"""
-        if not v:
-            return v
-
-        emails = [e.strip() for e in v.split(",")]
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-
-        for email in emails:
-            if email and not re.match(email_pattern, email):
-                raise ValueError(f"Invalid email address: {email}")
-
-        return v
+        return _validate_email_csv(v)
 
     def get_monitored_recipients_list(self) -> List[str]:
         """Parse monitored recipients into a list"""
-        if not self.gmail_monitored_recipients:
-            return []
-        return [e.strip() for e in self.gmail_monitored_recipients.split(",") if e.strip()]
+        return list(_split_csv(self.gmail_monitored_recipients))
 
 
 # GitHub Settings (5 settings)
@@ -257,23 +285,19 @@ class GitHubSettings(BaseModel):
     @classmethod
     def validate_repo_list(cls, v: str) -> str:
         """Validate comma-separated repository names"""
-        if not v:
+        if not v or _REPO_CSV_RE.fullmatch(v):
             return v
 
-        repos = [r.strip() for r in v.split(",")]
-        repo_pattern = r"^[a-zA-Z0-9._-]+/[a-zA-Z0-9._-]+$"
-
-        for repo in repos:
-            if repo and not re.match(repo_pattern, repo):
+        # Invalid list: walk the entries to report the offending repository
+        for repo in _split_csv(v):
+            if not _REPO_RE.match(repo):
                 raise ValueError(f"Invalid repository format: {repo} (expected: owner/repo)")
 
         return v
 
     def get_repositories_list(self) -> List[str]:
         """Parse repositories into a list"""
-        if not self.github_repositories:
-            return []
-        return [r.strip() for r in self.github_repositories.split(",") if r.strip()]
+        return list(_split_csv(self.github_repositories))
 
 
 # Cloud Events Settings (1 setting)
@@ -379,70 +403,63 @@ class Settings(BaseModel):
         Returns:
             Dict with keys like "work_week_start_day", "wakatime_enabled", etc.
         """
-        flat = {}
-
-        # Core settings (no prefix)
-        for key, value in self.core.model_dump().items():
-            flat[key] = value
-
-        # Other categories (with prefix)
-        for category in ["wakatime", "calendar", "gmail", "github", "cloud_events", "processing", "export"]:
-            category_settings = getattr(self, category)
-            for key, value in category_settings.model_dump().items():
-                flat[key] = value
+        # Every section holds plain scalars/enums and field names already carry
+        # their prefix, so copying each instance dict matches model_dump()
+        flat = dict(self.core.__dict__)
+        for category in (
+            self.wakatime, self.calendar, self.gmail, self.github,
+            self.cloud_events, self.processing, self.export,
+        ):
+            flat.update(category.__dict__)
 
         return flat
 
     @classmethod
-    def from_flat_dict(cls, flat_dict: Dict[str, Any]) -> "Settings":
+    def from_flat_dict(cls, flat_dict: Dict[str, Any], require_all: bool = False) -> "Settings":
         """
         Create Settings from flat key-value dict (from PocketBase).
 
         Args:
             flat_dict: Dictionary with keys like "work_week_start_day", etc.
+            require_all: If True, raise when any of the 31 setting keys is missing
+                instead of falling back to model defaults
 
         Returns:
             Settings object with nested structure
+
+        Raises:
+            ValueError: If require_all is set and settings are missing
         """
-        # Group settings by category
-        core_keys = [
-            "work_week_start_day", "work_week_start_time",
-            "work_week_end_day", "work_week_end_time",
-            "target_hours_per_week", "fetch_interval_hours",
-            "time_block_size_minutes", "auto_fill_enabled",
-            "auto_fill_day", "default_location"
-        ]
-
-        grouped = {
-            "core": {k: flat_dict[k] for k in core_keys if k in flat_dict},
-            "wakatime": {},
-            "calendar": {},
-            "gmail": {},
-            "github": {},
-            "cloud_events": {},
-            "processing": {},
-            "export": {}
-        }
-
-        # Categorize remaining keys by prefix
+        if require_all:
+            missing = SETTING_KEYS - flat_dict.keys()
+            if missing:
+                raise ValueError(
+                    f"Expected {len(SETTING_KEYS)} settings, but found "
+                    f"{len(SETTING_KEYS) - len(missing)}. Missing: {', '.join(sorted(missing))}. "
+                    f"Please run seed_settings.py to populate default values."
+                )
+
+        # Group settings by category with one lookup per key; unknown keys are
+        # dropped (the section models ignore extra fields anyway)
+        grouped = {section: {} for section in _SECTIONS}
         for key, value in flat_dict.items():
-            if key in core_keys:
-                continue
-
-            if key.startswith("wakatime_"):
-                grouped["wakatime"][key] = value
-            elif key.startswith("calendar_"):
-                grouped["calendar"][key] = value
-            elif key.startswith("gmail_"):
-                grouped["gmail"][key] = value
-            elif key.startswith("github_"):
-                grouped["github"][key] = value
-            elif key.startswith("cloud_events_"):
-                grouped["cloud_events"][key] = value
-            elif key.startswith("export_"):
-                grouped["export"][key] = value
-            else:
-                # Processing settings don't have a common prefix
-                grouped["processing"][key] = value
+            section = _KEY_SECTIONS.get(key)
+            if section is not None:
+                grouped[section][key] = value
 
+        # Always validate: pydantic-core validation is faster here than a
+        # model_construct() "trusted" path, and PocketBase values can be edited
+        # outside this app
         return cls(**grouped)
+
+
+# Settings section names, and the section each flat setting key belongs to
+_SECTIONS = tuple(Settings.model_fields)
+_KEY_SECTIONS: Dict[str, str] = {
+    key: section
+    for section, field in Settings.model_fields.items()
+    for key in field.annotation.model_fields
+}
+
+# All flat setting keys as stored in PocketBase (31 total)
+SETTING_KEYS = frozenset(_KEY_SECTIONS)
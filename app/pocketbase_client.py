@@ -5,7 +5,10 @@ Provides high-level CRUD operations and utilities for interacting with PocketBas
 """
 
 import os
-from typing import Any, Dict, List, Optional, TypeVar
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 from datetime import datetime
 from pocketbase import PocketBase
 from pocketbase.client import ClientResponseError
@@ -14,6 +17,187 @@ from pocketbase.models import Record
 
 T = TypeVar("T", bound=Record)
 
+# Page size for full-list reads. The SDK's get_full_list defaults to 100 per
+# page; 500 is the largest perPage every supported server version accepts
+# without clamping.
+FULL_LIST_PAGE_SIZE = 500
+
+
+@lru_cache(maxsize=2048)
+def _month_bounds(year: int, month: int) -> Tuple[str, str]:
+    """
+    Get the half-open bounds of a month as PocketBase datetime strings.
+
+    Args:
+        year: Year
+        month: Month (1-12)
+
+    Returns:
+        Tuple of (start, end) strings where end is the first instant of the
+        next month, e.g. ("2025-12-01 00:00:00.000Z", "2026-01-01 00:00:00.000Z")
+    """
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return (
+        f"{year:04d}-{month:02d}-01 00:00:00.000Z",
+        f"{next_year:04d}-{next_month:02d}-01 00:00:00.000Z",
+    )
+
+
+def escape_filter_value(value: str) -> str:
+    """
+    Escape a value for use inside a double-quoted PocketBase filter string.
+
+    Args:
+        value: Raw value
+
+    Returns:
+        Value with backslashes and double quotes backslash-escaped
+    """
+    # Backslashes first, so a trailing backslash cannot escape the closing quote
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def list_change_marker(
+    client: PocketBase, collection: str, filter: Optional[str] = None
+) -> Tuple[int, Optional[str]]:
+    """
+    Count matching records and get the most recent raw "updated" string.
+
+    The list request is sent directly instead of through get_list(): the
+    SDK decodes "updated" into a datetime cut to whole seconds, which would
+    hide a second edit made within the same second. The raw string keeps
+    PocketBase's millisecond precision.
+
+    Args:
+        client: PocketBase SDK client
+        collection: Collection name
+        filter: Optional filter expression
+
+    Returns:
+        Tuple of (number of records, latest "updated" string or None)
+    """
+    params: Dict[str, Any] = {"page": 1, "perPage": 1, "sort": "-updated", "fields": "updated"}
+    if filter:
+        params["filter"] = filter
+    data = client.send(
+        client.collection(collection).base_crud_path(), {"method": "GET", "params": params}
+    )
+    items = data.get("items") or []
+    return data.get("totalItems", 0), items[0].get("updated") if items else None
+
+
+@lru_cache(maxsize=256)
+def timestamp_range_filter(start: datetime, end: datetime) -> str:
+    """
+    Build the inclusive filter on "timestamp" between two datetimes.
+
+    Cached per (start, end): week processing asks for the same range repeatedly.
+
+    Args:
+        start: Range start
+        end: Range end
+
+    Returns:
+        Filter expression
+    """
+    return f'timestamp>="{start.isoformat()}" && timestamp<="{end.isoformat()}"'
+
+
+@lru_cache(maxsize=256)
+def key_filter(key: str) -> str:
+    """
+    Build the filter selecting a settings record by key.
+
+    Args:
+        key: Setting key (e.g., "work_week_start_day")
+
+    Returns:
+        Filter expression, e.g. 'key="work_week_start_day"'
+    """
+    return f'key="{escape_filter_value(key)}"'
+
+
+# Truthy boolean setting values; common casings are matched without lowercasing
+_TRUE_VALUES = frozenset(("true", "1", "yes", "on"))
+_TRUE_VALUES_ANY_CASE = _TRUE_VALUES | frozenset(("True", "TRUE", "Yes", "YES", "On", "ON"))
+
+
+def parse_setting_value(value: str, type_str: str) -> Any:
+    """
+    Parse a stored setting value from its string form.
+
+    Args:
+        value: String value from the settings collection
+        type_str: Type indicator ("string", "number", "boolean")
+
+    Returns:
+        Parsed value in appropriate Python type
+    """
+    if type_str == "number":
+        # Integers (optionally signed) take the fast path; anything else is a float
+        digits = value[1:] if value[:1] in ("-", "+") else value
+        if digits.isdecimal():
+            return int(value)
+        return float(value)
+    elif type_str == "boolean":
+        return value in _TRUE_VALUES_ANY_CASE or value.lower() in _TRUE_VALUES
+    else:  # string
+        return value
+
+
+class _LazyAdminPocketBase(PocketBase):
+    """
+    PocketBase SDK client that signs in as admin on demand.
+
+    The admin login runs before the first request that needs it instead of at
+    construction, and a 401 (expired admin token) triggers one re-login and
+    retry. The health endpoint never triggers a login.
+    """
+
+    PUBLIC_PATHS = ("/api/health",)
+
+    def __init__(self, base_url: str, login: Callable[[], None]):
+        super().__init__(base_url)
+        self._login = login
+        self._login_lock = threading.Lock()
+        # Set on the thread running the login, whose own request must pass through
+        self._local = threading.local()
+
+    def send(self, path: str, req_config: Dict[str, Any]) -> Any:
+        if getattr(self._local, "logging_in", False) or path in self.PUBLIC_PATHS:
+            return super().send(path, req_config)
+
+        if not self.auth_store.token:
+            self._ensure_login()
+        token = self.auth_store.token
+        try:
+            return super().send(path, req_config)
+        except ClientResponseError as e:
+            if e.status != 401:
+                raise
+            self._ensure_login(rejected_token=token)
+            return super().send(path, req_config)
+
+    def _ensure_login(self, rejected_token: Optional[str] = None) -> None:
+        """
+        Run the admin login once, even if several threads need it at the same time.
+
+        Args:
+            rejected_token: Token that just got a 401. It is only cleared if
+                still current, so a token another thread obtained meanwhile
+                is kept.
+        """
+        with self._login_lock:
+            token = self.auth_store.token
+            if token and token != rejected_token:
+                return  # Another thread signed in while we waited
+            self.auth_store.clear()
+            self._local.logging_in = True
+            try:
+                self._login()
+            finally:
+                self._local.logging_in = False
+
 
 class PocketBaseClient:
     """
@@ -40,15 +224,20 @@ class PocketBaseClient:
 
         Args:
             url: PocketBase URL (defaults to POCKETBASE_URL env var)
-            auto_auth: Automatically authenticate as admin on init
+            auto_auth: Automatically authenticate as admin (on first request)
         """
         self.url = url or os.getenv("POCKETBASE_URL", "http://127.0.0.1:8090")
-        self.client = PocketBase(self.url)
         self._admin_email = os.getenv("PB_ADMIN_EMAIL")
         self._admin_password = os.getenv("PB_ADMIN_PASSWORD")
 
+        # With credentials, sign in lazily on first use (and again on 401)
+        # instead of paying a login round-trip here
         if auto_auth and self._admin_email and self._admin_password:
-            self.authenticate_admin()
+            self.client = _LazyAdminPocketBase(self.url, self.authenticate_admin)
+        else:
+            self.client = PocketBase(self.url)
+        # Setting key -> record ID, loaded on the first update_setting() call
+        self._setting_ids: Optional[Dict[str, str]] = None
 
     def authenticate_admin(self) -> None:
         """Authenticate as admin user"""
@@ -89,8 +278,68 @@ class PocketBaseClient:
         Raises:
             ClientResponseError: If creation fails
         """
+        # The SDK encodes the body with httpx's stdlib json encoder. orjson would
+        # save ~5us per typical record against a network round-trip of a
+        # millisecond or more, which is not worth bypassing the SDK's request,
+        # auth and error handling for; bulk_create() overlaps the round-trips
+        # themselves instead.
         return self.client.collection(collection).create(data)
 
+    def bulk_create(
+        self, collection: str, rows: List[Dict[str, Any]], max_workers: int = 8
+    ) -> List[Record]:
+        """
+        Create many records in a collection, overlapping the HTTP round-trips.
+
+        Requests run on a small thread pool (the SDK's httpx client is
+        thread-safe and pools connections), so N records cost roughly
+        N / max_workers round-trips instead of N.
+
+        Args:
+            collection: Collection name
+            rows: Record data for each record to create
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Created records, in the same order as rows
+
+        Raises:
+            ClientResponseError: If any creation fails (records already
+                created are kept)
+        """
+        if len(rows) <= 1:
+            return [self.create(collection, row) for row in rows]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(rows))) as executor:
+            return list(executor.map(lambda row: self.create(collection, row), rows))
+
+    def bulk_update(
+        self, collection: str, updates: Dict[str, Dict[str, Any]], max_workers: int = 8
+    ) -> List[Record]:
+        """
+        Update many records in a collection, overlapping the HTTP round-trips.
+
+        Same thread-pool approach as bulk_create().
+
+        Args:
+            collection: Collection name
+            updates: Fields to update, keyed by record ID
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Updated records, in the same order as updates
+
+        Raises:
+            ClientResponseError: If any update fails (records already
+                updated are kept)
+        """
+        items = list(updates.items())
+        if len(items) <= 1:
+            return [self.update(collection, record_id, data) for record_id, data in items]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(lambda item: self.update(collection, *item), items))
+
     def get(self, collection: str, record_id: str) -> Record:
         """
         Get a record by ID.
@@ -128,13 +377,21 @@ class PocketBaseClient:
         Returns:
             List of records
         """
+        # Only the items are returned, so skip the server-side COUNT; the SDK
+        # already builds a fresh list per call, so it is returned without a copy
         result = self.client.collection(collection).get_list(
-            page=page, per_page=per_page, query_params={"filter": filter, "sort": sort}
+            page=page,
+            per_page=per_page,
+            query_params={"filter": filter, "sort": sort, "skipTotal": 1},
         )
-        return list(result.items)
+        return result.items
 
     def get_full_list(
-        self, collection: str, filter: Optional[str] = None, sort: Optional[str] = None
+        self,
+        collection: str,
+        filter: Optional[str] = None,
+        sort: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> List[Record]:
         """
         Get all records from a collection (auto-paginated).
@@ -143,13 +400,57 @@ class PocketBaseClient:
             collection: Collection name
             filter: PocketBase filter expression
             sort: Sort expression
+            fields: Optional comma-separated fields projection
 
         Returns:
             List of all records
         """
-        return self.client.collection(collection).get_full_list(
-            query_params={"filter": filter, "sort": sort}
-        )
+        return list(self.iter_full_list(collection, filter=filter, sort=sort, fields=fields))
+
+    def iter_full_list(
+        self,
+        collection: str,
+        filter: Optional[str] = None,
+        sort: Optional[str] = None,
+        fields: Optional[str] = None,
+        per_page: int = FULL_LIST_PAGE_SIZE,
+    ) -> Iterator[Record]:
+        """
+        Iterate over all records of a collection, page by page.
+
+        Pages are requested with skipTotal (no COUNT query per page), and the
+        next page is fetched on a background thread while the caller consumes
+        the current one, so only about two pages are resident at a time.
+
+        Args:
+            collection: Collection name
+            filter: PocketBase filter expression
+            sort: Sort expression
+            fields: Optional comma-separated fields projection
+            per_page: Records per request
+
+        Yields:
+            Records in sort order
+        """
+        service = self.client.collection(collection)
+        query_params: Dict[str, Any] = {"filter": filter, "sort": sort, "skipTotal": 1}
+        if fields:
+            query_params["fields"] = fields
+
+        def fetch(page: int) -> List[Record]:
+            return service.get_list(page, per_page, query_params).items
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = 1
+            items = fetch(page)
+            while True:
+                # A short page is the last one (skipTotal leaves no total to compare)
+                next_items = executor.submit(fetch, page + 1) if len(items) == per_page else None
+                yield from items
+                if next_items is None:
+                    return
+                page += 1
+                items = next_items.result()
 
     def get_first_list_item(
         self, collection: str, filter: str, sort: Optional[str] = None
@@ -218,13 +519,14 @@ class PocketBaseClient:
         Returns:
             True if at least one record matches
         """
-        try:
-            self.get_first_list_item(collection, filter)
-            return True
-        except ClientResponseError as e:
-            if e.status == 404:
-                return False
-            raise
+        # An empty one-item page means no match; no 404 to raise and catch, no
+        # COUNT query (skipTotal) and only the id is returned
+        result = self.client.collection(collection).get_list(
+            page=1,
+            per_page=1,
+            query_params={"filter": filter, "fields": "id", "skipTotal": 1},
+        )
+        return bool(result.items)
 
     def count(self, collection: str, filter: Optional[str] = None) -> int:
         """
@@ -242,8 +544,84 @@ class PocketBaseClient:
         )
         return result.total_items
 
+    def count_and_last_updated(
+        self, collection: str, filter: Optional[str] = None
+    ) -> Tuple[int, Optional[str]]:
+        """
+        Count matching records and get the most recent "updated" timestamp.
+
+        Both values come from a single one-item list request, which makes them
+        a cheap change marker for a filtered set of records. "updated" is the
+        raw millisecond string (see list_change_marker).
+
+        Args:
+            collection: Collection name
+            filter: Optional filter expression
+
+        Returns:
+            Tuple of (number of records, latest "updated" string or None)
+        """
+        return list_change_marker(self.client, collection, filter)
+
+    def sum_field(
+        self, collection: str, field: str, filter: Optional[str] = None
+    ) -> Tuple[float, int]:
+        """
+        Sum a numeric field across all matching records.
+
+        PocketBase has no aggregate endpoint, so only the summed field is
+        requested (fields projection) to keep the payload and decoding small.
+
+        Args:
+            collection: Collection name
+            field: Numeric field to sum (e.g., "duration_hours")
+            filter: Optional filter expression
+
+        Returns:
+            Tuple of (sum, number of matching records)
+        """
+        total = 0.0
+        count = 0
+        for record in self.iter_full_list(collection, filter=filter, fields=field):
+            total += float(getattr(record, field, 0) or 0)
+            count += 1
+        return total, count
+
+    def filter(self, raw: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build a filter expression with bound {:name} placeholders.
+
+        String values are quoted and escaped by the SDK, so request input can be
+        bound without hand-built quoting.
+
+        Args:
+            raw: Filter with placeholders (e.g., "week_start >= {:start}")
+            params: Placeholder values
+
+        Returns:
+            Filter expression
+        """
+        return self.client.filter(raw, params)
+
     # Collection-specific helpers
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def month_filter(field: str, year: int, month: int) -> str:
+        """
+        Build a filter selecting records whose datetime field falls in a month.
+
+        Args:
+            field: Datetime field name (e.g., "block_start")
+            year: Year
+            month: Month (1-12)
+
+        Returns:
+            Half-open range filter (start inclusive, next month exclusive)
+        """
+        start, end = _month_bounds(year, month)
+        return f'{field} >= "{start}" && {field} < "{end}"'
+
     def get_setting(self, key: str) -> Any:
         """
         Get a setting value by key.
@@ -257,20 +635,8 @@ class PocketBaseClient:
         Raises:
             ClientResponseError: If setting not found
         """
-        record = self.get_first_list_item(self.COLLECTION_SETTINGS, f'key="{key}"')
-        value = record.value
-        type_str = record.type
-
-        # Parse based on type
-        if type_str == "number":
-            try:
-                return int(value)
-            except ValueError:
-                return float(value)
-        elif type_str == "boolean":
-            return value.lower() in ("true", "1", "yes", "on")
-        else:
-            return value
+        record = self.get_first_list_item(self.COLLECTION_SETTINGS, key_filter(key))
+        return parse_setting_value(record.value, record.type)
 
     def update_setting(self, key: str, value: Any) -> Record:
         """
@@ -283,8 +649,57 @@ class PocketBaseClient:
         Returns:
             Updated setting record
         """
-        record = self.get_first_list_item(self.COLLECTION_SETTINGS, f'key="{key}"')
-        return self.update(self.COLLECTION_SETTINGS, record.id, {"value": str(value)})
+        data = {"value": str(value)}
+        try:
+            return self.update(self.COLLECTION_SETTINGS, self._setting_id(key), data)
+        except ClientResponseError as e:
+            if e.status != 404:
+                raise
+            # The record was deleted or recreated since the index was loaded
+            self._setting_ids = None
+            return self.update(self.COLLECTION_SETTINGS, self._setting_id(key), data)
+
+    def _setting_id(self, key: str) -> str:
+        """
+        Resolve a setting key to its record ID.
+
+        The key -> ID index is loaded with one full-list request and reused, so
+        each update_setting() costs a single PATCH instead of a lookup plus PATCH.
+
+        Raises:
+            ClientResponseError: If the setting does not exist
+        """
+        if self._setting_ids is None:
+            self._setting_ids = {
+                record.key: record.id
+                for record in self.get_full_list(self.COLLECTION_SETTINGS)
+            }
+
+        record_id = self._setting_ids.get(key)
+        if record_id is None:
+            # Not in the index (e.g. seeded later): look it up, raising 404 if absent
+            record_id = self.get_first_list_item(self.COLLECTION_SETTINGS, key_filter(key)).id
+            self._setting_ids[key] = record_id
+        return record_id
+
+    @staticmethod
+    def _raw_event_data(
+        source: str,
+        source_id: str,
+        timestamp: datetime,
+        duration_minutes: int,
+        description: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Build the raw_events record payload"""
+        return {
+            "source": source,
+            "source_id": source_id,
+            "timestamp": timestamp.isoformat(),
+            "duration_minutes": duration_minutes,
+            "description": description,
+            "metadata": metadata or {},
+        }
 
     def create_raw_event(
         self,
@@ -310,20 +725,57 @@ class PocketBaseClient:
             Created raw_events record
         """
         return self.create(
+            self.COLLECTION_RAW_EVENTS,
+            self._raw_event_data(
+                source, source_id, timestamp, duration_minutes, description, metadata
+            ),
+        )
+
+    def create_raw_events(
+        self, source: str, events: List[Dict[str, Any]]
+    ) -> List[Record]:
+        """
+        Create several raw event records concurrently.
+
+        Args:
+            source: Source name
+            events: One dict per event with the create_raw_event keyword
+                arguments (source_id, timestamp, duration_minutes,
+                description, metadata)
+
+        Returns:
+            Created raw_events records, in the same order as events
+        """
+        return self.bulk_create(
+            self.COLLECTION_RAW_EVENTS,
+            [self._raw_event_data(source, **event) for event in events],
+        )
+
+    def update_raw_events(
+        self, source: str, events: Dict[str, Dict[str, Any]]
+    ) -> List[Record]:
+        """
+        Overwrite several raw event records concurrently.
+
+        Args:
+            source: Source name
+            events: create_raw_event keyword arguments, keyed by the ID of
+                the raw_events record to overwrite
+
+        Returns:
+            Updated raw_events records
+        """
+        return self.bulk_update(
             self.COLLECTION_RAW_EVENTS,
             {
-                "source": source,
-                "source_id": source_id,
-                "timestamp": timestamp.isoformat(),
-                "duration_minutes": duration_minutes,
-                "description": description,
-                "metadata": metadata or {},
+                record_id: self._raw_event_data(source, **event)
+                for record_id, event in events.items()
             },
         )
 
     def get_raw_events_by_source(
         self, source: str, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
-    ) -> List[Record]:
+    ) -> Iterator[Record]:
         """
         Get raw events from a specific source within date range.
 
@@ -333,9 +785,9 @@ class PocketBaseClient:
             end_date: Optional end date filter
 
         Returns:
-            List of raw event records
+            Iterator over raw event records, fetched page by page
         """
-        filters = [f'source="{source}"']
+        filters = [f'source="{escape_filter_value(source)}"']
 
         if start_date:
             filters.append(f'timestamp>="{start_date.isoformat()}"')
@@ -343,11 +795,11 @@ class PocketBaseClient:
             filters.append(f'timestamp<="{end_date.isoformat()}"')
 
         filter_str = " && ".join(filters)
-        return self.get_full_list(self.COLLECTION_RAW_EVENTS, filter=filter_str, sort="+timestamp")
+        return self.iter_full_list(self.COLLECTION_RAW_EVENTS, filter=filter_str, sort="+timestamp")
 
     def get_raw_events_for_week(
         self, week_start: datetime, week_end: datetime
-    ) -> List[Record]:
+    ) -> Iterator[Record]:
         """
         Get all raw events for a work week.
 
@@ -356,10 +808,34 @@ class PocketBaseClient:
             week_end: End of work week
 
         Returns:
-            List of raw event records
+            Iterator over raw event records, fetched page by page
         """
-        filter_str = f'timestamp>="{week_start.isoformat()}" && timestamp<="{week_end.isoformat()}"'
-        return self.get_full_list(self.COLLECTION_RAW_EVENTS, filter=filter_str, sort="+timestamp")
+        return self.iter_full_list(
+            self.COLLECTION_RAW_EVENTS,
+            filter=timestamp_range_filter(week_start, week_end),
+            sort="+timestamp",
+        )
+
+    @staticmethod
+    def _time_block_data(
+        week_start: datetime,
+        block_start: datetime,
+        block_end: datetime,
+        source: str,
+        description: str,
+        duration_hours: float,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Build the time_blocks record payload"""
+        return {
+            "week_start": week_start.isoformat(),
+            "block_start": block_start.isoformat(),
+            "block_end": block_end.isoformat(),
+            "source": source,
+            "description": description,
+            "duration_hours": duration_hours,
+            "metadata": metadata or {},
+        }
 
     def create_time_block(
         self,
@@ -388,15 +864,29 @@ class PocketBaseClient:
         """
         return self.create(
             self.COLLECTION_TIME_BLOCKS,
-            {
-                "week_start": week_start.isoformat(),
-                "block_start": block_start.isoformat(),
-                "block_end": block_end.isoformat(),
-                "source": source,
-                "description": description,
-                "duration_hours": duration_hours,
-                "metadata": metadata or {},
-            },
+            self._time_block_data(
+                week_start, block_start, block_end, source, description, duration_hours, metadata
+            ),
+        )
+
+    def create_time_blocks(
+        self, week_start: datetime, blocks: List[Dict[str, Any]]
+    ) -> List[Record]:
+        """
+        Create several time block records concurrently.
+
+        Args:
+            week_start: Start of the work week
+            blocks: One dict per block with the create_time_block keyword
+                arguments (block_start, block_end, source, description,
+                duration_hours, metadata)
+
+        Returns:
+            Created time_blocks records, in the same order as blocks
+        """
+        return self.bulk_create(
+            self.COLLECTION_TIME_BLOCKS,
+            [self._time_block_data(week_start, **block) for block in blocks],
         )
 
     def get_time_blocks_for_week(self, week_start: datetime) -> List[Record]:
@@ -432,28 +922,15 @@ class PocketBaseClient:
             Week summary record
         """
         filter_str = f'week_start="{week_start.isoformat()}"'
+        data = {"total_hours": total_hours, "metadata": metadata or {}}
 
-        try:
-            record = self.get_first_list_item(self.COLLECTION_WEEK_SUMMARIES, filter_str)
-            # Update existing record
-            return self.update(
-                self.COLLECTION_WEEK_SUMMARIES,
-                record.id,
-                {
-                    "total_hours": total_hours,
-                    "metadata": metadata or {},
-                },
-            )
-        except ClientResponseError as e:
-            if e.status == 404:
-                # Create new summary
-                return self.create(
-                    self.COLLECTION_WEEK_SUMMARIES,
-                    {
-                        "week_start": week_start.isoformat(),
-                        "total_hours": total_hours,
-                        "metadata": metadata or {},
-                    },
-                )
-            raise
+        # A one-item page is empty rather than a 404 when no summary exists yet
+        existing = self.get_list(self.COLLECTION_WEEK_SUMMARIES, per_page=1, filter=filter_str)
+        if existing:
+            return self.update(self.COLLECTION_WEEK_SUMMARIES, existing[0].id, data)
+
+        return self.create(
+            self.COLLECTION_WEEK_SUMMARIES,
+            {"week_start": week_start.isoformat(), **data},
+        )
 
@@ -7,14 +7,36 @@ Exports monthly timesheets in multiple formats:
 - Excel (XLSX format)
 """
 
+import csv
+import hashlib
 import os
 import tempfile
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Tuple
+import threading
+import time
+from datetime import datetime
+from html import escape
+from io import StringIO
+from itertools import repeat
+from typing import List, Dict, Any, Callable, Iterator, Optional, Sequence, TextIO, Tuple
 from pathlib import Path
 
 from app.pocketbase_client import PocketBaseClient
 from app.config import Config
+from app.utils.time_utils import format_iso_date_de
+
+
+# Fallback description per block source, built from the block's metadata
+_SOURCE_DESCRIPTION_FORMATTERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "wakatime": lambda metadata: f"Development: {metadata.get('project', 'Coding')}",
+    "calendar": lambda metadata: "Meeting: " + metadata.get("summary", "Calendar Event"),
+    "gmail": lambda metadata: "Email: " + metadata.get("subject", "Email"),
+    "github": lambda metadata: "Development: GitHub",
+    "cloud_events": lambda metadata: "Development: Claude Code",
+    "auto_fill": lambda metadata: "Development: General",
+}
+
+# Formatted export rows as columns: (numbers, dates, hours, descriptions)
+ExportColumns = Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[float, ...], Tuple[str, ...]]
 
 
 class MonthlyExporter:
@@ -28,8 +50,23 @@ class MonthlyExporter:
     - Date format: DD.MM.YYYY
     - Hours in 0.5 increments
     - Location: Remote
+
+    Rendered exports are cached on disk per month and rebuilt only when the
+    month's time blocks (or the export title) change.
     """
 
+    # File extension per export format
+    FORMAT_EXTENSIONS = {"html": "html", "csv": "csv", "excel": "xlsx"}
+
+    # Number of months whose fetched time blocks are kept in memory
+    BLOCKS_CACHE_MONTHS = 12
+
+    # Seconds a superseded export file is kept for requests still serving it
+    STALE_RENDER_TTL_SECONDS = 600
+
+    # time_blocks columns the exports read
+    BLOCK_FIELDS = "block_start,duration_hours,description,source,metadata"
+
     def __init__(self, pb_client: PocketBaseClient, config: Config):
         """
         Initialize monthly exporter.
@@ -40,6 +77,24 @@ class MonthlyExporter:
         """
         self.pb_client = pb_client
         self.config = config
+        self.cache_dir = Path(config.export_cache_dir)
+        # (year, month) -> (fingerprint, blocks): exporting a month in another
+        # format reuses the blocks while the month's fingerprint is unchanged
+        self._blocks_cache: Dict[Tuple[int, int], Tuple[str, List[Dict[str, Any]]]] = {}
+        self._blocks_cache_lock = threading.Lock()
+        # (blocks, columns) of the most recently formatted block list
+        self._columns_cache: Optional[Tuple[List[Dict[str, Any]], ExportColumns]] = None
+
+    def _month_filter(self, year: int, month: int) -> str:
+        """Build the PocketBase filter selecting a month's time blocks."""
+        return self.pb_client.month_filter("block_start", year, month)
+
+    def _get_export_name(self) -> str:
+        """Get the export title name from settings (defaults to "Koni")."""
+        try:
+            return self.config.settings.export.export_title_name
+        except:
+            return "Koni"
 
     def _get_month_blocks(self, year: int, month: int) -> List[Dict[str, Any]]:
         """
@@ -52,40 +107,50 @@ class MonthlyExporter:
         Returns:
             List of time block dictionaries sorted by date
         """
-        # Get start and end of month
-        start_date = datetime(year, month, 1)
-
-        # Get end of month
-        if month == 12:
-            end_date = datetime(year + 1, 1, 1) - timedelta(days=1)
-        else:
-            end_date = datetime(year, month + 1, 1) - timedelta(days=1)
-
-        # Fetch time blocks
-        filter_str = (
-            f'block_start >= "{start_date.isoformat()}" && '
-            f'block_start <= "{end_date.replace(hour=23, minute=59, second=59).isoformat()}"'
-        )
+        filter_str = self._month_filter(year, month)
 
+        # Only request the columns the exports read
         time_blocks = self.pb_client.get_full_list(
             self.pb_client.COLLECTION_TIME_BLOCKS,
             filter=filter_str,
-            sort="+block_start"
+            sort="+block_start",
+            fields=self.BLOCK_FIELDS,
         )
 
-        # Convert to dict list
-        blocks_list = []
-        for block in time_blocks:
-            if hasattr(block, "__dict__"):
-                block_dict = {
-                    k: v for k, v in block.__dict__.items()
-                    if not k.startswith("_")
-                }
-            else:
-                block_dict = dict(block)
-            blocks_list.append(block_dict)
+        # Convert to dict list (all records share a shape, so check it once);
+        # Record keeps no private attributes, so a shallow copy is enough
+        if time_blocks and not hasattr(time_blocks[0], "__dict__"):
+            return [dict(block) for block in time_blocks]
+        return [dict(vars(block)) for block in time_blocks]
 
-        return blocks_list
+    def _get_month_blocks_cached(
+        self, year: int, month: int, fingerprint: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch a month's time blocks, reusing the last fetch if the fingerprint matches.
+
+        Args:
+            year: Year
+            month: Month (1-12)
+            fingerprint: Current month fingerprint (see get_month_fingerprint)
+
+        Returns:
+            List of time block dictionaries sorted by date (treat as read-only)
+        """
+        key = (year, month)
+        with self._blocks_cache_lock:
+            cached = self._blocks_cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        blocks = self._get_month_blocks(year, month)
+
+        with self._blocks_cache_lock:
+            self._blocks_cache.pop(key, None)
+            self._blocks_cache[key] = (fingerprint, blocks)
+            while len(self._blocks_cache) > self.BLOCKS_CACHE_MONTHS:
+                del self._blocks_cache[next(iter(self._blocks_cache))]
+        return blocks
 
     def _format_block_description(self, block: Dict[str, Any]) -> str:
         """
@@ -97,54 +162,93 @@ class MonthlyExporter:
         Returns:
             Formatted description string
         """
-        description = block.get("description", "")
-
-        # Add source context if available
-        source = block.get("source", "")
-        metadata = block.get("metadata", {})
-
         # Already formatted descriptions can be returned as-is
+        description = block.get("description", "")
         if description:
             return description
 
         # Fallback formatting based on source
-        if source == "wakatime":
-            project = metadata.get("project", "Coding")
-            return f"Development: {project}"
-        elif source == "calendar":
-            return "Meeting: " + metadata.get("summary", "Calendar Event")
-        elif source == "gmail":
-            return "Email: " + metadata.get("subject", "Email")
-        elif source == "github":
-            return "Development: GitHub"
-        elif source == "cloud_events":
-            return "Development: Claude Code"
-        elif source == "auto_fill":
-            return "Development: General"
-        else:
+        formatter = _SOURCE_DESCRIPTION_FORMATTERS.get(block.get("source", ""))
+        if formatter is None:
             return "Development: Other"
+        return formatter(block.get("metadata", {}))
+
+    def _iter_export_rows(
+        self, blocks: List[Dict[str, Any]]
+    ) -> Iterator[Tuple[str, str, float, str]]:
+        """
+        Format time blocks into the export row values shared by all formats.
+
+        Dates are formatted from the ISO string prefix (cached per day), so no
+        datetime is parsed per block.
+
+        Args:
+            blocks: Time block dictionaries sorted by date
+
+        Yields:
+            Tuples of (number, date, hours, description)
+        """
+        for idx, block in enumerate(blocks, start=1):
+            block_start = block.get("block_start", "")
+            if isinstance(block_start, str):
+                try:
+                    date_str = format_iso_date_de(block_start)
+                except ValueError:
+                    date_str = datetime.now().strftime("%d.%m.%Y")
+            else:
+                date_str = block_start.strftime("%d.%m.%Y")
+
+            hours = float(block.get("duration_hours", 0))
+            yield f"{idx:04d}", date_str, hours, self._format_block_description(block)
+
+    def _export_columns(self, blocks: List[Dict[str, Any]]) -> ExportColumns:
+        """
+        Format time blocks once into columns shared by all export formats.
+
+        The columns of the most recently formatted block list are kept, so
+        rendering a cached month in several formats formats its rows once.
+
+        Args:
+            blocks: Time block dictionaries sorted by date
+
+        Returns:
+            Tuple of (numbers, dates, hours, descriptions) column tuples
+        """
+        with self._blocks_cache_lock:
+            cached = self._columns_cache
+        if cached is not None and cached[0] is blocks:
+            return cached[1]
+
+        rows = list(self._iter_export_rows(blocks))
+        columns: ExportColumns = tuple(zip(*rows)) if rows else ((), (), (), ())
 
-    def export_html(self, year: int, month: int) -> str:
+        with self._blocks_cache_lock:
+            self._columns_cache = (blocks, columns)
+        return columns
+
+    def export_html(
+        self, year: int, month: int, blocks: Optional[List[Dict[str, Any]]] = None
+    ) -> str:
         """
         Export timesheet as HTML.
 
         Args:
             year: Year
             month: Month (1-12)
+            blocks: Pre-fetched time blocks (fetched from PocketBase if omitted)
 
         Returns:
             HTML string
         """
-        blocks = self._get_month_blocks(year, month)
+        if blocks is None:
+            blocks = self._get_month_blocks(year, month)
 
-        # Get export name from settings
-        try:
-            export_name = self.config.settings.export.export_title_name
-        except:
-            export_name = "Koni"
+        # Get export name from settings (escaped for HTML)
+        export_name = escape(self._get_export_name())
 
-        # Calculate total hours
-        total_hours = sum(float(block.get("duration_hours", 0)) for block in blocks)
+        # Formatted columns; the total is needed before the rows are written
+        numbers, dates, hours_column, descriptions = self._export_columns(blocks)
+        total_hours = sum(hours_column)
 
         # Get month name
         month_names = [
@@ -153,8 +257,8 @@ class MonthlyExporter:
         ]
         month_name = month_names[month - 1]
 
-        # Generate HTML
-        html = f"""<!DOCTYPE html>
+        # Generate HTML as a list of parts joined once at the end
+        parts = [f"""<!DOCTYPE html>
 <html lang="de">
 <head>
     <meta charset="UTF-8">
@@ -230,44 +334,27 @@ class MonthlyExporter:
             </tr>
         </thead>
         <tbody>
-"""
-
-        # Add rows
-        for idx, block in enumerate(blocks, start=1):
-            # Parse block_start
-            block_start = block.get("block_start", "")
-            if isinstance(block_start, str):
-                try:
-                    block_date = datetime.fromisoformat(block_start.replace("Z", "+00:00"))
-                except:
-                    block_date = datetime.now()
-            else:
-                block_date = block_start
-
-            # Format date as DD.MM.YYYY
-            date_str = block_date.strftime("%d.%m.%Y")
-
-            # Get hours
-            hours = float(block.get("duration_hours", 0))
-
-            # Get description
-            description = self._format_block_description(block)
-
-            # Get location (always Remote)
-            location = "Remote"
-
-            # Add row
-            html += f"""            <tr>
-                <td class="number">{idx:04d}</td>
+"""]
+
+        # Add rows (location is always Remote). Descriptions come from source
+        # APIs (commit messages, email subjects), so they are HTML-escaped;
+        # they repeat a lot within a month, so each distinct one is escaped once.
+        escaped: Dict[str, str] = {}
+        for number, date_str, hours, description in zip(numbers, dates, hours_column, descriptions):
+            safe_description = escaped.get(description)
+            if safe_description is None:
+                safe_description = escaped[description] = escape(description)
+            parts.append(f"""            <tr>
+                <td class="number">{number}</td>
                 <td>{date_str}</td>
                 <td class="hours">{hours:.1f}</td>
-                <td>{description}</td>
-                <td>{location}</td>
+                <td>{safe_description}</td>
+                <td>Remote</td>
             </tr>
-"""
+""")
 
         # Add total row
-        html += f"""            <tr class="total-row">
+        parts.append(f"""            <tr class="total-row">
                 <td colspan="2"><strong>Gesamt:</strong></td>
                 <td class="hours"><strong>{total_hours:.1f}</strong></td>
                 <td colspan="2"></td>
@@ -276,9 +363,9 @@ class MonthlyExporter:
     </table>
 </body>
 </html>
-"""
+""")
 
-        return html
+        return "".join(parts)
 
     def export_csv(self, year: int, month: int) -> str:
         """
@@ -291,78 +378,95 @@ class MonthlyExporter:
         Returns:
             CSV string
         """
-        import csv
-        from io import StringIO
-
-        blocks = self._get_month_blocks(year, month)
-
-        # Calculate total hours
-        total_hours = sum(float(block.get("duration_hours", 0)) for block in blocks)
-
         output = StringIO()
-        writer = csv.writer(output)
-
-        # Write header
-        writer.writerow(["Nr.", "Datum", "Stunden", "Beschreibung", "Ort"])
+        self.write_csv(year, month, output)
+        return output.getvalue()
 
-        # Write data rows
-        for idx, block in enumerate(blocks, start=1):
-            # Parse block_start
-            block_start = block.get("block_start", "")
-            if isinstance(block_start, str):
-                try:
-                    block_date = datetime.fromisoformat(block_start.replace("Z", "+00:00"))
-                except:
-                    block_date = datetime.now()
-            else:
-                block_date = block_start
+    def write_csv(
+        self,
+        year: int,
+        month: int,
+        output: TextIO,
+        blocks: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Write timesheet CSV rows directly to a text stream.
 
-            # Format date as DD.MM.YYYY
-            date_str = block_date.strftime("%d.%m.%Y")
+        Args:
+            year: Year
+            month: Month (1-12)
+            output: Writable text stream (open files should use newline="")
+            blocks: Pre-fetched time blocks (fetched from PocketBase if omitted)
+        """
+        csv.writer(output).writerows(self.export_csv_rows(year, month, blocks))
 
-            # Get hours
-            hours = float(block.get("duration_hours", 0))
+    def export_csv_rows(
+        self, year: int, month: int, blocks: Optional[List[Dict[str, Any]]] = None
+    ) -> Iterator[Sequence[str]]:
+        """
+        Generate timesheet CSV rows one at a time.
 
-            # Get description
-            description = self._format_block_description(block)
+        Rows are produced lazily (header, one row per block, total row), so
+        writers never hold the formatted export in memory.
 
-            # Get location
-            location = "Remote"
+        Args:
+            year: Year
+            month: Month (1-12)
+            blocks: Pre-fetched time blocks (fetched from PocketBase if omitted)
 
-            writer.writerow([f"{idx:04d}", date_str, f"{hours:.1f}", description, location])
+        Yields:
+            CSV row values
+        """
+        if blocks is None:
+            blocks = self._get_month_blocks(year, month)
 
-        # Write total row
-        writer.writerow(["Gesamt:", "", f"{total_hours:.1f}", "", ""])
+        # Header
+        yield ["Nr.", "Datum", "Stunden", "Beschreibung", "Ort"]
 
-        return output.getvalue()
+        # Data rows, zipped from the formatted columns (location is always Remote)
+        numbers, dates, hours_column, descriptions = self._export_columns(blocks)
+        yield from zip(
+            numbers, dates, map("{:.1f}".format, hours_column), descriptions, repeat("Remote")
+        )
 
-    def export_excel(self, year: int, month: int) -> str:
+        # Total row
+        yield ["Gesamt:", "", f"{sum(hours_column):.1f}", "", ""]
+
+    def export_excel(
+        self,
+        year: int,
+        month: int,
+        blocks: Optional[List[Dict[str, Any]]] = None,
+        output_path: Optional[str] = None,
+    ) -> str:
         """
         Export timesheet as Excel file.
 
         Args:
             year: Year
             month: Month (1-12)
+            blocks: Pre-fetched time blocks (fetched from PocketBase if omitted)
+            output_path: File to write (a new temporary file if omitted)
 
         Returns:
-            Path to temporary Excel file
+            Path to the written Excel file
         """
         try:
             from openpyxl import Workbook
-            from openpyxl.styles import Font, Alignment, PatternFill
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Font, PatternFill
         except ImportError:
             raise ImportError("openpyxl is required for Excel export. Install with: uv add openpyxl")
 
-        blocks = self._get_month_blocks(year, month)
+        if blocks is None:
+            blocks = self._get_month_blocks(year, month)
 
         # Get export name from settings
-        try:
-            export_name = self.config.settings.export.export_title_name
-        except:
-            export_name = "Koni"
+        export_name = self._get_export_name()
 
-        # Calculate total hours
-        total_hours = sum(float(block.get("duration_hours", 0)) for block in blocks)
+        # Formatted columns; the total is needed before the rows are written
+        numbers, dates, hours_column, descriptions = self._export_columns(blocks)
+        total_hours = sum(hours_column)
 
         # Get month name
         month_names = [
@@ -371,82 +475,167 @@ class MonthlyExporter:
         ]
         month_name = month_names[month - 1]
 
-        # Create workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = f"{month_name} {year}"
+        # Create a write-only workbook: rows are streamed to the file in order
+        # instead of being kept as a grid of Cell objects
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(title=f"{month_name} {year}")
+
+        # Column widths must be set before any row is written
+        ws.column_dimensions["A"].width = 10
+        ws.column_dimensions["B"].width = 15
+        ws.column_dimensions["C"].width = 12
+        ws.column_dimensions["D"].width = 50
+        ws.column_dimensions["E"].width = 12
+
+        # Shared styles
+        bold = Font(bold=True)
+        header_fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
+        total_fill = PatternFill(start_color="E8E8E8", end_color="E8E8E8", fill_type="solid")
+
+        def styled(value: Any, font: Font, fill: Optional[PatternFill] = None) -> WriteOnlyCell:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.font = font
+            if fill is not None:
+                cell.fill = fill
+            return cell
 
         # Title
-        ws["A1"] = f"Zeiterfassung - {export_name}"
-        ws["A1"].font = Font(size=16, bold=True)
+        ws.append([styled(f"Zeiterfassung - {export_name}", Font(size=16, bold=True))])
 
         # Info
-        ws["A2"] = f"Monat: {month_name} {year}"
-        ws["A3"] = f"Erstellt am: {datetime.now().strftime('%d.%m.%Y %H:%M')} | Gesamt: {total_hours:.1f} Stunden"
+        ws.append([f"Monat: {month_name} {year}"])
+        ws.append([f"Erstellt am: {datetime.now().strftime('%d.%m.%Y %H:%M')} | Gesamt: {total_hours:.1f} Stunden"])
+        ws.append([])
 
         # Headers
         headers = ["Nr.", "Datum", "Stunden", "Beschreibung", "Ort"]
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=5, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
+        ws.append([styled(header, bold, header_fill) for header in headers])
 
         # Data rows
-        row = 6
-        for idx, block in enumerate(blocks, start=1):
-            # Parse block_start
-            block_start = block.get("block_start", "")
-            if isinstance(block_start, str):
-                try:
-                    block_date = datetime.fromisoformat(block_start.replace("Z", "+00:00"))
-                except:
-                    block_date = datetime.now()
-            else:
-                block_date = block_start
+        for row in zip(numbers, dates, hours_column, descriptions, repeat("Remote")):
+            ws.append(row)
 
-            # Format date as DD.MM.YYYY
-            date_str = block_date.strftime("%d.%m.%Y")
+        # Total row (bold and shaded across all columns)
+        ws.append([
+            styled(value, bold, total_fill)
+            for value in ("Gesamt:", None, total_hours, None, None)
+        ])
 
-            # Get hours
-            hours = float(block.get("duration_hours", 0))
+        if output_path is None:
+            # Save to temporary file
+            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx")
+            temp_file.close()
+            output_path = temp_file.name
 
-            # Get description
-            description = self._format_block_description(block)
+        wb.save(output_path)
+        return output_path
 
-            # Get location
-            location = "Remote"
+    def _get_month_state(self, year: int, month: int) -> Tuple[int, str]:
+        """
+        Get a month's block count and export fingerprint in one request.
 
-            ws.cell(row=row, column=1, value=f"{idx:04d}")
-            ws.cell(row=row, column=2, value=date_str)
-            ws.cell(row=row, column=3, value=hours)
-            ws.cell(row=row, column=4, value=description)
-            ws.cell(row=row, column=5, value=location)
+        Args:
+            year: Year
+            month: Month (1-12)
 
-            row += 1
+        Returns:
+            Tuple of (block count, fingerprint)
+        """
+        count, last_updated = self.pb_client.count_and_last_updated(
+            self.pb_client.COLLECTION_TIME_BLOCKS,
+            filter=self._month_filter(year, month),
+        )
+        marker = f"{count}|{last_updated}|{self._get_export_name()}"
+        return count, hashlib.sha256(marker.encode("utf-8")).hexdigest()[:16]
 
-        # Total row
-        ws.cell(row=row, column=1, value="Gesamt:")
-        ws.cell(row=row, column=1).font = Font(bold=True)
-        ws.cell(row=row, column=3, value=total_hours)
-        ws.cell(row=row, column=3).font = Font(bold=True)
-
-        # Make total row bold
-        for col in range(1, 6):
-            ws.cell(row=row, column=col).font = Font(bold=True)
-            ws.cell(row=row, column=col).fill = PatternFill(
-                start_color="E8E8E8", end_color="E8E8E8", fill_type="solid"
-            )
-
-        # Adjust column widths
-        ws.column_dimensions["A"].width = 10
-        ws.column_dimensions["B"].width = 15
-        ws.column_dimensions["C"].width = 12
-        ws.column_dimensions["D"].width = 50
-        ws.column_dimensions["E"].width = 12
+    def get_month_fingerprint(self, year: int, month: int) -> str:
+        """
+        Compute a fingerprint of everything a month's export depends on.
+
+        Uses the block count and latest "updated" timestamp (one small
+        PocketBase request) plus the export title name.
+
+        Args:
+            year: Year
+            month: Month (1-12)
 
-        # Save to temporary file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx")
-        wb.save(temp_file.name)
-        temp_file.close()
+        Returns:
+            Short hex digest, suitable as an ETag
+        """
+        return self._get_month_state(year, month)[1]
+
+    def get_or_build(self, year: int, month: int, fmt: str) -> Tuple[Path, str]:
+        """
+        Get a cached export file, rendering it only if the month changed.
+
+        Args:
+            year: Year
+            month: Month (1-12)
+            fmt: Export format (html, csv, or excel)
 
-        return temp_file.name
+        Returns:
+            Tuple of (path to export file, fingerprint used as ETag)
+        """
+        extension = self.FORMAT_EXTENSIONS[fmt]
+        count, fingerprint = self._get_month_state(year, month)
+        prefix = f"{year:04d}-{month:02d}-"
+        path = self.cache_dir / f"{prefix}{fingerprint}.{extension}"
+
+        if path.exists():
+            return path, fingerprint
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # An empty month needs no block query, only the header and total
+        if count == 0:
+            blocks: List[Dict[str, Any]] = []
+        else:
+            blocks = self._get_month_blocks_cached(year, month, fingerprint)
+
+        # Render to a temp file in the cache dir (same filesystem), then
+        # atomically rename it into place so no reader sees a partial file.
+        # The ".tmp" suffix keeps it out of the render globs below.
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=f".{extension}.tmp")
+        try:
+            if fmt == "excel":
+                os.close(fd)
+                self.export_excel(year, month, blocks, output_path=temp_path)
+            else:
+                with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+                    if fmt == "csv":
+                        # CSV rows go straight to the file, no intermediate string
+                        self.write_csv(year, month, f, blocks)
+                    else:
+                        f.write(self.export_html(year, month, blocks))
+            os.replace(temp_path, path)
+        finally:
+            # Only still present if rendering failed
+            Path(temp_path).unlink(missing_ok=True)
+
+        self._sweep_superseded_renders(prefix, extension)
+        return path, fingerprint
+
+    def _sweep_superseded_renders(self, prefix: str, extension: str) -> None:
+        """
+        Delete renders of a month and format superseded long enough ago.
+
+        A superseded file may still be streamed to a client that was handed
+        its path, so it is kept until the render that replaced it is
+        STALE_RENDER_TTL_SECONDS old.
+
+        Args:
+            prefix: Month file name prefix ("YYYY-MM-")
+            extension: Export file extension
+        """
+        renders = []
+        for render in self.cache_dir.glob(f"{prefix}*.{extension}"):
+            try:
+                renders.append((render.stat().st_mtime, render))
+            except OSError:
+                # Already removed by a concurrent sweep
+                continue
+        renders.sort()
+
+        cutoff = time.time() - self.STALE_RENDER_TTL_SECONDS
+        for (_, stale), (replaced_at, _) in zip(renders, renders[1:]):
+            if replaced_at < cutoff:
+                stale.unlink(missing_ok=True)
@@ -5,11 +5,12 @@ Abstract base class for all data source fetchers.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from functools import cached_property
+from typing import Iterable, List, Dict, Any, Optional, Set
+from datetime import datetime, timedelta
 from pocketbase.models import Record
 
-from app.pocketbase_client import PocketBaseClient
+from app.pocketbase_client import PocketBaseClient, escape_filter_value
 from app.utils.priority import get_source_priority
 
 
@@ -49,6 +50,9 @@ class BaseFetcher(ABC):
     should inherit from this class and implement the abstract methods.
     """
 
+    # Number of source_ids checked per existing_raw_event_ids() query
+    EXISTS_BATCH_SIZE = 50
+
     def __init__(
         self,
         pb_client: PocketBaseClient,
@@ -86,12 +90,13 @@ class BaseFetcher(ABC):
         """
         pass
 
-    def is_enabled(self) -> bool:
+    @cached_property
+    def enabled(self) -> bool:
         """
-        Check if this fetcher is enabled in settings.
+        Whether this fetcher is enabled in settings.
 
-        Returns:
-            True if enabled, False otherwise
+        Read once per fetcher instance (the scheduler builds a fresh fetcher
+        for every run); call invalidate() to re-read it.
         """
         try:
             enabled = self.pb_client.get_setting(self.enabled_setting_key)
@@ -100,15 +105,13 @@ class BaseFetcher(ABC):
             # If setting not found or error, assume disabled
             return False
 
-    def get_last_fetch_time(self) -> Optional[datetime]:
+    @cached_property
+    def last_fetch_time(self) -> Optional[datetime]:
         """
-        Get timestamp of last successful fetch.
-
-        Returns:
-            Datetime of last fetch, or None if never fetched
+        Timestamp of the most recent raw event from this source.
 
-        Implementation:
-            Queries raw_events collection for most recent event from this source
+        Queried once per fetcher instance and dropped whenever this fetcher
+        creates a raw event; call invalidate() to re-query it.
         """
         try:
             records = self.pb_client.get_list(
@@ -122,12 +125,38 @@ class BaseFetcher(ABC):
             if records:
                 # Parse timestamp from record
                 timestamp_str = records[0].timestamp
-                return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+                return datetime.fromisoformat(timestamp_str)
 
             return None
         except Exception:
             return None
 
+    def invalidate(self) -> None:
+        """Drop the cached enabled flag and last fetch time"""
+        self.__dict__.pop("enabled", None)
+        self.__dict__.pop("last_fetch_time", None)
+
+    def is_enabled(self) -> bool:
+        """
+        Check if this fetcher is enabled in settings.
+
+        Returns:
+            True if enabled, False otherwise
+        """
+        return self.enabled
+
+    def get_last_fetch_time(self) -> Optional[datetime]:
+        """
+        Get timestamp of last successful fetch.
+
+        Returns:
+            Datetime of last fetch, or None if never fetched
+
+        Implementation:
+            Queries raw_events collection for most recent event from this source
+        """
+        return self.last_fetch_time
+
     def create_raw_event(
         self,
         source_id: str,
@@ -149,6 +178,8 @@ class BaseFetcher(ABC):
         Returns:
             Created raw_events record
         """
+        # A new event can move the last fetch time
+        self.__dict__.pop("last_fetch_time", None)
         return self.pb_client.create_raw_event(
             source=self.source_name,
             source_id=source_id,
@@ -168,9 +199,117 @@ class BaseFetcher(ABC):
         Returns:
             True if event exists, False otherwise
         """
-        filter_str = f'source="{self.source_name}" && source_id="{source_id}"'
+        # source_id comes from the external API, so quotes in it must be escaped
+        filter_str = f'source="{self.source_name}" && source_id="{escape_filter_value(source_id)}"'
         return self.pb_client.exists(PocketBaseClient.COLLECTION_RAW_EVENTS, filter_str)
 
+    def existing_raw_event_ids(self, source_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        Find the raw_events records of the given source_ids for this source.
+
+        Checks EXISTS_BATCH_SIZE ids per query instead of one request per
+        event as event_exists() does.
+
+        Args:
+            source_ids: Unique IDs from source system
+
+        Returns:
+            Record ID of every source_id that already has a raw_events record
+        """
+        ids = list(dict.fromkeys(source_ids))
+        existing: Dict[str, str] = {}
+
+        for offset in range(0, len(ids), self.EXISTS_BATCH_SIZE):
+            chunk = ids[offset:offset + self.EXISTS_BATCH_SIZE]
+            id_filter = " || ".join(
+                f'source_id="{escape_filter_value(source_id)}"' for source_id in chunk
+            )
+            records = self.pb_client.iter_full_list(
+                PocketBaseClient.COLLECTION_RAW_EVENTS,
+                filter=f'source="{self.source_name}" && ({id_filter})',
+                fields="id,source_id",
+            )
+            existing.update((record.source_id, record.id) for record in records)
+
+        return existing
+
+    def existing_source_ids(self, source_ids: Iterable[str]) -> Set[str]:
+        """
+        Find which of the given source_ids already exist for this source.
+
+        Args:
+            source_ids: Unique IDs from source system
+
+        Returns:
+            Subset of source_ids that already have a raw_events record
+        """
+        return set(self.existing_raw_event_ids(source_ids))
+
+    def save_new_raw_events(self, events: List[Dict[str, Any]]) -> int:
+        """
+        Create raw events whose source_id is not stored yet.
+
+        Existence is checked with existing_source_ids() (one query per
+        EXISTS_BATCH_SIZE events) instead of one event_exists() request per
+        event. Repeated source_ids within events are created only once.
+
+        Args:
+            events: One dict per event with the create_raw_event keyword
+                arguments (source_id, timestamp, duration_minutes,
+                description, metadata)
+
+        Returns:
+            Number of records created
+        """
+        existing = self.existing_source_ids(event["source_id"] for event in events)
+
+        created = 0
+        for event_data in events:
+            source_id = event_data["source_id"]
+            if source_id not in existing:
+                self.create_raw_event(**event_data)
+                existing.add(source_id)
+                created += 1
+
+        return created
+
+    def create_or_update_raw_events(self, events: List[Dict[str, Any]]) -> int:
+        """
+        Save raw events, overwriting the records of already known source_ids.
+
+        Existing records are looked up in batched queries, then new events
+        are created and known ones updated with concurrent requests. If a
+        source_id occurs more than once, its last event wins.
+
+        Args:
+            events: One dict per event with the create_raw_event keyword
+                arguments (source_id, timestamp, duration_minutes,
+                description, metadata)
+
+        Returns:
+            Number of newly created records
+        """
+        by_source_id = {event["source_id"]: event for event in events}
+        existing = self.existing_raw_event_ids(by_source_id)
+
+        new_events = [
+            event for source_id, event in by_source_id.items() if source_id not in existing
+        ]
+        updated_events = {
+            existing[source_id]: event
+            for source_id, event in by_source_id.items()
+            if source_id in existing
+        }
+
+        # Saved events can move the last fetch time
+        self.__dict__.pop("last_fetch_time", None)
+        if new_events:
+            self.pb_client.create_raw_events(self.source_name, new_events)
+        if updated_events:
+            self.pb_client.update_raw_events(self.source_name, updated_events)
+
+        return len(new_events)
+
     def get_default_date_range(
         self, days_back: int = 7
     ) -> tuple[datetime, datetime]:
@@ -190,13 +329,9 @@ class BaseFetcher(ABC):
 
         if last_fetch:
             # Fetch from last fetch time (with small overlap buffer)
-            from datetime import timedelta
-
             start_date = last_fetch - timedelta(hours=1)
         else:
             # First fetch: go back N days
-            from datetime import timedelta
-
             start_date = end_date - timedelta(days=days_back)
 
         return (start_date, end_date)
@@ -5,18 +5,60 @@ Fetches meeting events from Google Calendar API (high priority source: 80).
 """
 
 import os
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+import threading
+from typing import AbstractSet, List, Dict, Any, Optional
+from datetime import datetime, timedelta, timezone
+import httplib2
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
 
 from app.services.fetchers.base import BaseFetcher, FetchResult
 from app.pocketbase_client import PocketBaseClient
 from app.utils.priority import SOURCE_CALENDAR
 from app.utils.oauth import TokenManager, OAuthToken
 
+# Name under which the Calendar OAuth token is stored
+CALENDAR_TOKEN_NAME = "google_calendar"
+
+# Process-wide cache of loaded credentials (keyed by token name), so each
+# fetch does not re-read the token from storage or refresh a still-valid
+# access token; the lock keeps concurrent fetches from refreshing at once.
+# Dropped when a refresh or an API call is rejected and on re-authorization.
+_credentials_cache: Dict[str, Credentials] = {}
+_credentials_lock = threading.Lock()
+
+
+def clear_credentials_cache() -> None:
+    """
+    Drop the cached Calendar credentials.
+
+    The next fetch reloads the token from storage. Call this after the
+    Calendar OAuth token was re-authorized or revoked.
+    """
+    with _credentials_lock:
+        _credentials_cache.pop(CALENDAR_TOKEN_NAME, None)
+
+
+def _to_rfc3339(value: datetime) -> str:
+    """
+    Format a datetime as an RFC3339 UTC timestamp for the Calendar API.
+
+    Naive datetimes are taken to be UTC; aware ones are converted to UTC.
+
+    Args:
+        value: Datetime to format
+
+    Returns:
+        Timestamp like "2026-01-07T10:00:00Z"
+    """
+    if value.tzinfo is None:
+        return value.isoformat() + "Z"
+    return value.astimezone(timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+
 
 class GoogleCalendarAPI:
     """
@@ -27,6 +69,20 @@ class GoogleCalendarAPI:
 
     SCOPES = ["https://www.googleapis.com/auth/calendar.readonly"]
 
+    # Partial-response masks: only request the properties CalendarFetcher reads
+    CALENDAR_LIST_FIELDS = "items(id,primary)"
+    EVENT_LIST_FIELDS = (
+        "items(id,summary,location,start(dateTime,date),end(dateTime,date),"
+        "organizer/email,attendees(email,displayName),conferenceData),"
+        "nextPageToken"
+    )
+
+    # Largest page size events().list() accepts
+    EVENTS_PAGE_SIZE = 2500
+
+    # Maximum number of sub-requests Google accepts in one batch request
+    BATCH_SIZE = 50
+
     def __init__(self, credentials: Credentials):
         """
         Initialize Google Calendar API client.
@@ -36,6 +92,23 @@ class GoogleCalendarAPI:
         """
         self.credentials = credentials
         self.service = build("calendar", "v3", credentials=credentials)
+        self._local = threading.local()
+
+    def _http(self) -> AuthorizedHttp:
+        """
+        Get the authorized HTTP transport for the current thread.
+
+        httplib2.Http is not thread-safe, so every thread issuing requests
+        (e.g. scheduler jobs) needs its own transport.
+
+        Returns:
+            AuthorizedHttp bound to this API's credentials
+        """
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._local.http = http
+        return http
 
     def list_calendars(self) -> List[Dict[str, Any]]:
         """
@@ -48,7 +121,11 @@ class GoogleCalendarAPI:
             HttpError: If API request fails
         """
         try:
-            calendar_list = self.service.calendarList().list().execute()
+            calendar_list = (
+                self.service.calendarList()
+                .list(fields=self.CALENDAR_LIST_FIELDS)
+                .execute()
+            )
             return calendar_list.get("items", [])
         except HttpError as error:
             raise error
@@ -77,25 +154,145 @@ class GoogleCalendarAPI:
         """
         try:
             # Format dates as RFC3339 timestamp
-            time_min = start_date.isoformat() + "Z"
-            time_max = end_date.isoformat() + "Z"
-
-            events_result = (
-                self.service.events()
-                .list(
-                    calendarId=calendar_id,
-                    timeMin=time_min,
-                    timeMax=time_max,
-                    singleEvents=single_events,
-                    orderBy="startTime" if single_events else None,
-                )
-                .execute()
-            )
+            time_min = _to_rfc3339(start_date)
+            time_max = _to_rfc3339(end_date)
+
+            http = self._http()
+            first_page = self._events_request(
+                calendar_id, time_min, time_max, single_events
+            ).execute(http=http)
 
-            return events_result.get("items", [])
+            return self._read_pages(
+                first_page, calendar_id, time_min, time_max, single_events, http
+            )
         except HttpError as error:
             raise error
 
+    def get_events_batch(
+        self,
+        calendar_ids: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        single_events: bool = True,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Get calendar events for several calendars using batch requests.
+
+        The first page of every calendar is requested through
+        BatchHttpRequest (up to BATCH_SIZE calendars per HTTP round-trip);
+        any further pages are then followed per calendar.
+
+        Args:
+            calendar_ids: Calendar IDs to fetch
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+            single_events: Expand recurring events into individual instances
+
+        Returns:
+            One event list per calendar, in the same order as calendar_ids
+
+        Raises:
+            HttpError: If any API request fails
+        """
+        # Formatted once and shared by every calendar's request
+        time_min = _to_rfc3339(start_date)
+        time_max = _to_rfc3339(end_date)
+
+        http = self._http()
+        responses: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, Exception] = {}
+
+        def on_response(
+            request_id: str, response: Dict[str, Any], exception: Optional[Exception]
+        ) -> None:
+            if exception is not None:
+                errors[request_id] = exception
+            else:
+                responses[request_id] = response
+
+        for offset in range(0, len(calendar_ids), self.BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=on_response)
+            chunk = calendar_ids[offset:offset + self.BATCH_SIZE]
+            for index, calendar_id in enumerate(chunk, offset):
+                batch.add(
+                    self._events_request(calendar_id, time_min, time_max, single_events),
+                    request_id=str(index),
+                )
+            batch.execute(http=http)
+
+        if errors:
+            # Surface the failure of the first calendar that failed
+            raise errors[min(errors, key=int)]
+
+        return [
+            self._read_pages(
+                responses[str(index)], calendar_id, time_min, time_max, single_events, http
+            )
+            for index, calendar_id in enumerate(calendar_ids)
+        ]
+
+    def _events_request(
+        self,
+        calendar_id: str,
+        time_min: str,
+        time_max: str,
+        single_events: bool,
+        page_token: Optional[str] = None,
+    ) -> HttpRequest:
+        """
+        Build an events().list() request for one page of a calendar.
+
+        Args:
+            calendar_id: Calendar ID
+            time_min: RFC3339 lower bound
+            time_max: RFC3339 upper bound
+            single_events: Expand recurring events into individual instances
+            page_token: nextPageToken of the previous page (None for the first page)
+
+        Returns:
+            Unexecuted HttpRequest
+        """
+        return self.service.events().list(
+            calendarId=calendar_id,
+            timeMin=time_min,
+            timeMax=time_max,
+            singleEvents=single_events,
+            orderBy="startTime" if single_events else None,
+            maxResults=self.EVENTS_PAGE_SIZE,
+            pageToken=page_token,
+            fields=self.EVENT_LIST_FIELDS,
+        )
+
+    def _read_pages(
+        self,
+        events_result: Dict[str, Any],
+        calendar_id: str,
+        time_min: str,
+        time_max: str,
+        single_events: bool,
+        http: AuthorizedHttp,
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect the items of a first page and every page after it.
+
+        Follows nextPageToken until every page has been read, so busy
+        calendars are not truncated at the first page.
+
+        Returns:
+            All event objects of the calendar
+        """
+        items: List[Dict[str, Any]] = list(events_result.get("items", []))
+
+        page_token = events_result.get("nextPageToken")
+        while page_token:
+            events_result = self._events_request(
+                calendar_id, time_min, time_max, single_events, page_token
+            ).execute(http=http)
+            items.extend(events_result.get("items", []))
+            page_token = events_result.get("nextPageToken")
+
+        return items
+
     def test_connection(self) -> bool:
         """
         Test API connection and authentication.
@@ -144,34 +341,49 @@ class CalendarFetcher(BaseFetcher):
 
     def _load_credentials(self) -> Optional[Credentials]:
         """
-        Load OAuth credentials from token storage.
+        Load OAuth credentials, preferring the process-wide cache.
+
+        Token storage is only read when no credentials are cached, and the
+        access token is only refreshed once it has expired.
 
         Returns:
             Credentials object or None if not available
         """
         try:
-            # Get stored token from PocketBase or token manager
-            # This is a placeholder - actual implementation would fetch from storage
-            token_data = self.token_manager.load_token(
-                "google_calendar", self.pb_client
-            )
-
-            if not token_data:
-                return None
-
-            creds = Credentials.from_authorized_user_info(token_data, self.SCOPES)
-
-            # Refresh token if expired
-            if creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-                # Save refreshed token
-                self.token_manager.save_token(
-                    "google_calendar",
-                    OAuthToken.from_credentials(creds),
-                    self.pb_client,
-                )
-
-            return creds
+            with _credentials_lock:
+                creds = _credentials_cache.get(CALENDAR_TOKEN_NAME)
+
+                if creds is None:
+                    # Get stored token from PocketBase or token manager
+                    # This is a placeholder - actual implementation would fetch from storage
+                    token_data = self.token_manager.load_token(
+                        CALENDAR_TOKEN_NAME, self.pb_client
+                    )
+
+                    if not token_data:
+                        return None
+
+                    creds = Credentials.from_authorized_user_info(
+                        token_data, GoogleCalendarAPI.SCOPES
+                    )
+
+                # Refresh token if expired
+                if creds.expired and creds.refresh_token:
+                    try:
+                        creds.refresh(Request())
+                    except Exception:
+                        # Revoked or otherwise unusable: reload from storage next time
+                        _credentials_cache.pop(CALENDAR_TOKEN_NAME, None)
+                        raise
+                    # Save refreshed token
+                    self.token_manager.save_token(
+                        CALENDAR_TOKEN_NAME,
+                        OAuthToken.from_credentials(creds),
+                        self.pb_client,
+                    )
+
+                _credentials_cache[CALENDAR_TOKEN_NAME] = creds
+                return creds
         except Exception:
             return None
 
@@ -196,17 +408,20 @@ class CalendarFetcher(BaseFetcher):
         if not self.api:
             self.api = GoogleCalendarAPI(self.credentials)
 
-        # Test API connection
+        # Test API connection; a failure may mean the cached credentials were
+        # revoked, so the next attempt reloads them from storage
         try:
             if not self.api.test_connection():
+                clear_credentials_cache()
                 return (False, "Failed to connect to Google Calendar API")
         except Exception as e:
+            clear_credentials_cache()
             return (False, f"Google Calendar API connection error: {str(e)}")
 
         return (True, None)
 
     def _should_include_event(
-        self, event: Dict[str, Any], user_email: str, monitored_emails: List[str]
+        self, event: Dict[str, Any], user_email: str, monitored_emails: AbstractSet[str]
     ) -> bool:
         """
         Determine if an event should be included based on filtering rules.
@@ -218,8 +433,8 @@ class CalendarFetcher(BaseFetcher):
 
         Args:
             event: Calendar event object
-            user_email: User's email address
-            monitored_emails: List of monitored email addresses
+            user_email: User's email address (lowercase)
+            monitored_emails: Set of monitored email addresses (lowercase)
 
         Returns:
             True if event should be included
@@ -228,23 +443,21 @@ class CalendarFetcher(BaseFetcher):
         organizer = event.get("organizer", {})
         organizer_email = organizer.get("email", "").lower()
 
-        # Get attendees
-        attendees = event.get("attendees", [])
-        attendee_emails = [a.get("email", "").lower() for a in attendees]
-
         # Rule 1: Event created by user
-        if organizer_email == user_email.lower():
+        if organizer_email == user_email:
             return True
 
+        # Get attendees
+        attendees = event.get("attendees", [])
+        attendee_emails = {a.get("email", "").lower() for a in attendees}
+
         # Rule 2: User invited by monitored email
-        if user_email.lower() in attendee_emails and any(
-            email.lower() in [organizer_email] for email in monitored_emails
-        ):
+        if user_email in attendee_emails and organizer_email in monitored_emails:
             return True
 
         # Rule 3: User invited monitored email
-        if organizer_email == user_email.lower() and any(
-            email.lower() in attendee_emails for email in monitored_emails
+        if organizer_email == user_email and not attendee_emails.isdisjoint(
+            monitored_emails
         ):
             return True
 
@@ -270,10 +483,8 @@ class CalendarFetcher(BaseFetcher):
         # Parse datetime (handle both dateTime and date fields)
         try:
             if "dateTime" in start:
-                start_time = datetime.fromisoformat(
-                    start["dateTime"].replace("Z", "+00:00")
-                )
-                end_time = datetime.fromisoformat(end["dateTime"].replace("Z", "+00:00"))
+                start_time = datetime.fromisoformat(start["dateTime"])
+                end_time = datetime.fromisoformat(end["dateTime"])
             elif "date" in start:
                 # All-day event - skip for now
                 return None
@@ -282,23 +493,29 @@ class CalendarFetcher(BaseFetcher):
         except (ValueError, KeyError):
             return None
 
-        # Calculate duration in minutes
-        duration = (end_time - start_time).total_seconds() / 60
+        # Calculate duration in whole seconds (integer math, no float division)
+        delta = end_time - start_time
+        seconds = delta.days * 86400 + delta.seconds
 
         # Skip very short events (< 5 minutes)
-        if duration < 5:
+        if seconds < 300:
             return None
 
+        duration = seconds // 60
+
         # Get event title
         title = event.get("summary", "Untitled Meeting")
 
-        # Get attendees for description
-        attendees = event.get("attendees", [])
-        attendee_names = [
-            a.get("displayName") or a.get("email", "").split("@")[0]
-            for a in attendees
-            if a.get("email") != calendar_email
-        ]
+        # Get attendee emails (for metadata) and names (for description) in one pass
+        attendee_emails = []
+        attendee_names = []
+        for attendee in event.get("attendees", ()):
+            email = attendee.get("email")
+            attendee_emails.append(email)
+            if email != calendar_email:
+                attendee_names.append(
+                    attendee.get("displayName") or (email or "").split("@", 1)[0]
+                )
 
         # Build description
         if attendee_names:
@@ -319,7 +536,7 @@ class CalendarFetcher(BaseFetcher):
             "event_id": event_id,
             "title": title,
             "organizer": event.get("organizer", {}).get("email"),
-            "attendees": [a.get("email") for a in attendees],
+            "attendees": attendee_emails,
             "location": event.get("location", ""),
             "conference_data": event.get("conferenceData", {}),
         }
@@ -332,6 +549,36 @@ class CalendarFetcher(BaseFetcher):
             "metadata": metadata,
         }
 
+    def _fetch_calendar_events(
+        self,
+        calendars: List[Dict[str, Any]],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Fetch events for all calendars, batching the requests.
+
+        Args:
+            calendars: Calendar objects from list_calendars()
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+
+        Returns:
+            One event list per calendar, in the same order as calendars
+
+        Raises:
+            HttpError: If any API request fails
+        """
+        if len(calendars) <= 1:
+            return [
+                self.api.get_events(calendar.get("id"), start_date, end_date)
+                for calendar in calendars
+            ]
+
+        return self.api.get_events_batch(
+            [calendar.get("id") for calendar in calendars], start_date, end_date
+        )
+
     def fetch(
         self,
         start_date: Optional[datetime] = None,
@@ -372,6 +619,7 @@ class CalendarFetcher(BaseFetcher):
                 ]
             else:
                 monitored_emails = []
+            monitored_set = frozenset(email.lower() for email in monitored_emails)
 
             # Get list of calendars
             calendars = self.api.list_calendars()
@@ -379,43 +627,38 @@ class CalendarFetcher(BaseFetcher):
             events_fetched = 0
             events_created = 0
 
+            # User email of the first primary calendar (shared by non-primary calendars)
+            primary_email = next(
+                (cal.get("id") for cal in calendars if cal.get("primary")), None
+            )
+
+            # Fetch events from all calendars in batched requests;
+            # results come back in calendar order
+            calendar_events = self._fetch_calendar_events(calendars, start_date, end_date)
+
             # Process each calendar
-            for calendar in calendars:
-                calendar_id = calendar.get("id")
+            for calendar, events in zip(calendars, calendar_events):
                 calendar_email = calendar.get("id")  # Calendar ID is usually the email
 
-                # Fetch events from this calendar
-                events = self.api.get_events(calendar_id, start_date, end_date)
-
-                # Get user email (primary calendar)
-                user_email = calendar_email if calendar.get("primary") else None
-                if not user_email:
-                    # Try to get from first primary calendar
-                    for cal in calendars:
-                        if cal.get("primary"):
-                            user_email = cal.get("id")
-                            break
+                # Get user email (this calendar if primary, else the first primary calendar)
+                user_email = calendar_email if calendar.get("primary") else primary_email
+                user_email_lc = (user_email or calendar_email).lower()
 
                 # Process each event
+                calendar_event_data = []
                 for event in events:
                     # Apply filtering rules
-                    if not self._should_include_event(
-                        event, user_email or calendar_email, monitored_emails
-                    ):
+                    if not self._should_include_event(event, user_email_lc, monitored_set):
                         continue
 
                     event_data = self._process_event(event, calendar_email)
 
-                    if not event_data:
-                        continue
-
-                    events_fetched += 1
+                    if event_data:
+                        calendar_event_data.append(event_data)
 
-                    # Check if event already exists
-                    source_id = event_data["source_id"]
-                    if not self.event_exists(source_id):
-                        self.create_raw_event(**event_data)
-                        events_created += 1
+                # Save events that do not exist yet (one lookup per calendar)
+                events_fetched += len(calendar_event_data)
+                events_created += self.save_new_raw_events(calendar_event_data)
 
             result = FetchResult(
                 success=True,
@@ -433,6 +676,9 @@ class CalendarFetcher(BaseFetcher):
             return result
 
         except HttpError as e:
+            if e.resp.status == 401:
+                # Credentials were revoked: reload them on the next fetch
+                clear_credentials_cache()
             error_msg = f"Google Calendar API HTTP error: {e.resp.status}"
             return FetchResult(success=False, error=error_msg)
 
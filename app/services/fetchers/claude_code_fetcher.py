@@ -6,10 +6,11 @@ Fetches Claude Code AI assistant usage from claude_time_tracking collection.
 
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import Iterator, Dict, Any, Optional
 
 from app.services.fetchers.base import BaseFetcher, FetchResult
 from app.pocketbase_client import PocketBaseClient
+from app.utils.priority import SOURCE_CLOUD_EVENTS
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +22,15 @@ class ClaudeCodeFetcher(BaseFetcher):
     Converts tracking records to raw_events with smart description generation.
     """
 
+    # claude_time_tracking columns used to build raw events
+    TRACKING_FIELDS = (
+        "id,session_id,tool_name,description,started_at,completed_at,"
+        "duration,status,topic,project"
+    )
+
+    # Number of processed records saved per create_or_update_raw_events() call
+    WRITE_BATCH_SIZE = 50
+
     def __init__(self, pb_client: PocketBaseClient):
         """
         Initialize Claude Code fetcher.
@@ -28,8 +38,11 @@ class ClaudeCodeFetcher(BaseFetcher):
         Args:
             pb_client: PocketBase client instance
         """
-        super().__init__(pb_client)
-        self.source_name = "cloud_events"
+        super().__init__(
+            pb_client=pb_client,
+            source_name=SOURCE_CLOUD_EVENTS,
+            enabled_setting_key="cloud_events_enabled",
+        )
 
     def validate(self) -> bool:
         """
@@ -71,25 +84,31 @@ class ClaudeCodeFetcher(BaseFetcher):
         )
 
         try:
-            # Fetch tracking records
-            tracking_records = self._fetch_tracking_records(start_date, end_date)
-
-            # Process and create raw events
+            # Stream tracking records page by page and process them as they arrive
+            events_fetched = 0
             events_created = 0
-            for record in tracking_records:
+            pending = []
+            for record in self._iter_tracking_records(start_date, end_date):
+                events_fetched += 1
                 event_data = self._process_tracking_record(record)
                 if event_data:
-                    created = self.create_or_update_raw_event(**event_data)
-                    if created:
-                        events_created += 1
+                    pending.append(event_data)
+
+                # Save in batches: one existence lookup and concurrent writes per batch
+                if len(pending) >= self.WRITE_BATCH_SIZE:
+                    events_created += self.create_or_update_raw_events(pending)
+                    pending = []
+
+            if pending:
+                events_created += self.create_or_update_raw_events(pending)
 
             logger.info(
-                f"Claude Code fetch complete: {len(tracking_records)} fetched, {events_created} created"
+                f"Claude Code fetch complete: {events_fetched} fetched, {events_created} created"
             )
 
             return FetchResult(
                 success=True,
-                events_fetched=len(tracking_records),
+                events_fetched=events_fetched,
                 events_created=events_created,
             )
 
@@ -97,39 +116,37 @@ class ClaudeCodeFetcher(BaseFetcher):
             logger.error(f"Claude Code fetch failed: {str(e)}", exc_info=True)
             return FetchResult(success=False, error=str(e))
 
-    def _fetch_tracking_records(
+    def _iter_tracking_records(
         self, start_date: datetime, end_date: datetime
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Fetch tracking records from claude_time_tracking collection.
+        Stream tracking records from claude_time_tracking collection.
+
+        Records are requested page by page, so only about one page is held
+        in memory at a time.
 
         Args:
             start_date: Start date
             end_date: End date
 
-        Returns:
-            List of tracking records as dicts
+        Yields:
+            Tracking records as dicts, oldest first
         """
         # Build filter for date range
         filter_str = f'started_at>="{start_date.isoformat()}" && started_at<="{end_date.isoformat()}"'
 
-        # Fetch records
-        records = self.pb_client.get_full_list(
-            "claude_time_tracking", filter=filter_str, sort="+started_at"
+        # Fetch records (only the columns _process_tracking_record reads)
+        records = self.pb_client.iter_full_list(
+            "claude_time_tracking",
+            filter=filter_str,
+            sort="+started_at",
+            fields=self.TRACKING_FIELDS,
         )
 
-        # Convert Record objects to dicts
-        records_list = []
+        # Convert Record objects to dicts; Record keeps no private attributes,
+        # so a shallow copy of the instance dict is enough
         for record in records:
-            if hasattr(record, "__dict__"):
-                record_dict = {
-                    k: v for k, v in record.__dict__.items() if not k.startswith("_")
-                }
-            else:
-                record_dict = dict(record)
-            records_list.append(record_dict)
-
-        return records_list
+            yield dict(vars(record)) if hasattr(record, "__dict__") else dict(record)
 
     def _process_tracking_record(
         self, record: Dict[str, Any]
@@ -157,7 +174,7 @@ class ClaudeCodeFetcher(BaseFetcher):
         # Parse timestamps
         if isinstance(started_at, str):
             try:
-                started_at = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
+                started_at = datetime.fromisoformat(started_at)
             except (ValueError, AttributeError):
                 logger.warning(f"Invalid started_at timestamp: {started_at}")
                 return None
@@ -168,9 +185,7 @@ class ClaudeCodeFetcher(BaseFetcher):
         if completed_at:
             if isinstance(completed_at, str):
                 try:
-                    completed_at = datetime.fromisoformat(
-                        completed_at.replace("Z", "+00:00")
-                    )
+                    completed_at = datetime.fromisoformat(completed_at)
                 except (ValueError, AttributeError):
                     completed_at = None
 
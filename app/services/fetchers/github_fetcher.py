@@ -6,6 +6,7 @@ Tracks development activity and issue work.
 """
 
 import os
+import re
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from github import Github, GithubException, RateLimitExceededException
@@ -294,7 +295,6 @@ class GitHubFetcher(BaseFetcher):
         Returns:
             List of issue numbers
         """
-        import re
         # Match #123 pattern
         pattern = r'#(\d+)'
         matches = re.findall(pattern, text)
@@ -485,15 +485,15 @@ class GitHubFetcher(BaseFetcher):
                             author=self.username,
                         )
 
+                        commit_events = []
                         for commit in commits:
                             event_data = self._process_commit(commit, repo_name)
                             if event_data:
-                                events_fetched += 1
+                                commit_events.append(event_data)
 
-                                # Check if event already exists
-                                if not self.event_exists(event_data["source_id"]):
-                                    self.create_raw_event(**event_data)
-                                    events_created += 1
+                        # Save commits that do not exist yet
+                        events_fetched += len(commit_events)
+                        events_created += self.save_new_raw_events(commit_events)
 
                     # Fetch assigned issues
                     if track_issues and self.username:
@@ -504,6 +504,7 @@ class GitHubFetcher(BaseFetcher):
                             state='all',
                         )
 
+                        issue_events = []
                         for issue in issues:
                             # Filter by date range
                             if issue.updated_at < start_date or issue.updated_at > end_date:
@@ -511,12 +512,11 @@ class GitHubFetcher(BaseFetcher):
 
                             event_data = self._process_issue(issue, repo_name)
                             if event_data:
-                                events_fetched += 1
+                                issue_events.append(event_data)
 
-                                # Check if event already exists
-                                if not self.event_exists(event_data["source_id"]):
-                                    self.create_raw_event(**event_data)
-                                    events_created += 1
+                        # Save issues that do not exist yet
+                        events_fetched += len(issue_events)
+                        events_created += self.save_new_raw_events(issue_events)
 
                 except RateLimitExceededException as e:
                     # Rate limit should stop the entire fetch
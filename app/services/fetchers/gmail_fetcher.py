@@ -6,6 +6,7 @@ Tracks emails sent to monitored recipients.
 """
 
 import os
+import re
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from google.oauth2.credentials import Credentials
@@ -354,8 +355,6 @@ class GmailFetcher(BaseFetcher):
         Returns:
             List of email addresses
         """
-        import re
-
         # Extract email addresses using regex
         email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
         emails = re.findall(email_pattern, to_field)
@@ -425,8 +424,8 @@ class GmailFetcher(BaseFetcher):
             messages = self.api.list_sent_messages(after_date=start_date)
 
             events_fetched = 0
-            events_created = 0
             events_filtered = 0
+            message_events = []
 
             for message in messages:
                 # Parse headers
@@ -468,10 +467,6 @@ class GmailFetcher(BaseFetcher):
                 message_id = message.get("id")
                 source_id = f"gmail_{self.account_email}_{message_id}"
 
-                # Check if already exists
-                if self.event_exists(source_id):
-                    continue
-
                 # Create metadata
                 metadata = {
                     "account": self.account_email,
@@ -481,16 +476,16 @@ class GmailFetcher(BaseFetcher):
                     "thread_id": message.get("threadId"),
                 }
 
-                # Create raw event
-                self.create_raw_event(
-                    source_id=source_id,
-                    timestamp=message_date,
-                    duration_minutes=default_duration,
-                    description=description,
-                    metadata=metadata,
-                )
+                message_events.append({
+                    "source_id": source_id,
+                    "timestamp": message_date,
+                    "duration_minutes": default_duration,
+                    "description": description,
+                    "metadata": metadata,
+                })
 
-                events_created += 1
+            # Create raw events for messages that do not exist yet
+            events_created = self.save_new_raw_events(message_events)
 
             result = FetchResult(
                 success=True,
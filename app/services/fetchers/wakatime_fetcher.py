@@ -184,21 +184,14 @@ class WakaTimeFetcher(BaseFetcher):
             # Fetch summaries from WakaTime
             summaries_data = self.api.get_summaries(start_date, end_date)
 
-            events_fetched = 0
-            events_created = 0
-
             # Process each day's summary
+            all_events = []
             for day_summary in summaries_data.get("data", []):
-                day_events = self._process_day_summary(day_summary)
-                events_fetched += len(day_events)
-
-                # Save events to PocketBase
-                for event_data in day_events:
-                    # Check if event already exists
-                    source_id = event_data["source_id"]
-                    if not self.event_exists(source_id):
-                        self.create_raw_event(**event_data)
-                        events_created += 1
+                all_events.extend(self._process_day_summary(day_summary))
+            events_fetched = len(all_events)
+
+            # Save events that do not exist yet to PocketBase
+            events_created = self.save_new_raw_events(all_events)
 
             result = FetchResult(
                 success=True,
@@ -7,7 +7,7 @@ Automates data fetching and processing with APScheduler.
 import asyncio
 import logging
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any
 from threading import Lock
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -69,16 +69,24 @@ class SchedulerService:
     - Monday at work_week_start_time: Process previous week with fill-up
     """
 
-    def __init__(self, pb_client: PocketBaseClient, config: Config):
+    def __init__(
+        self,
+        pb_client: PocketBaseClient,
+        config: Config,
+        on_job_complete: Optional[Callable[[], None]] = None,
+    ):
         """
         Initialize scheduler service.
 
         Args:
             pb_client: PocketBase client instance
             config: Application configuration
+            on_job_complete: Called after each scheduled job has run (e.g. to
+                drop cached API responses the job may have made stale)
         """
         self.pb_client = pb_client
         self.config = config
+        self.on_job_complete = on_job_complete
         self.scheduler = AsyncIOScheduler()
         self.job_lock = JobLock()
         self._running = False
@@ -192,6 +200,7 @@ class SchedulerService:
             self._log_job_error(job_log, str(e))
         finally:
             self.job_lock.release(job_name)
+            self._notify_job_complete(job_name)
 
     async def _monday_fillup_job(self):
         """
@@ -246,6 +255,7 @@ class SchedulerService:
             self._log_job_error(job_log, str(e))
         finally:
             self.job_lock.release(job_name)
+            self._notify_job_complete(job_name)
 
     async def _fetch_all_sources(self) -> Dict[str, Any]:
         """
@@ -256,8 +266,11 @@ class SchedulerService:
         """
         results = {}
 
+        # Read the settings snapshot once for all source checks
+        settings = self.config.settings
+
         # WakaTime
-        if self.config.settings.wakatime.wakatime_enabled:
+        if settings.wakatime.wakatime_enabled:
             try:
                 fetcher = WakaTimeFetcher(self.pb_client)
                 result = fetcher.fetch()
@@ -275,7 +288,7 @@ class SchedulerService:
                 logger.error(f"WakaTime fetch failed: {str(e)}")
 
         # Google Calendar
-        if self.config.settings.calendar.calendar_enabled:
+        if settings.calendar.calendar_enabled:
             try:
                 fetcher = CalendarFetcher(self.pb_client)
                 result = fetcher.fetch()
@@ -293,7 +306,7 @@ class SchedulerService:
                 logger.error(f"Calendar fetch failed: {str(e)}")
 
         # Claude Code (Cloud Events)
-        if self.config.settings.cloud_events.cloud_events_enabled:
+        if settings.cloud_events.cloud_events_enabled:
             try:
                 fetcher = ClaudeCodeFetcher(self.pb_client)
                 result = fetcher.fetch()
@@ -315,6 +328,15 @@ class SchedulerService:
 
         return results
 
+    def _notify_job_complete(self, job_name: str):
+        """Run the on_job_complete callback; its errors never fail the job"""
+        if self.on_job_complete is None:
+            return
+        try:
+            self.on_job_complete()
+        except Exception as e:
+            logger.warning(f"on_job_complete callback failed after {job_name}: {str(e)}")
+
     def _log_job_start(self, job_name: str) -> Optional[str]:
         """
         Log job start to PocketBase.
@@ -131,9 +131,7 @@ class TimeBlockProcessor:
             if isinstance(timestamp, str):
                 try:
                     if "T" in timestamp:
-                        timestamp = datetime.fromisoformat(
-                            timestamp.replace("Z", "+00:00")
-                        )
+                        timestamp = datetime.fromisoformat(timestamp)
                     else:
                         timestamp = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
                 except (ValueError, AttributeError):
@@ -469,22 +467,21 @@ class TimeBlockProcessor:
         Returns:
             Number of blocks saved
         """
-        saved_count = 0
-
-        for block in time_blocks:
-            # Create time block record
-            self.pb_client.create_time_block(
-                week_start=week_start,
-                block_start=block.start,
-                block_end=block.end,
-                source=block.source,
-                description=block.description,
-                duration_hours=(block.end - block.start).total_seconds() / 3600,
-                metadata=block.metadata,
-            )
-            saved_count += 1
-
-        return saved_count
+        # Create all records in one concurrent batch instead of one round-trip each
+        rows = [
+            {
+                "block_start": block.start,
+                "block_end": block.end,
+                "source": block.source,
+                "description": block.description,
+                "duration_hours": (block.end - block.start).total_seconds() / 3600,
+                "metadata": block.metadata,
+            }
+            for block in time_blocks
+        ]
+        self.pb_client.create_time_blocks(week_start, rows)
+
+        return len(rows)
 
     def update_week_summary(
         self,
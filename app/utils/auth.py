@@ -8,6 +8,7 @@ from typing import Optional
 from fastapi import HTTPException, Cookie, Response
 from pocketbase import PocketBase
 from pocketbase.client import ClientResponseError
+from pocketbase.utils import is_token_expired
 import os
 
 
@@ -16,6 +17,20 @@ class PocketBaseAuth:
 
     def __init__(self):
         self.pb_url = os.getenv("POCKETBASE_URL", "http://127.0.0.1:8090")
+        # One SDK client (and HTTP connection pool) shared by all requests instead
+        # of a new client, TLS context and TCP connection per call. Its auth store
+        # is never written: user calls go through send() with the token passed
+        # explicitly, so concurrent requests cannot see each other's auth.
+        self._pb = PocketBase(self.pb_url)
+
+    @staticmethod
+    def _user_data(record: dict) -> dict:
+        """Pick the user fields exposed to the app from an auth response record."""
+        return {
+            'id': record['id'],
+            'email': record['email'],
+            'name': record.get('name', record['email']),
+        }
 
     def authenticate(self, email: str, password: str) -> tuple[str, dict]:
         """
@@ -32,14 +47,12 @@ class PocketBaseAuth:
             HTTPException: If authentication fails
         """
         try:
-            pb = PocketBase(self.pb_url)
-            auth_data = pb.collection('users').auth_with_password(email, password)
+            auth_data = self._pb.send(
+                "/api/collections/users/auth-with-password",
+                {"method": "POST", "body": {"identity": email, "password": password}},
+            )
 
-            return auth_data.token, {
-                'id': auth_data.record.id,
-                'email': auth_data.record.email,
-                'name': getattr(auth_data.record, 'name', email),
-            }
+            return auth_data['token'], self._user_data(auth_data['record'])
 
         except ClientResponseError as e:
             raise HTTPException(
@@ -72,18 +85,14 @@ class PocketBaseAuth:
             )
 
         try:
-            pb = PocketBase(self.pb_url)
-            pb.auth_store.save(token, None)
-
             # Verify token by fetching user data
-            if pb.auth_store.is_valid:
+            if not is_token_expired(token):
                 # Get current user
-                user = pb.collection('users').auth_refresh()
-                return {
-                    'id': user.record.id,
-                    'email': user.record.email,
-                    'name': getattr(user.record, 'name', user.record.email),
-                }
+                user = self._pb.send(
+                    "/api/collections/users/auth-refresh",
+                    {"method": "POST", "headers": {"Authorization": token}},
+                )
+                return self._user_data(user['record'])
             else:
                 raise HTTPException(status_code=401, detail="Invalid token")
 
@@ -520,7 +520,7 @@ def render_raw_events_table(records: List[Dict[str, Any]]) -> str:
 
         # Format timestamp
         try:
-            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            dt = datetime.fromisoformat(timestamp)
             timestamp_str = dt.strftime("%Y-%m-%d %H:%M")
         except:
             timestamp_str = timestamp
@@ -554,13 +554,13 @@ def render_time_blocks_table(records: List[Dict[str, Any]]) -> str:
 
         # Format dates
         try:
-            ws = datetime.fromisoformat(week_start.replace("Z", "+00:00"))
+            ws = datetime.fromisoformat(week_start)
             week_str = ws.strftime("%Y-%m-%d")
         except:
             week_str = week_start
 
         try:
-            bs = datetime.fromisoformat(block_start.replace("Z", "+00:00"))
+            bs = datetime.fromisoformat(block_start)
             block_str = bs.strftime("%Y-%m-%d %H:%M")
         except:
             block_str = block_start
@@ -8,6 +8,7 @@ import os
 import json
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
+from urllib.parse import urlencode
 from cryptography.fernet import Fernet
 
 
@@ -362,8 +363,6 @@ def build_google_auth_url(
     Returns:
         Authorization URL
     """
-    from urllib.parse import urlencode
-
     base_url = "https://accounts.google.com/o/oauth2/v2/auth"
     params = {
         "client_id": client_id,
@@ -4,7 +4,9 @@ Time Utilities
 Provides utilities for time calculations, week boundaries, and 30-minute block rounding.
 """
 
-from datetime import datetime, timedelta
+import math
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Tuple
 from enum import Enum
 
@@ -181,8 +183,6 @@ def round_to_half_hour(minutes: float, mode: RoundingMode = RoundingMode.UP) ->
 
     if mode == RoundingMode.UP:
         # Always round up to next 0.5h
-        import math
-
         return math.ceil(hours * 2) / 2
     else:  # NEAREST
         # Round to nearest 0.5h
@@ -340,6 +340,32 @@ def format_duration(hours: float) -> str:
     return f"{hours}h"
 
 
+@lru_cache(maxsize=1024)
+def format_iso_date_de(iso_date: str) -> str:
+    """
+    Format the date part of an ISO timestamp as DD.MM.YYYY.
+
+    Only the leading "YYYY-MM-DD" is used, so no datetime is built per call;
+    results are cached per day since exports repeat the same few dates.
+
+    Args:
+        iso_date: ISO date or timestamp string (e.g., "2026-01-07 10:00:00.000Z")
+
+    Returns:
+        Date string in DD.MM.YYYY format
+
+    Raises:
+        ValueError: If the string does not start with a valid ISO date
+
+    Examples:
+        >>> format_iso_date_de("2026-01-07 10:00:00.000Z")
+        '07.01.2026'
+    """
+    day = iso_date[:10]
+    date.fromisoformat(day)  # Validate (raises ValueError)
+    return f"{day[8:10]}.{day[5:7]}.{day[:4]}"
+
+
 def parse_time(time_str: str) -> Tuple[int, int]:
     """
     Parse time string in HH:MM format.
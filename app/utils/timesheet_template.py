@@ -8,6 +8,8 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any
 import calendar
 
+from app.utils.time_utils import format_iso_date_de
+
 
 def render_monthly_timesheet(year: int, month: int, time_blocks: List[Dict[str, Any]], total_hours: float) -> str:
     """
@@ -247,10 +249,9 @@ def render_monthly_timesheet(year: int, month: int, time_blocks: List[Dict[str,
             try:
                 block_start = block.get('block_start', '')
                 if isinstance(block_start, str):
-                    dt = datetime.fromisoformat(block_start.replace('Z', '+00:00'))
+                    date_str = format_iso_date_de(block_start)
                 else:
-                    dt = block_start
-                date_str = dt.strftime('%d.%m.%Y')
+                    date_str = block_start.strftime('%d.%m.%Y')
             except:
                 date_str = str(block.get('block_start', ''))[:10]
 
@@ -0,0 +1,49 @@
+/// <reference path="../pb_data/types.d.ts" />
+
+/**
+ * PocketBase Migration: Add Created Indexes
+ *
+ * Adds descending indexes on `created` for raw_events and time_blocks so the
+ * dashboard's "latest 10" lists (sort=-created) read the newest rows from the
+ * index instead of scanning and sorting the whole table.
+ */
+
+migrate((db) => {
+  const dao = new Dao(db)
+
+  const rawEvents = dao.findCollectionByNameOrId("raw_events")
+  rawEvents.indexes = [
+    "CREATE UNIQUE INDEX idx_raw_events_source_id ON raw_events(source, source_id)",
+    "CREATE INDEX idx_raw_events_timestamp ON raw_events(timestamp)",
+    "CREATE INDEX idx_raw_events_source ON raw_events(source)",
+    "CREATE INDEX idx_raw_events_created_desc ON raw_events(created DESC)"
+  ]
+  dao.saveCollection(rawEvents)
+
+  const timeBlocks = dao.findCollectionByNameOrId("time_blocks")
+  timeBlocks.indexes = [
+    "CREATE INDEX idx_time_blocks_week_start ON time_blocks(week_start)",
+    "CREATE INDEX idx_time_blocks_block_start ON time_blocks(block_start)",
+    "CREATE INDEX idx_time_blocks_source ON time_blocks(source)",
+    "CREATE INDEX idx_time_blocks_created_desc ON time_blocks(created DESC)"
+  ]
+  return dao.saveCollection(timeBlocks)
+}, (db) => {
+  const dao = new Dao(db)
+
+  const rawEvents = dao.findCollectionByNameOrId("raw_events")
+  rawEvents.indexes = [
+    "CREATE UNIQUE INDEX idx_raw_events_source_id ON raw_events(source, source_id)",
+    "CREATE INDEX idx_raw_events_timestamp ON raw_events(timestamp)",
+    "CREATE INDEX idx_raw_events_source ON raw_events(source)"
+  ]
+  dao.saveCollection(rawEvents)
+
+  const timeBlocks = dao.findCollectionByNameOrId("time_blocks")
+  timeBlocks.indexes = [
+    "CREATE INDEX idx_time_blocks_week_start ON time_blocks(week_start)",
+    "CREATE INDEX idx_time_blocks_block_start ON time_blocks(block_start)",
+    "CREATE INDEX idx_time_blocks_source ON time_blocks(source)"
+  ]
+  return dao.saveCollection(timeBlocks)
+})
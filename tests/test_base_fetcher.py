@@ -0,0 +1,96 @@
+"""
+Unit Tests for Base Fetcher
+
+Tests for the raw event lookup and save helpers shared by all fetchers.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+
+from app.services.fetchers.base import BaseFetcher, FetchResult
+from app.pocketbase_client import PocketBaseClient
+
+
+class StubFetcher(BaseFetcher):
+    """Minimal concrete fetcher"""
+
+    def fetch(self, start_date=None, end_date=None) -> FetchResult:
+        return FetchResult(success=True)
+
+
+class TestBaseFetcher:
+    """Test BaseFetcher helpers"""
+
+    @pytest.fixture
+    def mock_pb_client(self):
+        """Create mock PocketBase client"""
+        return Mock(spec=PocketBaseClient)
+
+    @pytest.fixture
+    def fetcher(self, mock_pb_client):
+        """Create stub fetcher for the calendar source"""
+        return StubFetcher(
+            mock_pb_client,
+            source_name="calendar",
+            enabled_setting_key="calendar_enabled",
+        )
+
+    def test_existing_source_ids_batches_lookups(self, fetcher, mock_pb_client):
+        """Test that existing source_ids are looked up in chunked queries"""
+        fetcher.EXISTS_BATCH_SIZE = 2
+        mock_pb_client.iter_full_list.side_effect = [
+            [Mock(source_id="calendar_a")],
+            [],
+        ]
+
+        existing = fetcher.existing_source_ids(
+            ["calendar_a", "calendar_b", "calendar_a", 'calendar_"c"']
+        )
+
+        assert existing == {"calendar_a"}
+        assert mock_pb_client.iter_full_list.call_count == 2
+        first_filter = mock_pb_client.iter_full_list.call_args_list[0][1]["filter"]
+        assert first_filter == (
+            'source="calendar" && (source_id="calendar_a" || source_id="calendar_b")'
+        )
+        second_filter = mock_pb_client.iter_full_list.call_args_list[1][1]["filter"]
+        assert 'source_id="calendar_\\"c\\""' in second_filter
+
+    def test_event_exists_escapes_trailing_backslash(self, fetcher, mock_pb_client):
+        """Test that a trailing backslash cannot escape the closing quote"""
+        fetcher.event_exists('calendar_a\\')
+
+        filter_str = mock_pb_client.exists.call_args[0][1]
+        assert filter_str == 'source="calendar" && source_id="calendar_a\\\\"'
+
+    def test_create_or_update_raw_events(self, fetcher, mock_pb_client):
+        """Test that known source_ids are updated and new ones created in bulk"""
+        mock_pb_client.iter_full_list.return_value = [
+            Mock(id="rec1", source_id="calendar_a")
+        ]
+        timestamp = datetime(2026, 1, 7, 10, 0)
+        events = [
+            {
+                "source_id": "calendar_a",
+                "timestamp": timestamp,
+                "duration_minutes": 30,
+                "description": "A",
+            },
+            {
+                "source_id": "calendar_b",
+                "timestamp": timestamp,
+                "duration_minutes": 60,
+                "description": "B",
+            },
+        ]
+
+        created = fetcher.create_or_update_raw_events(events)
+
+        assert created == 1
+        mock_pb_client.create_raw_events.assert_called_once_with("calendar", [events[1]])
+        mock_pb_client.update_raw_events.assert_called_once_with("calendar", {"rec1": events[0]})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
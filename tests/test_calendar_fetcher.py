@@ -5,10 +5,11 @@ Tests for Google Calendar API integration and event fetching.
 """
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, MagicMock, patch
 from googleapiclient.errors import HttpError
 
+from app.services.fetchers import calendar_fetcher
 from app.services.fetchers.calendar_fetcher import GoogleCalendarAPI, CalendarFetcher
 from app.services.fetchers.base import FetchResult
 from app.pocketbase_client import PocketBaseClient
@@ -115,6 +116,84 @@ class TestGoogleCalendarAPI:
         assert call_kwargs["calendarId"] == "user@example.com"
         assert call_kwargs["singleEvents"] is True
         assert call_kwargs["orderBy"] == "startTime"
+        assert call_kwargs["fields"] == GoogleCalendarAPI.EVENT_LIST_FIELDS
+
+    def test_get_events_timezone_aware_dates(self, api):
+        """Test aware datetimes are converted to UTC RFC3339 timestamps"""
+        mock_events = Mock()
+        mock_events.list.return_value.execute.return_value = {"items": []}
+        api.service.events.return_value = mock_events
+
+        cet = timezone(timedelta(hours=1))
+        start = datetime(2026, 1, 7, 10, 0, tzinfo=cet)
+        end = datetime(2026, 1, 8, 0, 0, tzinfo=timezone.utc)
+
+        api.get_events("user@example.com", start, end)
+
+        call_kwargs = mock_events.list.call_args[1]
+        assert call_kwargs["timeMin"] == "2026-01-07T09:00:00Z"
+        assert call_kwargs["timeMax"] == "2026-01-08T00:00:00Z"
+
+    def test_get_events_follows_page_tokens(self, api):
+        """Test get_events reads every page until nextPageToken is absent"""
+        pages = [
+            {"items": [{"id": "event1"}], "nextPageToken": "page2"},
+            {"items": [{"id": "event2"}]},
+        ]
+
+        mock_events = Mock()
+        mock_events.list.return_value.execute.side_effect = pages
+        api.service.events.return_value = mock_events
+
+        start = datetime(2026, 1, 7, 0, 0)
+        end = datetime(2026, 1, 8, 0, 0)
+
+        events = api.get_events("user@example.com", start, end)
+
+        assert [e["id"] for e in events] == ["event1", "event2"]
+        assert mock_events.list.call_count == 2
+        assert mock_events.list.call_args_list[0][1]["pageToken"] is None
+        assert mock_events.list.call_args_list[1][1]["pageToken"] == "page2"
+
+    def test_get_events_batch(self, api):
+        """Test get_events_batch returns one event list per calendar in order"""
+        batches = []
+
+        def new_batch(callback):
+            batch = Mock()
+            added = []
+            batch.add.side_effect = lambda request, request_id: added.append(request_id)
+            batch.execute.side_effect = lambda http: [
+                callback(request_id, {"items": [{"id": f"event{request_id}"}]}, None)
+                for request_id in reversed(added)
+            ]
+            batches.append(batch)
+            return batch
+
+        api.service.new_batch_http_request.side_effect = new_batch
+        api.BATCH_SIZE = 2
+
+        start = datetime(2026, 1, 7, 0, 0)
+        end = datetime(2026, 1, 8, 0, 0)
+
+        results = api.get_events_batch(["a", "b", "c"], start, end)
+
+        assert results == [[{"id": "event0"}], [{"id": "event1"}], [{"id": "event2"}]]
+        assert len(batches) == 2
+
+    def test_get_events_batch_http_error(self, api):
+        """Test get_events_batch raises the error of a failed sub-request"""
+        error = HttpError(Mock(status=404), b"Not Found")
+
+        def new_batch(callback):
+            batch = Mock()
+            batch.execute.side_effect = lambda http: callback("0", None, error)
+            return batch
+
+        api.service.new_batch_http_request.side_effect = new_batch
+
+        with pytest.raises(HttpError):
+            api.get_events_batch(["a"], datetime(2026, 1, 7), datetime(2026, 1, 8))
 
     def test_test_connection_success(self, api):
         """Test successful connection test"""
@@ -186,6 +265,59 @@ class TestCalendarFetcher:
         assert is_valid is False
         assert "credentials not found" in error.lower()
 
+    @patch("app.services.fetchers.calendar_fetcher.Credentials")
+    def test_load_credentials_cached_across_fetchers(
+        self, mock_credentials_cls, mock_pb_client
+    ):
+        """Test stored credentials are loaded once and reused while valid"""
+        creds = Mock(expired=False)
+        mock_credentials_cls.from_authorized_user_info.return_value = creds
+        mock_token_manager = Mock()
+        mock_token_manager.load_token.return_value = {"token": "abc"}
+
+        calendar_fetcher._credentials_cache.clear()
+        try:
+            first = CalendarFetcher(mock_pb_client, token_manager=mock_token_manager)
+            second = CalendarFetcher(mock_pb_client, token_manager=mock_token_manager)
+
+            assert first._load_credentials() is creds
+            assert second._load_credentials() is creds
+            assert mock_token_manager.load_token.call_count == 1
+            creds.refresh.assert_not_called()
+        finally:
+            calendar_fetcher._credentials_cache.clear()
+
+    @patch("app.services.fetchers.calendar_fetcher.Credentials")
+    def test_load_credentials_reloaded_after_invalidation(
+        self, mock_credentials_cls, mock_pb_client
+    ):
+        """Test cached credentials are dropped on a failed refresh and on clear"""
+        revoked = Mock(expired=False, refresh_token="refresh")
+        revoked.refresh.side_effect = Exception("invalid_grant")
+        valid = Mock(expired=False)
+        mock_credentials_cls.from_authorized_user_info.side_effect = [revoked, valid, valid]
+        mock_token_manager = Mock()
+        mock_token_manager.load_token.return_value = {"token": "abc"}
+
+        calendar_fetcher._credentials_cache.clear()
+        try:
+            fetcher = CalendarFetcher(mock_pb_client, token_manager=mock_token_manager)
+            assert fetcher._load_credentials() is revoked
+
+            # The cached access token expires and its refresh is rejected:
+            # the cache is dropped and storage is read again
+            revoked.expired = True
+            assert fetcher._load_credentials() is None
+            assert fetcher._load_credentials() is valid
+            assert mock_token_manager.load_token.call_count == 2
+
+            # Re-authorization drops the cached credentials
+            calendar_fetcher.clear_credentials_cache()
+            assert fetcher._load_credentials() is valid
+            assert mock_token_manager.load_token.call_count == 3
+        finally:
+            calendar_fetcher._credentials_cache.clear()
+
     @patch.object(GoogleCalendarAPI, "test_connection")
     def test_validate_configuration_success(self, mock_test, fetcher):
         """Test successful validation"""
@@ -213,7 +345,7 @@ class TestCalendarFetcher:
             "attendees": [{"email": "colleague@example.com"}],
         }
 
-        assert fetcher._should_include_event(event, "user@example.com", []) is True
+        assert fetcher._should_include_event(event, "user@example.com", frozenset()) is True
 
     def test_should_include_event_invited_by_monitored(self, fetcher):
         """Test filtering: user invited by monitored email"""
@@ -225,7 +357,7 @@ class TestCalendarFetcher:
             ],
         }
 
-        monitored = ["boss@example.com"]
+        monitored = frozenset({"boss@example.com"})
         assert (
             fetcher._should_include_event(event, "user@example.com", monitored) is True
         )
@@ -240,7 +372,7 @@ class TestCalendarFetcher:
             ],
         }
 
-        monitored = ["client@example.com"]
+        monitored = frozenset({"client@example.com"})
         assert (
             fetcher._should_include_event(event, "user@example.com", monitored) is True
         )
@@ -252,7 +384,7 @@ class TestCalendarFetcher:
             "attendees": [{"email": "user@example.com"}],
         }
 
-        monitored = ["client@example.com"]
+        monitored = frozenset({"client@example.com"})
         assert (
             fetcher._should_include_event(event, "user@example.com", monitored)
             is False
@@ -373,7 +505,7 @@ class TestCalendarFetcher:
     @patch.object(CalendarFetcher, "validate_configuration")
     @patch.object(GoogleCalendarAPI, "list_calendars")
     @patch.object(GoogleCalendarAPI, "get_events")
-    @patch.object(CalendarFetcher, "event_exists")
+    @patch.object(CalendarFetcher, "existing_source_ids")
     @patch.object(CalendarFetcher, "create_raw_event")
     def test_fetch_success(
         self,
@@ -411,7 +543,7 @@ class TestCalendarFetcher:
         mock_pb_client.get_setting.return_value = ""
 
         # Mock event doesn't exist
-        mock_exists.return_value = False
+        mock_exists.return_value = set()
 
         # Mock create event
         mock_create.return_value = Mock()
@@ -455,7 +587,7 @@ class TestCalendarFetcher:
     @patch.object(CalendarFetcher, "validate_configuration")
     @patch.object(GoogleCalendarAPI, "list_calendars")
     @patch.object(GoogleCalendarAPI, "get_events")
-    @patch.object(CalendarFetcher, "event_exists")
+    @patch.object(CalendarFetcher, "existing_source_ids")
     def test_fetch_skips_existing_events(
         self,
         mock_exists,
@@ -487,7 +619,7 @@ class TestCalendarFetcher:
         mock_pb_client.get_setting.return_value = ""
 
         # Event already exists
-        mock_exists.return_value = True
+        mock_exists.side_effect = set  # every looked-up source_id exists
 
         start = datetime(2026, 1, 7)
         end = datetime(2026, 1, 7)
@@ -498,6 +630,22 @@ class TestCalendarFetcher:
         assert result.events_fetched == 1
         assert result.events_created == 0  # Should be 0 since event exists
 
+    @patch.object(GoogleCalendarAPI, "get_events_batch")
+    def test_fetch_calendar_events_batches_calendars(self, mock_batch, fetcher):
+        """Test that several calendars are fetched with one batched call"""
+        mock_batch.return_value = [[{"id": "e1"}], [{"id": "e2"}]]
+
+        calendars = [{"id": "cal1@example.com"}, {"id": "cal2@example.com"}]
+        start = datetime(2026, 1, 7)
+        end = datetime(2026, 1, 8)
+
+        results = fetcher._fetch_calendar_events(calendars, start, end)
+
+        assert results == [[{"id": "e1"}], [{"id": "e2"}]]
+        mock_batch.assert_called_once_with(
+            ["cal1@example.com", "cal2@example.com"], start, end
+        )
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,137 @@
+"""
+Unit Tests for Claude Code Fetcher
+
+Tests for streaming claude_time_tracking records into raw events.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, patch
+from pocketbase.models import Record
+
+from app.services.fetchers.claude_code_fetcher import ClaudeCodeFetcher
+from app.pocketbase_client import PocketBaseClient
+
+
+def make_tracking_record(session_id: str, minute: int = 0) -> dict:
+    """Build a claude_time_tracking record lasting five minutes"""
+    return {
+        "id": f"rec_{session_id}",
+        "session_id": session_id,
+        "tool_name": "Edit",
+        "description": "",
+        "started_at": f"2026-01-05T10:{minute:02d}:00",
+        "completed_at": None,
+        "duration": 300,
+        "status": "completed",
+        "topic": "Export cache",
+        "project": "timesheet",
+    }
+
+
+class TestClaudeCodeFetcher:
+    """Test Claude Code Fetcher"""
+
+    @pytest.fixture
+    def mock_pb_client(self):
+        """Create mock PocketBase client with no known raw events"""
+        pb = Mock(spec=PocketBaseClient)
+        pb.iter_full_list.return_value = []
+        return pb
+
+    @pytest.fixture
+    def fetcher(self, mock_pb_client):
+        """Create Claude Code fetcher"""
+        return ClaudeCodeFetcher(mock_pb_client)
+
+    def test_initialization(self, fetcher, mock_pb_client):
+        """Test fetcher initialization"""
+        assert fetcher.pb_client is mock_pb_client
+        assert fetcher.source_name == "cloud_events"
+        assert fetcher.enabled_setting_key == "cloud_events_enabled"
+
+    def test_iter_tracking_records_streams_projection(self, fetcher, mock_pb_client):
+        """Test tracking records are streamed with the column projection"""
+        mock_pb_client.iter_full_list.return_value = iter([
+            Record(make_tracking_record("s1")),
+            Record(make_tracking_record("s2")),
+        ])
+
+        records = fetcher._iter_tracking_records(
+            datetime(2026, 1, 1), datetime(2026, 1, 8)
+        )
+
+        assert [record["session_id"] for record in records] == ["s1", "s2"]
+        args, kwargs = mock_pb_client.iter_full_list.call_args
+        assert args == ("claude_time_tracking",)
+        assert kwargs["fields"] == ClaudeCodeFetcher.TRACKING_FIELDS
+        assert kwargs["sort"] == "+started_at"
+
+    def test_fetch_saves_in_write_batches(self, fetcher):
+        """Test processed records are flushed every WRITE_BATCH_SIZE records"""
+        records = [make_tracking_record(f"s{i}", i) for i in range(5)]
+        batches = []
+
+        def save(events):
+            batches.append([event["source_id"] for event in events])
+            return len(events)
+
+        with patch.object(ClaudeCodeFetcher, "WRITE_BATCH_SIZE", 2), \
+                patch.object(fetcher, "_iter_tracking_records", return_value=iter(records)), \
+                patch.object(fetcher, "create_or_update_raw_events", side_effect=save):
+            result = fetcher.fetch(datetime(2026, 1, 1), datetime(2026, 1, 8))
+
+        assert result.success is True
+        assert result.events_fetched == 5
+        assert result.events_created == 5
+        assert batches == [["s0", "s1"], ["s2", "s3"], ["s4"]]
+
+    def test_fetch_skips_short_records_in_batches(self, fetcher):
+        """Test records under a minute are counted as fetched but not saved"""
+        short = make_tracking_record("short")
+        short["duration"] = 30
+        records = [make_tracking_record("s1"), short, make_tracking_record("s2")]
+
+        with patch.object(fetcher, "_iter_tracking_records", return_value=iter(records)), \
+                patch.object(fetcher, "create_or_update_raw_events", return_value=2) as save:
+            result = fetcher.fetch(datetime(2026, 1, 1), datetime(2026, 1, 8))
+
+        assert result.events_fetched == 3
+        save.assert_called_once()
+        assert [event["source_id"] for event in save.call_args[0][0]] == ["s1", "s2"]
+
+    def test_fetch_creates_new_and_updates_known_events(self, fetcher, mock_pb_client):
+        """Test known session IDs overwrite their raw event, new ones are created"""
+        records = [make_tracking_record("known"), make_tracking_record("new", 10)]
+        mock_pb_client.iter_full_list.return_value = [
+            Record({"id": "raw1", "source_id": "known"})
+        ]
+
+        with patch.object(fetcher, "_iter_tracking_records", return_value=iter(records)):
+            result = fetcher.fetch(datetime(2026, 1, 1), datetime(2026, 1, 8))
+
+        assert result.events_fetched == 2
+        assert result.events_created == 1
+
+        source, created = mock_pb_client.create_raw_events.call_args[0]
+        assert source == "cloud_events"
+        assert [event["source_id"] for event in created] == ["new"]
+
+        source, updated = mock_pb_client.update_raw_events.call_args[0]
+        assert source == "cloud_events"
+        assert list(updated) == ["raw1"]
+        assert updated["raw1"]["description"] == "Claude Code: timesheet - Export cache"
+
+    def test_fetch_failure_returns_error(self, fetcher):
+        """Test a failing tracking query is reported in the result"""
+        with patch.object(
+            fetcher, "_iter_tracking_records", side_effect=RuntimeError("unreachable")
+        ):
+            result = fetcher.fetch(datetime(2026, 1, 1), datetime(2026, 1, 8))
+
+        assert result.success is False
+        assert result.error == "unreachable"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,117 @@
+"""
+Unit Tests for the Monthly Exporter
+
+Tests for the fingerprint-keyed export file cache.
+"""
+
+import os
+import time
+import pytest
+from unittest.mock import Mock
+from pocketbase.models import Record
+from app.services.exporters import MonthlyExporter
+
+
+def make_blocks(count: int):
+    """Build time block records for January 2026"""
+    return [
+        Record({
+            "id": f"block{i}",
+            "block_start": f"2026-01-{i % 28 + 1:02d} 10:00:00.000Z",
+            "duration_hours": 0.5,
+            "description": "Development",
+            "source": "wakatime",
+            "metadata": {},
+        })
+        for i in range(count)
+    ]
+
+
+class TestMonthlyExporterCache:
+    """Test get_or_build() file caching"""
+
+    @pytest.fixture
+    def mock_pb_client(self):
+        """Create mock PocketBase client with three blocks in the month"""
+        pb = Mock()
+        pb.COLLECTION_TIME_BLOCKS = "time_blocks"
+        pb.month_filter.return_value = 'block_start>="2026-01-01"'
+        pb.count_and_last_updated.return_value = (3, "2026-01-31 10:00:00.123Z")
+        pb.get_full_list.return_value = make_blocks(3)
+        return pb
+
+    @pytest.fixture
+    def exporter(self, mock_pb_client, tmp_path):
+        """Create exporter caching into a temporary directory"""
+        config = Mock()
+        config.export_cache_dir = str(tmp_path)
+        config.settings.export.export_title_name = "Koni"
+        return MonthlyExporter(mock_pb_client, config)
+
+    @pytest.mark.parametrize("fmt", ["html", "csv", "excel"])
+    def test_same_fingerprint_reuses_file(self, exporter, mock_pb_client, fmt):
+        """Test a second call with an unchanged month returns the cached file"""
+        path1, fingerprint1 = exporter.get_or_build(2026, 1, fmt)
+        path2, fingerprint2 = exporter.get_or_build(2026, 1, fmt)
+
+        assert path1 == path2
+        assert fingerprint1 == fingerprint2
+        assert path1.stat().st_size > 0
+        assert mock_pb_client.get_full_list.call_count == 1
+
+    def test_changed_marker_builds_new_file(self, exporter, mock_pb_client):
+        """Test a changed count/updated marker renders a new file"""
+        path1, fingerprint1 = exporter.get_or_build(2026, 1, "csv")
+
+        mock_pb_client.count_and_last_updated.return_value = (3, "2026-01-31 10:00:00.456Z")
+        path2, fingerprint2 = exporter.get_or_build(2026, 1, "csv")
+
+        assert fingerprint1 != fingerprint2
+        assert path1 != path2
+        assert path2.exists()
+        assert mock_pb_client.get_full_list.call_count == 2
+
+    @pytest.mark.parametrize("fmt", ["html", "csv", "excel"])
+    def test_empty_month_skips_block_query(self, exporter, mock_pb_client, fmt):
+        """Test an empty month is rendered without fetching its blocks"""
+        mock_pb_client.count_and_last_updated.return_value = (0, None)
+
+        path, _ = exporter.get_or_build(2026, 2, fmt)
+
+        assert path.exists()
+        mock_pb_client.get_full_list.assert_not_called()
+
+    def test_failed_render_leaves_no_temp_file(self, exporter, tmp_path):
+        """Test a render that raises leaves neither a temp nor a cached file"""
+        exporter.export_html = Mock(side_effect=RuntimeError("render failed"))
+
+        with pytest.raises(RuntimeError):
+            exporter.get_or_build(2026, 1, "html")
+
+        assert list(tmp_path.glob("*.tmp")) == []
+        assert list(tmp_path.glob("*.html")) == []
+
+    def test_sweep_keeps_superseded_render_until_ttl(self, exporter, mock_pb_client):
+        """Test a superseded render survives until its replacement is TTL old"""
+        ttl = exporter.STALE_RENDER_TTL_SECONDS
+        first, _ = exporter.get_or_build(2026, 1, "csv")
+        os.utime(first, (time.time() - 3 * ttl,) * 2)
+
+        # Replaced just now: the first render may still be served
+        mock_pb_client.count_and_last_updated.return_value = (4, "2026-01-31 11:00:00.000Z")
+        second, _ = exporter.get_or_build(2026, 1, "csv")
+        assert first.exists()
+        assert second.exists()
+
+        # Its replacement is now older than the TTL: the next sweep drops it
+        os.utime(second, (time.time() - 2 * ttl,) * 2)
+        mock_pb_client.count_and_last_updated.return_value = (5, "2026-01-31 12:00:00.000Z")
+        third, _ = exporter.get_or_build(2026, 1, "csv")
+
+        assert not first.exists()
+        assert second.exists()
+        assert third.exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
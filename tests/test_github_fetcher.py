@@ -405,7 +405,7 @@ class TestGitHubFetcher:
 
         fetcher.api.get_user_issues.return_value = [mock_issue]
 
-        fetcher.event_exists = Mock(return_value=False)
+        fetcher.existing_source_ids = Mock(return_value=set())
         fetcher.create_raw_event = Mock()
         fetcher.get_default_date_range = Mock(return_value=(
             datetime(2024, 1, 1),
@@ -445,7 +445,7 @@ class TestGitHubFetcher:
         # Also mock get_user_issues even though it shouldn't be called
         fetcher.api.get_user_issues.return_value = []
 
-        fetcher.event_exists = Mock(return_value=False)
+        fetcher.existing_source_ids = Mock(return_value=set())
         fetcher.create_raw_event = Mock()
         fetcher.get_default_date_range = Mock(return_value=(
             datetime(2024, 1, 1),
@@ -531,7 +531,7 @@ class TestGitHubFetcher:
         # Also mock get_user_issues
         fetcher.api.get_user_issues.return_value = []
 
-        fetcher.event_exists = Mock(return_value=True)  # Event already exists
+        fetcher.existing_source_ids = Mock(side_effect=set)  # Event already exists
         fetcher.create_raw_event = Mock()
         fetcher.get_default_date_range = Mock(return_value=(
             datetime(2024, 1, 1),
@@ -362,7 +362,7 @@ class TestGmailFetcher:
         ]
 
         fetcher.api.list_sent_messages.return_value = mock_messages
-        fetcher.event_exists = Mock(return_value=False)
+        fetcher.existing_source_ids = Mock(return_value=set())
         fetcher.create_raw_event = Mock()
         fetcher.get_default_date_range = Mock(return_value=(
             datetime(2024, 1, 1),
@@ -420,7 +420,7 @@ class TestGmailFetcher:
         ]
 
         fetcher.api.list_sent_messages.return_value = mock_messages
-        fetcher.event_exists = Mock(return_value=False)
+        fetcher.existing_source_ids = Mock(return_value=set())
         fetcher.create_raw_event = Mock()
         fetcher.get_default_date_range = Mock(return_value=(
             datetime(2024, 1, 1),
@@ -462,7 +462,7 @@ class TestGmailFetcher:
         ]
 
         fetcher.api.list_sent_messages.return_value = mock_messages
-        fetcher.event_exists = Mock(return_value=True)  # Event already exists
+        fetcher.existing_source_ids = Mock(side_effect=set)  # Event already exists
         fetcher.create_raw_event = Mock()
         fetcher.get_default_date_range = Mock(return_value=(
             datetime(2024, 1, 1),
@@ -0,0 +1,111 @@
+"""
+Unit Tests for API Endpoints
+
+Tests for the FastAPI routes in app.main.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from fastapi.testclient import TestClient
+from pocketbase.models import Record
+
+from app import main
+from app.pocketbase_client import PocketBaseClient
+
+
+def make_block(week_start: str, source: str, hours: float) -> Record:
+    """Build a time block record"""
+    return Record({
+        "id": f"{week_start}-{source}-{hours}",
+        "week_start": week_start,
+        "block_start": f"{week_start} 10:00:00.000Z",
+        "source": source,
+        "description": "Development",
+        "duration_hours": hours,
+        "metadata": {},
+    })
+
+
+class TestMonthDashboard:
+    """Test /dashboard/{year}/{month}"""
+
+    @pytest.fixture
+    def mock_pb_client(self):
+        """Create mock PocketBase client with three blocks in two weeks"""
+        pb = Mock(spec=PocketBaseClient)
+        pb.COLLECTION_TIME_BLOCKS = "time_blocks"
+        pb.month_filter.return_value = 'block_start >= "2026-01-01"'
+        pb.count_and_last_updated.return_value = (3, "2026-01-31 10:00:00.123Z")
+        pb.get_full_list.return_value = [
+            make_block("2026-01-05", "wakatime", 1.5),
+            make_block("2026-01-05", "calendar", 0.5),
+            make_block("2026-01-12", "wakatime", 2.0),
+        ]
+        return pb
+
+    @pytest.fixture
+    def client(self, mock_pb_client):
+        """Create test client using the mock PocketBase client"""
+        main.app.dependency_overrides[main.get_pb_client] = lambda: mock_pb_client
+        main._month_dashboard_cache.clear()
+        yield TestClient(main.app)
+        main.app.dependency_overrides.clear()
+        main._month_dashboard_cache.clear()
+
+    def test_month_summary(self, client):
+        """Test month totals and per-week summaries"""
+        response = client.get("/dashboard/2026/1")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["year"] == 2026
+        assert data["month"] == 1
+        assert data["total_hours"] == 4.0
+        assert data["count"] == 3
+        assert data["sources"] == {"wakatime": 3.5, "calendar": 0.5}
+        assert [week["week_start"] for week in data["weeks"]] == ["2026-01-05", "2026-01-12"]
+        assert data["weeks"][0]["total_hours"] == 2.0
+        assert data["weeks"][0]["count"] == 2
+
+    def test_invalid_month(self, client, mock_pb_client):
+        """Test month outside 1-12 is rejected"""
+        response = client.get("/dashboard/2026/13")
+
+        assert response.status_code == 400
+        mock_pb_client.get_full_list.assert_not_called()
+
+    def test_unchanged_month_served_from_cache(self, client, mock_pb_client):
+        """Test an unchanged change marker skips the block query"""
+        first = client.get("/dashboard/2026/1").json()
+        second = client.get("/dashboard/2026/1").json()
+
+        assert first == second
+        assert mock_pb_client.count_and_last_updated.call_count == 2
+        assert mock_pb_client.get_full_list.call_count == 1
+
+    def test_changed_month_recomputed(self, client, mock_pb_client):
+        """Test a changed change marker rebuilds the summary"""
+        client.get("/dashboard/2026/1")
+
+        mock_pb_client.count_and_last_updated.return_value = (1, "2026-01-31 11:00:00.000Z")
+        mock_pb_client.get_full_list.return_value = [make_block("2026-01-19", "github", 1.0)]
+        data = client.get("/dashboard/2026/1").json()
+
+        assert data["total_hours"] == 1.0
+        assert mock_pb_client.get_full_list.call_count == 2
+
+    def test_cache_evicts_least_recently_used_month(self, client, mock_pb_client):
+        """Test a recently viewed month survives eviction of older entries"""
+        with patch.object(main, "MONTH_DASHBOARD_CACHE_MONTHS", 2):
+            client.get("/dashboard/2026/1")
+            client.get("/dashboard/2026/2")
+            # Viewing January again makes February the least recently used
+            client.get("/dashboard/2026/1")
+            client.get("/dashboard/2026/3")
+
+        assert set(main._month_dashboard_cache) == {(2026, 1), (2026, 3)}
+        assert mock_pb_client.get_full_list.call_count == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,391 @@
+"""
+Unit Tests for the PocketBase Client Wrapper
+
+Tests for the lazily authenticating admin SDK client and the client wrapper.
+"""
+
+import threading
+import time
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, patch
+from pocketbase import PocketBase
+from pocketbase.client import ClientResponseError
+from app.pocketbase_client import PocketBaseClient, _LazyAdminPocketBase
+
+
+class TestLazyAdminPocketBase:
+    """Test on-demand admin login and 401 retry"""
+
+    @pytest.fixture
+    def logins(self):
+        """Record of login calls"""
+        return []
+
+    @pytest.fixture
+    def client(self, logins):
+        """Create client whose login stores a new token per call"""
+        holder = {}
+
+        def login():
+            logins.append(threading.get_ident())
+            holder["client"].auth_store.save(f"token{len(logins)}", None)
+
+        holder["client"] = _LazyAdminPocketBase("http://127.0.0.1:8090", login)
+        return holder["client"]
+
+    def test_login_deferred_until_first_request(self, client, logins):
+        """Test that the admin login runs on the first request, not at construction"""
+        assert logins == []
+
+        with patch.object(PocketBase, "send", return_value={"ok": True}) as mock_send:
+            assert client.send("/api/collections/settings/records", {}) == {"ok": True}
+            client.send("/api/collections/settings/records", {})
+
+        assert len(logins) == 1
+        assert client.auth_store.token == "token1"
+        assert mock_send.call_count == 2
+
+    def test_health_check_skips_login(self, client, logins):
+        """Test that the public health endpoint never triggers a login"""
+        with patch.object(PocketBase, "send", return_value={"code": 200}):
+            client.send("/api/health", {})
+
+        assert logins == []
+
+    def test_concurrent_first_requests_login_once(self, client, logins):
+        """Test that threads hitting an unauthenticated client share one login"""
+        original_login = client._login
+
+        def slow_login():
+            time.sleep(0.05)
+            original_login()
+
+        client._login = slow_login
+        start = threading.Barrier(8)
+
+        def request():
+            start.wait()
+            client.send("/api/collections/settings/records", {})
+
+        with patch.object(PocketBase, "send", return_value={}):
+            threads = [threading.Thread(target=request) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(logins) == 1
+
+    def test_401_relogs_in_and_retries(self, client, logins):
+        """Test that an expired token triggers one re-login and a retry"""
+        client.auth_store.save("expired", None)
+        responses = [ClientResponseError(status=401), {"ok": True}]
+
+        def send(path, req_config):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        with patch.object(PocketBase, "send", side_effect=send) as mock_send:
+            assert client.send("/api/collections/settings/records", {}) == {"ok": True}
+
+        assert len(logins) == 1
+        assert client.auth_store.token == "token1"
+        assert mock_send.call_count == 2
+
+    def test_401_keeps_token_refreshed_by_another_thread(self, client, logins):
+        """Test that a 401 for an old token does not clear a newer one"""
+        client.auth_store.save("expired", None)
+        calls = []
+
+        def send(path, req_config):
+            calls.append(client.auth_store.token)
+            if len(calls) == 1:
+                # Another thread signs in while this request is in flight
+                client.auth_store.save("fresh", None)
+                raise ClientResponseError(status=401)
+            return {"ok": True}
+
+        with patch.object(PocketBase, "send", side_effect=send):
+            assert client.send("/api/collections/settings/records", {}) == {"ok": True}
+
+        assert logins == []
+        assert calls == ["expired", "fresh"]
+
+    def test_other_errors_are_not_retried(self, client, logins):
+        """Test that non-401 errors propagate without a re-login"""
+        client.auth_store.save("valid", None)
+
+        with patch.object(
+            PocketBase, "send", side_effect=ClientResponseError(status=404)
+        ) as mock_send:
+            with pytest.raises(ClientResponseError):
+                client.send("/api/collections/settings/records", {})
+
+        assert logins == []
+        assert mock_send.call_count == 1
+
+
+class TestIterFullList:
+    """Test paged full-list iteration"""
+
+    @pytest.fixture
+    def pb_client(self):
+        """Create client wrapper with a mocked SDK client"""
+        pb_client = PocketBaseClient(url="http://127.0.0.1:8090", auto_auth=False)
+        pb_client.client = Mock()
+        return pb_client
+
+    @staticmethod
+    def serve_pages(pb_client, pages):
+        """Make the collection service return the given pages in order"""
+        service = pb_client.client.collection.return_value
+        service.get_list.side_effect = lambda page, per_page, params: Mock(
+            items=pages[page - 1]
+        )
+        return service
+
+    def test_passes_skip_total_and_fields(self, pb_client):
+        """Test pages are requested without a total count and with the projection"""
+        service = self.serve_pages(pb_client, [[1]])
+
+        list(pb_client.iter_full_list(
+            "time_blocks", filter='source="wakatime"', sort="+block_start", fields="id"
+        ))
+
+        pb_client.client.collection.assert_called_once_with("time_blocks")
+        service.get_list.assert_called_once_with(1, 500, {
+            "filter": 'source="wakatime"',
+            "sort": "+block_start",
+            "skipTotal": 1,
+            "fields": "id",
+        })
+
+    def test_omits_fields_when_not_given(self, pb_client):
+        """Test no projection is sent by default"""
+        service = self.serve_pages(pb_client, [[]])
+
+        assert list(pb_client.iter_full_list("time_blocks")) == []
+        assert "fields" not in service.get_list.call_args[0][2]
+
+    def test_next_page_requested_only_after_full_page(self, pb_client):
+        """Test pagination continues on full pages and stops after a short one"""
+        service = self.serve_pages(pb_client, [[1, 2], [3, 4], [5]])
+
+        items = list(pb_client.iter_full_list("time_blocks", per_page=2))
+
+        assert items == [1, 2, 3, 4, 5]
+        assert [c[0][0] for c in service.get_list.call_args_list] == [1, 2, 3]
+
+    def test_short_first_page_stops(self, pb_client):
+        """Test a short first page is the only request"""
+        service = self.serve_pages(pb_client, [[1], [2]])
+
+        assert list(pb_client.iter_full_list("time_blocks", per_page=2)) == [1]
+        assert service.get_list.call_count == 1
+
+    def test_exact_multiple_ends_on_empty_page(self, pb_client):
+        """Test a full last page costs one extra, empty request"""
+        service = self.serve_pages(pb_client, [[1, 2], []])
+
+        assert list(pb_client.iter_full_list("time_blocks", per_page=2)) == [1, 2]
+        assert service.get_list.call_count == 2
+
+    def test_get_full_list_concatenates_pages(self, pb_client):
+        """Test get_full_list returns exactly the records of all pages"""
+        pages = [list(range(500)), list(range(500, 1000)), [1000, 1001]]
+        self.serve_pages(pb_client, pages)
+
+        assert pb_client.get_full_list("time_blocks") == list(range(1002))
+
+
+class TestUpdateSetting:
+    """Test setting updates through the cached key -> ID index"""
+
+    @pytest.fixture
+    def pb_client(self):
+        """Create client wrapper with two stored settings"""
+        pb_client = PocketBaseClient(url="http://127.0.0.1:8090", auto_auth=False)
+        pb_client.client = Mock()
+        pb_client.get_full_list = Mock(return_value=[
+            Mock(key="work_start", id="id_start"),
+            Mock(key="work_end", id="id_end"),
+        ])
+        pb_client.get_first_list_item = Mock()
+        pb_client.update = Mock(side_effect=lambda collection, record_id, data: record_id)
+        return pb_client
+
+    def test_first_update_loads_index(self, pb_client):
+        """Test the first update loads every setting ID with one list request"""
+        assert pb_client.update_setting("work_end", 18) == "id_end"
+
+        pb_client.get_full_list.assert_called_once_with("settings")
+        pb_client.get_first_list_item.assert_not_called()
+        pb_client.update.assert_called_once_with("settings", "id_end", {"value": "18"})
+
+    def test_later_updates_skip_lookup(self, pb_client):
+        """Test later updates reuse the index and cost only the PATCH"""
+        pb_client.update_setting("work_end", 18)
+        pb_client.update_setting("work_start", 8)
+        pb_client.update_setting("work_end", 17)
+
+        assert pb_client.get_full_list.call_count == 1
+        pb_client.get_first_list_item.assert_not_called()
+        assert pb_client.update.call_count == 3
+
+    def test_unknown_key_looked_up_once(self, pb_client):
+        """Test a key missing from the index is looked up and then remembered"""
+        pb_client.get_first_list_item.return_value = Mock(id="id_new")
+
+        pb_client.update_setting("new_key", "x")
+        pb_client.update_setting("new_key", "y")
+
+        pb_client.get_first_list_item.assert_called_once()
+        assert pb_client.update.call_args[0][1] == "id_new"
+
+    def test_stale_id_refreshes_index_and_retries_once(self, pb_client):
+        """Test a 404 on a stale ID reloads the index and retries exactly once"""
+        pb_client.update_setting("work_end", 18)
+        pb_client.get_full_list.return_value = [Mock(key="work_end", id="id_recreated")]
+
+        def update(collection, record_id, data):
+            if record_id == "id_end":
+                raise ClientResponseError(status=404)
+            return record_id
+
+        pb_client.update.side_effect = update
+
+        assert pb_client.update_setting("work_end", 17) == "id_recreated"
+        assert pb_client.get_full_list.call_count == 2
+        assert [c[0][1] for c in pb_client.update.call_args_list] == [
+            "id_end", "id_end", "id_recreated"
+        ]
+
+    def test_persistent_404_is_raised_after_one_retry(self, pb_client):
+        """Test a second 404 is raised instead of retrying again"""
+        pb_client.update.side_effect = ClientResponseError(status=404)
+
+        with pytest.raises(ClientResponseError):
+            pb_client.update_setting("work_end", 17)
+
+        assert pb_client.update.call_count == 2
+        assert pb_client.get_full_list.call_count == 2
+
+    def test_other_errors_do_not_refresh_index(self, pb_client):
+        """Test non-404 errors propagate without reloading the index"""
+        pb_client.update.side_effect = ClientResponseError(status=400)
+
+        with pytest.raises(ClientResponseError):
+            pb_client.update_setting("work_end", "invalid")
+
+        assert pb_client.update.call_count == 1
+        assert pb_client.get_full_list.call_count == 1
+
+
+class TestBulkWrites:
+    """Test concurrent bulk create/update helpers"""
+
+    @pytest.fixture
+    def pb_client(self):
+        """Create client wrapper with a mocked SDK client"""
+        pb_client = PocketBaseClient(url="http://127.0.0.1:8090", auto_auth=False)
+        pb_client.client = Mock()
+        return pb_client
+
+    def test_bulk_create_keeps_row_order(self, pb_client):
+        """Test created records come back in row order despite out-of-order completion"""
+        def create(collection, data):
+            # Earlier rows finish last
+            time.sleep(0.01 * (5 - data["n"]))
+            return {"id": f"id{data['n']}"}
+
+        with patch.object(pb_client, "create", side_effect=create):
+            records = pb_client.bulk_create("raw_events", [{"n": n} for n in range(5)])
+
+        assert records == [{"id": f"id{n}"} for n in range(5)]
+
+    def test_bulk_create_raises_first_failure(self, pb_client):
+        """Test a failed create is raised to the caller"""
+        def create(collection, data):
+            if data["n"] == 2:
+                raise ClientResponseError(status=400)
+            return {"id": f"id{data['n']}"}
+
+        with patch.object(pb_client, "create", side_effect=create):
+            with pytest.raises(ClientResponseError) as exc_info:
+                pb_client.bulk_create("raw_events", [{"n": n} for n in range(4)])
+
+        assert exc_info.value.status == 400
+
+    def test_bulk_update_keeps_update_order(self, pb_client):
+        """Test updated records come back in the order of the updates dict"""
+        def update(collection, record_id, data):
+            time.sleep(0.01 * (5 - data["n"]))
+            return record_id
+
+        updates = {f"id{n}": {"n": n} for n in range(5)}
+        with patch.object(pb_client, "update", side_effect=update):
+            records = pb_client.bulk_update("raw_events", updates)
+
+        assert records == list(updates)
+
+    def test_bulk_update_raises_failure(self, pb_client):
+        """Test a failed update is raised to the caller"""
+        with patch.object(
+            pb_client, "update", side_effect=ClientResponseError(status=404)
+        ):
+            with pytest.raises(ClientResponseError):
+                pb_client.bulk_update("raw_events", {"id1": {}, "id2": {}})
+
+    def test_create_raw_events_builds_payloads(self, pb_client):
+        """Test raw event kwargs are turned into record payloads for the source"""
+        events = [
+            {
+                "source_id": f"s{n}",
+                "timestamp": datetime(2026, 1, 5, 10, n),
+                "duration_minutes": 5,
+                "description": "Claude Code: timesheet",
+            }
+            for n in range(3)
+        ]
+
+        with patch.object(pb_client, "bulk_create", return_value=["r0", "r1", "r2"]) as bulk:
+            assert pb_client.create_raw_events("cloud_events", events) == ["r0", "r1", "r2"]
+
+        collection, rows = bulk.call_args[0]
+        assert collection == "raw_events"
+        assert [row["source_id"] for row in rows] == ["s0", "s1", "s2"]
+        assert rows[0] == {
+            "source": "cloud_events",
+            "source_id": "s0",
+            "timestamp": "2026-01-05T10:00:00",
+            "duration_minutes": 5,
+            "description": "Claude Code: timesheet",
+            "metadata": {},
+        }
+
+    def test_update_raw_events_keys_payloads_by_record_id(self, pb_client):
+        """Test raw event updates are sent for the given record IDs"""
+        event = {
+            "source_id": "s1",
+            "timestamp": datetime(2026, 1, 5, 10, 0),
+            "duration_minutes": 7,
+            "description": "Claude Code: timesheet",
+            "metadata": {"status": "completed"},
+        }
+
+        with patch.object(pb_client, "bulk_update", return_value=["r1"]) as bulk:
+            assert pb_client.update_raw_events("cloud_events", {"raw1": event}) == ["r1"]
+
+        collection, updates = bulk.call_args[0]
+        assert collection == "raw_events"
+        assert list(updates) == ["raw1"]
+        assert updates["raw1"]["source"] == "cloud_events"
+        assert updates["raw1"]["duration_minutes"] == 7
+        assert updates["raw1"]["metadata"] == {"status": "completed"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
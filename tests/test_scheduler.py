@@ -232,6 +232,46 @@ class TestSchedulerService:
         # Verify processor was called
         mock_processor.process_week.assert_called_once()
 
+    @pytest.mark.asyncio
+    @patch("app.services.scheduler.TimeBlockProcessor")
+    async def test_job_complete_callback(self, mock_processor_class, mock_pb_client, mock_config):
+        """Test on_job_complete runs after a scheduled job, even a failed one"""
+        on_job_complete = Mock()
+        scheduler = SchedulerService(mock_pb_client, mock_config, on_job_complete)
+        mock_processor_class.return_value.process_week.side_effect = Exception("boom")
+
+        await scheduler._monday_fillup_job()
+
+        on_job_complete.assert_called_once_with()
+        assert scheduler.job_lock.acquire("monday_fillup") is True
+
+    @pytest.mark.asyncio
+    @patch("app.services.scheduler.TimeBlockProcessor")
+    async def test_job_complete_callback_error_ignored(
+        self, mock_processor_class, mock_pb_client, mock_config
+    ):
+        """Test a failing on_job_complete callback does not break the job"""
+        on_job_complete = Mock(side_effect=RuntimeError("callback failed"))
+        scheduler = SchedulerService(mock_pb_client, mock_config, on_job_complete)
+        mock_processor_class.return_value.process_week.return_value = Mock(
+            success=True, week_start=None, week_end=None
+        )
+
+        await scheduler._monday_fillup_job()
+
+        on_job_complete.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_skipped_job_does_not_call_callback(self, mock_pb_client, mock_config):
+        """Test a job skipped by the overlap lock does not run on_job_complete"""
+        on_job_complete = Mock()
+        scheduler = SchedulerService(mock_pb_client, mock_config, on_job_complete)
+        scheduler.job_lock.acquire("fetch_and_process")
+
+        await scheduler._fetch_and_process_job()
+
+        on_job_complete.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_job_overlap_prevention(self, scheduler):
         """Test that overlapping jobs are prevented"""
@@ -52,7 +52,7 @@ class TestCoreSettings:
         """Test invalid time format raises error"""
         with pytest.raises(ValidationError) as exc_info:
             CoreSettings(work_week_start_time="25:00")
-        assert "String should match pattern" in str(exc_info.value)
+        assert "expected 24-hour format HH:MM" in str(exc_info.value)
 
         with pytest.raises(ValidationError):
             CoreSettings(work_week_start_time="6:00 PM")
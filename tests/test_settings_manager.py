@@ -10,6 +10,7 @@ Run with: pytest tests/test_settings_manager.py -v
 import os
 import pytest
 from unittest.mock import Mock, MagicMock
+from pocketbase import PocketBase
 from app.config import SettingsManager, Config
 from app.models.settings import Settings
 
@@ -24,15 +25,30 @@ class MockRecord:
         self.id = f"record_{key}"
 
 
+def default_setting_records():
+    """Build one MockRecord per setting from the model defaults"""
+    records = []
+    for key, value in Settings().to_flat_dict().items():
+        if isinstance(value, bool):
+            records.append(MockRecord(key, str(value).lower(), "boolean"))
+        elif isinstance(value, (int, float)):
+            records.append(MockRecord(key, str(value), "number"))
+        else:
+            records.append(MockRecord(key, getattr(value, "value", value), "string"))
+    return records
+
+
 class TestSettingsManager:
     """Test SettingsManager functionality"""
 
     @pytest.fixture
     def mock_pb_client(self):
         """Create mock PocketBase client"""
-        pb = Mock()
+        pb = Mock(spec=PocketBase)
         collection = Mock()
         pb.collection.return_value = collection
+        # Change marker list request (raw JSON)
+        pb.send.return_value = {"totalItems": 0, "items": []}
         return pb, collection
 
     @pytest.fixture
@@ -50,6 +66,9 @@ class TestSettingsManager:
         """Test parsing number values"""
         assert settings_manager._parse_value("42", "number") == 42
         assert settings_manager._parse_value("3.14", "number") == 3.14
+        assert settings_manager._parse_value("-7", "number") == -7
+        assert isinstance(settings_manager._parse_value("-7", "number"), int)
+        assert settings_manager._parse_value("-0.5", "number") == -0.5
 
     def test_parse_value_boolean(self, settings_manager):
         """Test parsing boolean values"""
@@ -155,6 +174,7 @@ class TestSettingsManager:
             settings_manager.get_all()
 
         assert "Expected 31 settings" in str(exc_info.value)
+        assert "work_week_end_day" in str(exc_info.value)
 
     def test_get_single_setting(self, mock_pb_client, settings_manager):
         """Test getting a single setting"""
@@ -169,6 +189,16 @@ class TestSettingsManager:
         # Verify correct filter was used
         collection.get_first_list_item.assert_called_once_with('key="target_hours_per_week"')
 
+    def test_get_setting_escapes_key(self, mock_pb_client, settings_manager):
+        """Test double quotes in the key cannot break out of the filter string"""
+        pb, collection = mock_pb_client
+
+        collection.get_first_list_item.return_value = MockRecord('a" || key!="', "x", "string")
+
+        settings_manager.get('a" || key!="')
+
+        collection.get_first_list_item.assert_called_once_with('key="a\\" || key!=\\""')
+
     def test_get_nonexistent_setting(self, mock_pb_client, settings_manager):
         """Test getting non-existent setting raises KeyError"""
         pb, collection = mock_pb_client
@@ -210,27 +240,45 @@ class TestSettingsManager:
         """Test updating multiple settings"""
         pb, collection = mock_pb_client
 
-        def mock_get_first(filter_str):
-            key = filter_str.split('"')[1]
-            return MockRecord(key, "old_value", "string")
-
-        collection.get_first_list_item.side_effect = mock_get_first
+        collection.get_full_list.return_value = [
+            MockRecord("work_week_start_day", "monday", "string"),
+            MockRecord("default_location", "Remote", "string"),
+        ]
 
         # Update multiple
         settings_manager.update_many(
             {"work_week_start_day": "tuesday", "default_location": "Office"}
         )
 
+        # Record IDs resolved with a single list call, no per-key lookups
+        assert collection.get_full_list.call_count == 1
+        collection.get_first_list_item.assert_not_called()
+
         # Verify two updates
         assert collection.update.call_count == 2
+        collection.update.assert_any_call("record_default_location", {"value": "Office"})
+        assert settings_manager._cache is None
+
+    def test_update_many_unknown_key(self, mock_pb_client, settings_manager):
+        """Test update_many raises KeyError before writing anything"""
+        pb, collection = mock_pb_client
+
+        collection.get_full_list.return_value = [
+            MockRecord("default_location", "Remote", "string"),
+        ]
+
+        with pytest.raises(KeyError) as exc_info:
+            settings_manager.update_many({"default_location": "Office", "bogus": "x"})
+
+        assert "bogus" in str(exc_info.value)
+        collection.update.assert_not_called()
 
     def test_force_reload(self, mock_pb_client, settings_manager):
         """Test force reload bypasses cache"""
         pb, collection = mock_pb_client
 
         # Mock 31 settings
-        mock_records = [MockRecord(f"key_{i}", f"value_{i}", "string") for i in range(31)]
-        collection.get_full_list.return_value = mock_records
+        collection.get_full_list.return_value = default_setting_records()
 
         # First call
         try:
@@ -259,6 +307,60 @@ class TestSettingsManager:
         # Now two calls (cache bypassed)
         assert collection.get_full_list.call_count == 2
 
+    def test_cache_ttl_expiry(self, mock_pb_client, monkeypatch):
+        """Test cached settings are reloaded once the TTL has passed"""
+        pb, collection = mock_pb_client
+        settings_manager = SettingsManager(pb, cache_ttl=60)
+
+        collection.get_full_list.return_value = default_setting_records()
+
+        now = [1000.0]
+        monkeypatch.setattr("app.config.time.monotonic", lambda: now[0])
+
+        settings1 = settings_manager.get_all()
+        now[0] += 30
+        assert settings_manager.get_all() is settings1
+        assert collection.get_full_list.call_count == 1
+
+        # Past the TTL: reload from database
+        now[0] += 31
+        settings2 = settings_manager.get_all()
+        assert settings2 is not settings1
+        assert collection.get_full_list.call_count == 2
+
+    def test_cache_ttl_expiry_unchanged_collection(self, mock_pb_client, monkeypatch):
+        """Test an expired cache is kept when the collection has not changed"""
+        pb, collection = mock_pb_client
+        settings_manager = SettingsManager(pb, cache_ttl=60)
+
+        records = default_setting_records()
+        collection.get_full_list.return_value = records
+        pb.send.return_value = {
+            "totalItems": len(records),
+            "items": [{"updated": "2026-01-01 00:00:30.100Z"}],
+        }
+
+        now = [1000.0]
+        monkeypatch.setattr("app.config.time.monotonic", lambda: now[0])
+
+        settings1 = settings_manager.get_all()
+        assert pb.send.call_count == 1
+
+        # Past the TTL, but count and latest "updated" match: no full reload
+        now[0] += 61
+        assert settings_manager.get_all() is settings1
+        assert collection.get_full_list.call_count == 1
+        assert pb.send.call_count == 2
+
+        # A record was edited again within the same second: reload from database
+        pb.send.return_value = {
+            "totalItems": len(records),
+            "items": [{"updated": "2026-01-01 00:00:30.900Z"}],
+        }
+        now[0] += 61
+        assert settings_manager.get_all() is not settings1
+        assert collection.get_full_list.call_count == 2
+
     def test_clear_cache(self, mock_pb_client, settings_manager):
         """Test clearing cache"""
         pb, collection = mock_pb_client
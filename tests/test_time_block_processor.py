@@ -453,7 +453,12 @@ class TestTimeBlockProcessor:
         count = processor.save_time_blocks(blocks, week_start)
 
         assert count == 1
-        mock_pb_client.create_time_block.assert_called_once()
+        mock_pb_client.create_time_blocks.assert_called_once()
+        call_week_start, rows = mock_pb_client.create_time_blocks.call_args[0]
+        assert call_week_start == week_start
+        assert len(rows) == 1
+        assert rows[0]["source"] == "wakatime"
+        assert rows[0]["duration_hours"] == 2.0
 
     def test_update_week_summary(self, processor, mock_pb_client):
         """Test updating week summary"""
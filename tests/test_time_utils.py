@@ -18,6 +18,7 @@ from app.utils.time_utils import (
     align_to_block_boundary,
     get_week_range,
     format_duration,
+    format_iso_date_de,
     parse_time,
     calculate_weekly_hours,
     hours_to_blocks,
@@ -210,6 +211,18 @@ class TestUtilityFunctions:
         assert format_duration(2.5) == "2.5h"
         assert format_duration(40.0) == "40.0h"
 
+    def test_format_iso_date_de(self):
+        """Test formatting ISO timestamps as DD.MM.YYYY"""
+        assert format_iso_date_de("2026-01-07 10:00:00.000Z") == "07.01.2026"
+        assert format_iso_date_de("2026-12-31T23:30:00+05:00") == "31.12.2026"
+        assert format_iso_date_de("2026-02-03") == "03.02.2026"
+
+        with pytest.raises(ValueError):
+            format_iso_date_de("2026-13-01 10:00:00")  # Invalid month
+
+        with pytest.raises(ValueError):
+            format_iso_date_de("")
+
     def test_parse_time_valid(self):
         """Test parsing valid time strings"""
         assert parse_time("18:00") == (18, 0)
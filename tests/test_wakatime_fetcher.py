@@ -158,6 +158,23 @@ class TestWakaTimeFetcher:
         assert is_valid is False
         assert "Failed to connect" in error
 
+    def test_enabled_and_last_fetch_time_cached(self, fetcher, mock_pb_client):
+        """Test settings and last fetch lookups run once until invalidated"""
+        mock_pb_client.get_setting.return_value = True
+        mock_pb_client.get_list.return_value = [Mock(timestamp="2026-01-07T10:00:00Z")]
+
+        assert fetcher.is_enabled() is True
+        assert fetcher.is_enabled() is True
+        assert fetcher.get_last_fetch_time() == fetcher.get_last_fetch_time()
+        assert mock_pb_client.get_setting.call_count == 1
+        assert mock_pb_client.get_list.call_count == 1
+
+        fetcher.invalidate()
+        fetcher.is_enabled()
+        fetcher.get_last_fetch_time()
+        assert mock_pb_client.get_setting.call_count == 2
+        assert mock_pb_client.get_list.call_count == 2
+
     def test_process_day_summary_with_projects(self, fetcher):
         """Test processing day summary with projects"""
         day_summary = {
@@ -258,7 +275,7 @@ class TestWakaTimeFetcher:
     @patch.object(WakaTimeFetcher, "is_enabled")
     @patch.object(WakaTimeFetcher, "validate_configuration")
     @patch.object(WakaTimeAPI, "get_summaries")
-    @patch.object(WakaTimeFetcher, "event_exists")
+    @patch.object(WakaTimeFetcher, "existing_source_ids")
     @patch.object(WakaTimeFetcher, "create_raw_event")
     def test_fetch_success(
         self,
@@ -292,7 +309,7 @@ class TestWakaTimeFetcher:
         }
 
         # Mock event doesn't exist
-        mock_exists.return_value = False
+        mock_exists.return_value = set()
 
         # Mock create event
         mock_create.return_value = Mock()
@@ -353,7 +370,7 @@ class TestWakaTimeFetcher:
     @patch.object(WakaTimeFetcher, "is_enabled")
     @patch.object(WakaTimeFetcher, "validate_configuration")
     @patch.object(WakaTimeAPI, "get_summaries")
-    @patch.object(WakaTimeFetcher, "event_exists")
+    @patch.object(WakaTimeFetcher, "existing_source_ids")
     def test_fetch_skips_existing_events(
         self, mock_exists, mock_get_summaries, mock_validate, mock_enabled, fetcher
     ):
@@ -379,7 +396,7 @@ class TestWakaTimeFetcher:
         }
 
         # Event already exists
-        mock_exists.return_value = True
+        mock_exists.side_effect = set  # every looked-up source_id exists
 
         start = datetime(2026, 1, 7)
         end = datetime(2026, 1, 7)